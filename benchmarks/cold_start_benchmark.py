@@ -0,0 +1,76 @@
+"""Measure the cold start cost of dynamagic in fresh interpreters
+
+Reports the time to import dynamagic.dynamodb_client, to construct a DynamodbClient and
+the latency of the first fetch_item against a moto backed table, which includes creating
+the boto3 client and building the validation. moto imports boto3 itself so the boto3 import
+time shows up under import in a real lambda rather than first_call here. Run from the
+repository root with:
+
+    python -m benchmarks.cold_start_benchmark
+"""
+import json
+import statistics
+import subprocess
+import sys
+
+COLD_START_SCRIPT = """
+import json
+import time
+
+started = time.perf_counter()
+from dynamagic.dynamodb_client import DynamodbClient
+imported = time.perf_counter()
+dynamodb_client = DynamodbClient(
+    dynamodb_table="test_table",
+    table_schema={"key_name": "CustomerId", "key_type": str, "name": str},
+)
+constructed = time.perf_counter()
+
+from moto import mock_dynamodb2
+import boto3
+
+with mock_dynamodb2():
+    boto3.client("dynamodb", region_name="eu-west-2").create_table(
+        TableName="test_table",
+        AttributeDefinitions=[{"AttributeName": "CustomerId", "AttributeType": "S"}],
+        KeySchema=[{"AttributeName": "CustomerId", "KeyType": "HASH"}],
+        BillingMode="PAY_PER_REQUEST",
+    )
+    first_call_started = time.perf_counter()
+    dynamodb_client.fetch_item(key={"CustomerId": "1482328791"})
+    first_call = time.perf_counter()
+    dynamodb_client.fetch_item(key={"CustomerId": "1482328791"})
+    second_call = time.perf_counter()
+
+print(json.dumps({
+    "import": imported - started,
+    "construct": constructed - imported,
+    "first_call": first_call - first_call_started,
+    "second_call": second_call - first_call,
+}))
+"""
+
+
+def run_cold_start() -> dict:
+    result = subprocess.run(
+        [sys.executable, "-c", COLD_START_SCRIPT],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    return json.loads(result.stdout.strip().splitlines()[-1])
+
+
+def main(runs: int = 5) -> dict:
+    samples = [run_cold_start() for _ in range(runs)]
+    report = {
+        measurement: statistics.median(sample[measurement] for sample in samples)
+        for measurement in samples[0]
+    }
+    for measurement, seconds in report.items():
+        print(f"{measurement:<12} {seconds * 1000:8.2f} ms")
+    return report
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,20 @@
+"""Schemas and items of a chosen number of attributes shared by the benchmarks"""
+from typing import Union
+
+
+def generate_schema_template(attribute_count: int) -> dict:
+    schema_template = {"key_name": "CustomerId", "key_type": str}
+    schema_template.update(
+        {f"attribute{index}": str for index in range(attribute_count)}
+    )
+    return schema_template
+
+
+def generate_item(
+    attribute_count: int, customer_id: Union[str, int] = "1482328791"
+) -> dict:
+    dynamodb_item = {"CustomerId": customer_id}
+    dynamodb_item.update(
+        {f"attribute{index}": f"value {index}" for index in range(attribute_count)}
+    )
+    return dynamodb_item
@@ -0,0 +1,305 @@
+"""Benchmark the validation, conversion, expression and CRUD hot paths
+
+Every case reports operations per second, p50 and p99 latency and the memory allocated while
+it runs, measured with tracemalloc in a separate pass so the timings are not slowed down by it.
+CRUD cases run against an in-process moto table so the suite works offline. Run from the
+repository root with:
+
+    python -m benchmarks.suite --output results.json
+    python -m benchmarks.suite --quick --compare results.json
+"""
+from functools import partial
+from typing import Callable, Dict, List, Tuple
+import argparse
+import json
+import math
+import platform
+import sys
+import time
+import tracemalloc
+from benchmarks.items import generate_item, generate_schema_template
+
+ITEM_SIZES = (5, 40, 200)
+
+
+def percentile(sorted_latencies: List[float], percent: float) -> float:
+    return sorted_latencies[
+        min(len(sorted_latencies) - 1, math.ceil(len(sorted_latencies) * percent / 100) - 1)
+    ]
+
+
+def measure(operation: Callable[[], object], number: int, warmup: int = 10) -> dict:
+    """Time every call of the operation, then run it again under tracemalloc
+
+    Args:
+        operation (Callable[[], object]): The code to benchmark
+        number (int): Calls to time
+        warmup (int, optional): Untimed calls made first. Defaults to 10.
+
+    Returns:
+        dict: ops_per_sec, mean_us, p50_us, p99_us, the peak_bytes allocated over the tracemalloc pass
+        and the retained_bytes_per_call left allocated afterwards
+    """
+    for _ in range(warmup):
+        operation()
+    latencies = list()
+    clock = time.perf_counter
+    for _ in range(number):
+        started = clock()
+        operation()
+        latencies.append(clock() - started)
+    latencies.sort()
+    total = sum(latencies)
+
+    allocation_number = max(1, min(number, 100))
+    tracemalloc.start()
+    try:
+        if hasattr(tracemalloc, "reset_peak"):
+            tracemalloc.reset_peak()
+        else:
+            tracemalloc.stop()
+            tracemalloc.start()
+        baseline, _ = tracemalloc.get_traced_memory()
+        for _ in range(allocation_number):
+            operation()
+        current, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return {
+        "number": number,
+        "ops_per_sec": number / total if total else math.inf,
+        "mean_us": total / number * 1e6,
+        "p50_us": percentile(latencies, 50) * 1e6,
+        "p99_us": percentile(latencies, 99) * 1e6,
+        "peak_bytes": peak - baseline,
+        "retained_bytes_per_call": (current - baseline) / allocation_number,
+    }
+
+
+def validation_cases(number: int) -> Dict[str, Tuple[Callable[[], object], int]]:
+    from dynamagic.modules.validation import Validation
+
+    cases = dict()
+    for attribute_count in ITEM_SIZES:
+        validation = Validation(table_schema=generate_schema_template(attribute_count))
+        dynamodb_item = generate_item(attribute_count)
+        dynamodb_key = {"CustomerId": dynamodb_item["CustomerId"]}
+        db_item = validation.validate_item_to_db_format(dynamodb_item)
+        cases[f"validation.construct.{attribute_count}"] = (
+            lambda attribute_count=attribute_count: Validation(
+                table_schema=generate_schema_template(attribute_count)
+            ),
+            max(1, number // 10),
+        )
+        for validation_type in ("new_item", "update_item", "read_item", "delete_item"):
+            dynamodb_schema = validation.validation_schema(
+                validation_type=validation_type
+            )
+            unvalidated_item = (
+                dynamodb_key
+                if validation_type in ("read_item", "delete_item")
+                else dynamodb_item
+            )
+            cases[f"validate_data.{validation_type}.{attribute_count}"] = (
+                partial(
+                    validation.validate_item_data_entegrity,
+                    dynamodb_schema=dynamodb_schema,
+                    unvalidated_item=unvalidated_item,
+                ),
+                number,
+            )
+        cases[f"to_db_format.{attribute_count}"] = (
+            partial(validation.validate_item_to_db_format, dynamodb_item),
+            number,
+        )
+        cases[f"to_readable_format.{attribute_count}"] = (
+            partial(validation.validate_item_to_readable_format, db_item),
+            number,
+        )
+        cases[f"to_readable_format_bulk.{attribute_count}"] = (
+            partial(validation.validate_items_to_readable_format, [db_item] * 100),
+            max(1, number // 100),
+        )
+        projection = validation.projection(attributes=list(dynamodb_item)[:2])
+        cases[f"to_readable_format_projection.{attribute_count}"] = (
+            partial(
+                projection.codec.decode_items,
+                [projection.project(db_item)] * 100,
+            ),
+            max(1, number // 100),
+        )
+    return cases
+
+
+def expression_cases(number: int) -> Dict[str, Tuple[Callable[[], object], int]]:
+    from dynamagic.dynamodb_client import DynamodbClient
+
+    cases = dict()
+    for attribute_count in ITEM_SIZES:
+        dynamodb_client = DynamodbClient(
+            dynamodb_table="benchmark_table",
+            table_schema=generate_schema_template(attribute_count),
+        )
+        dynamodb_client.validation
+        new_attributes = generate_item(attribute_count)
+        new_attributes.pop("CustomerId")
+        cases[f"generate_expressions.{attribute_count}"] = (
+            partial(
+                dynamodb_client.generate_expressions,
+                confirmed_new_attributes=new_attributes,
+            ),
+            number,
+        )
+    return cases
+
+
+def run_crud_cases(number: int, attribute_count: int = 40) -> Dict[str, dict]:
+    import boto3
+    from moto import mock_dynamodb2
+    from dynamagic.dynamodb_client import DynamodbClient
+    from dynamagic.modules.client_registry import client_registry
+    from dynamagic.modules.item_cache import ItemCache
+
+    results = dict()
+    with mock_dynamodb2():
+        client_registry.clear()
+        boto3.client("dynamodb", region_name="eu-west-2").create_table(
+            TableName="benchmark_table",
+            AttributeDefinitions=[{"AttributeName": "CustomerId", "AttributeType": "S"}],
+            KeySchema=[{"AttributeName": "CustomerId", "KeyType": "HASH"}],
+            BillingMode="PAY_PER_REQUEST",
+        )
+        dynamodb_client = DynamodbClient(
+            dynamodb_table="benchmark_table",
+            table_schema=generate_schema_template(attribute_count),
+        )
+        cached_client = DynamodbClient(
+            dynamodb_table="benchmark_table",
+            table_schema=generate_schema_template(attribute_count),
+            item_cache=ItemCache(),
+        )
+        dynamodb_client.create_item(dynamodb_item=generate_item(attribute_count))
+        customer_ids = iter(range(10 ** 9))
+        created_ids = list()
+
+        def create_item() -> None:
+            customer_id = str(next(customer_ids))
+            created_ids.append(customer_id)
+            dynamodb_client.create_item(
+                dynamodb_item=generate_item(attribute_count, customer_id=customer_id)
+            )
+
+        def delete_item() -> None:
+            dynamodb_client.delete_item(key={"CustomerId": created_ids.pop()})
+
+        updated_values = iter(range(10 ** 9))
+        crud_cases = {
+            "crud.create_item": create_item,
+            "crud.fetch_item": lambda: dynamodb_client.fetch_item(
+                key={"CustomerId": "1482328791"}
+            ),
+            "crud.fetch_item_cached": lambda: cached_client.fetch_item(
+                key={"CustomerId": "1482328791"}
+            ),
+            "crud.update_item": lambda: dynamodb_client.update_item(
+                dynamodb_attributes={
+                    "CustomerId": "1482328791",
+                    "attribute0": f"updated {next(updated_values)}",
+                }
+            ),
+            "crud.fetch_items": lambda: dynamodb_client.fetch_items(max_items=100),
+            "crud.delete_item": delete_item,
+        }
+        for case, operation in crud_cases.items():
+            results[case] = measure(
+                operation, number=number, warmup=0 if case == "crud.delete_item" else 5
+            )
+        client_registry.clear()
+    return results
+
+
+def run(number: int = 2000, crud_number: int = 200, cases: str = None) -> dict:
+    """Run every benchmark and return the machine readable report
+
+    Args:
+        number (int, optional): Calls per in-memory case. Defaults to 2000.
+        crud_number (int, optional): Calls per case against the moto table. Defaults to 200.
+        cases (str, optional): Only run cases whose name starts with this prefix
+
+    Returns:
+        dict: metadata about the run and the measurements for every case
+    """
+    results = dict()
+    for case, (operation, case_number) in {
+        **validation_cases(number),
+        **expression_cases(number),
+    }.items():
+        if cases is None or case.startswith(cases):
+            results[case] = measure(operation, number=case_number)
+    if cases is None or cases.startswith("crud") or "crud".startswith(cases):
+        results.update(
+            {
+                case: result
+                for case, result in run_crud_cases(crud_number).items()
+                if cases is None or case.startswith(cases)
+            }
+        )
+    return {
+        "metadata": {
+            "python": platform.python_version(),
+            "implementation": platform.python_implementation(),
+            "platform": platform.platform(),
+            "timestamp": int(time.time()),
+            "number": number,
+            "crud_number": crud_number,
+        },
+        "results": results,
+    }
+
+
+def compare(report: dict, baseline: dict) -> List[str]:
+    """One line per case shared with the baseline, showing how the p50 and ops per second moved"""
+    comparison_lines = list()
+    for case, result in report["results"].items():
+        baseline_result = baseline["results"].get(case)
+        if baseline_result is None:
+            continue
+        comparison_lines.append(
+            f"{case:<40} p50 {baseline_result['p50_us']:10.2f} -> {result['p50_us']:10.2f} us"
+            f"  ops/sec {result['ops_per_sec'] / baseline_result['ops_per_sec']:6.2f}x"
+        )
+    return comparison_lines
+
+
+def main(arguments: List[str] = None) -> dict:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--output", help="Write the JSON report to this file")
+    parser.add_argument("--compare", help="A previous JSON report to compare against")
+    parser.add_argument("--cases", help="Only run cases whose name starts with this prefix")
+    parser.add_argument(
+        "--quick", action="store_true", help="Run a tenth of the iterations"
+    )
+    options = parser.parse_args(arguments)
+    number, crud_number = (200, 20) if options.quick else (2000, 200)
+    report = run(number=number, crud_number=crud_number, cases=options.cases)
+    for case, result in report["results"].items():
+        print(
+            f"{case:<40} {result['ops_per_sec']:12.1f} ops/sec"
+            f"  p50 {result['p50_us']:10.2f} us  p99 {result['p99_us']:10.2f} us"
+            f"  peak {result['peak_bytes']:9d} B",
+            file=sys.stderr,
+        )
+    if options.compare:
+        with open(options.compare) as baseline_file:
+            for comparison_line in compare(report, json.load(baseline_file)):
+                print(comparison_line, file=sys.stderr)
+    if options.output:
+        with open(options.output, "w") as output_file:
+            json.dump(report, output_file, indent=2, sort_keys=True)
+    else:
+        print(json.dumps(report, indent=2, sort_keys=True))
+    return report
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,67 @@
+"""Compare the compiled validation engine against the schema package
+
+Run from the repository root with:
+
+    python -m benchmarks.validation_benchmark
+"""
+from dynamagic.modules.validation import Validation
+from benchmarks.items import generate_item, generate_schema_template
+import timeit
+
+
+def benchmark_engine(engine: str, attribute_count: int, number: int) -> dict:
+    validation = Validation(
+        table_schema=generate_schema_template(attribute_count), engine=engine
+    )
+    dynamodb_item = generate_item(attribute_count, customer_id=1482328791)
+    results = {
+        "construction": min(
+            timeit.repeat(
+                lambda: Validation(
+                    table_schema=generate_schema_template(attribute_count),
+                    engine=engine,
+                ),
+                number=max(number // 10, 1),
+                repeat=3,
+            )
+        )
+        / max(number // 10, 1)
+    }
+    for validation_type in ("new_item", "update_item", "read_item"):
+        dynamodb_schema = validation.validation_schema(validation_type=validation_type)
+        unvalidated_item = (
+            {"CustomerId": dynamodb_item["CustomerId"]}
+            if validation_type == "read_item"
+            else dynamodb_item
+        )
+        results[validation_type] = (
+            min(
+                timeit.repeat(
+                    lambda: validation.validate_item_data_entegrity(
+                        dynamodb_schema=dynamodb_schema,
+                        unvalidated_item=unvalidated_item,
+                    ),
+                    number=number,
+                    repeat=3,
+                )
+            )
+            / number
+        )
+    return results
+
+
+def main() -> None:
+    for attribute_count in (5, 40):
+        compiled = benchmark_engine("compiled", attribute_count, number=300)
+        schema = benchmark_engine("schema", attribute_count, number=300)
+        print(f"{attribute_count} attributes")
+        for operation in compiled:
+            print(
+                f"  {operation:<13} compiled {compiled[operation] * 1e6:9.2f} us"
+                f"  schema {schema[operation] * 1e6:9.2f} us"
+                f"  {schema[operation] / compiled[operation]:6.1f}x"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,166 @@
+from functools import partial
+from typing import Any, Awaitable, Callable, Dict, Iterable, List, Union
+import asyncio
+from dynamagic.dynamodb_client import DynamodbClient
+from dynamagic.modules.conditions import SortKeyCondition
+from dynamagic.modules.validation import Validation
+from dynamagic.tracked_item import TrackedItem
+from dynamagic.transaction import TransactionBuilder
+
+
+class AsyncDynamodbClient:
+    """Asyncio counterpart of DynamodbClient. boto3 is blocking so every operation runs the
+    DynamodbClient method on a bounded thread pool that shares the same boto3 client and
+    validation, returning the same response dicts as the synchronous client."""
+
+    def __init__(
+        self,
+        dynamodb_table: str = None,
+        table_schema: Union[Dict[str, type], Dict[str, str]] = None,
+        dynamodb_client: DynamodbClient = None,
+        max_workers: int = 10,
+        **client_options: Any,
+    ) -> None:
+        self.dynamodb_client = (
+            dynamodb_client
+            if dynamodb_client is not None
+            else DynamodbClient(
+                dynamodb_table=dynamodb_table, table_schema=table_schema, **client_options
+            )
+        )
+        self.max_workers = max_workers
+        self.executor = None
+
+    @property
+    def validation(self) -> Validation:
+        return self.dynamodb_client.validation
+
+    async def __aenter__(self) -> "AsyncDynamodbClient":
+        return self
+
+    async def __aexit__(self, *exception_details: Any) -> None:
+        self.close()
+
+    def close(self) -> None:
+        """Shut down the thread pool, the client can still be used and will start a new one"""
+        if self.executor is not None:
+            self.executor.shutdown(wait=True)
+            self.executor = None
+
+    async def run(self, operation: Callable[..., Any], **arguments: Any) -> Any:
+        """Run a blocking DynamodbClient method on the thread pool without blocking the event loop"""
+        if self.executor is None:
+            from concurrent.futures import ThreadPoolExecutor
+
+            self.executor = ThreadPoolExecutor(max_workers=self.max_workers)
+        return await asyncio.get_running_loop().run_in_executor(
+            self.executor, partial(operation, **arguments)
+        )
+
+    @staticmethod
+    async def gather(
+        *operations: Awaitable[Any], max_concurrency: int = 10
+    ) -> List[Any]:
+        """Await many operations with at most max_concurrency running at once
+
+        Args:
+            operations (Awaitable[Any]): Coroutines such as client.fetch_item(key=...)
+            max_concurrency (int, optional): Maximum operations in flight. Defaults to 10.
+
+        Returns:
+            List[Any]: The results in the same order as the operations
+        """
+        semaphore = asyncio.Semaphore(max_concurrency)
+
+        async def run_bounded(operation: Awaitable[Any]) -> Any:
+            async with semaphore:
+                return await operation
+
+        return await asyncio.gather(*(run_bounded(operation) for operation in operations))
+
+    async def create_item(self, dynamodb_item: Dict[str, str]) -> Dict[str, int]:
+        return await self.run(
+            self.dynamodb_client.create_item, dynamodb_item=dynamodb_item
+        )
+
+    async def create_items(
+        self, dynamodb_items: Iterable[Dict[str, str]]
+    ) -> Dict[str, Union[int, List[Dict[str, Union[int, str]]]]]:
+        return await self.run(
+            self.dynamodb_client.create_items, dynamodb_items=list(dynamodb_items)
+        )
+
+    async def update_item(
+        self, dynamodb_attributes: Dict[str, str], **update_options: Any
+    ) -> Dict[str, int]:
+        return await self.run(
+            self.dynamodb_client.update_item,
+            dynamodb_attributes=dynamodb_attributes,
+            **update_options,
+        )
+
+    async def fetch_item(
+        self, key: Dict[str, str], **fetch_options: Any
+    ) -> Dict[str, Union[int, Dict[str, str], TrackedItem]]:
+        return await self.run(self.dynamodb_client.fetch_item, key=key, **fetch_options)
+
+    async def modify_item(
+        self,
+        key: Dict[str, str],
+        modifier: Callable[[TrackedItem], None],
+        max_attempts: int = 3,
+    ) -> Dict[str, Union[int, str]]:
+        return await self.run(
+            self.dynamodb_client.modify_item,
+            key=key,
+            modifier=modifier,
+            max_attempts=max_attempts,
+        )
+
+    async def commit_transaction(
+        self, transaction: TransactionBuilder
+    ) -> Dict[str, Union[int, str, List[Dict[str, Union[int, str]]]]]:
+        return await self.run(transaction.commit)
+
+    async def fetch_items(
+        self, **scan_options: Any
+    ) -> Dict[str, Union[int, Union[str, List[Dict[str, str]]]]]:
+        return await self.run(self.dynamodb_client.fetch_items, **scan_options)
+
+    async def fetch_items_by_keys(
+        self,
+        keys: Iterable[Dict[str, str]],
+        max_workers: int = None,
+        attributes: Iterable[str] = None,
+    ) -> Dict[str, Union[int, str, Dict[str, Union[dict, list]]]]:
+        return await self.run(
+            self.dynamodb_client.fetch_items_by_keys,
+            keys=list(keys),
+            max_workers=max_workers,
+            attributes=attributes,
+        )
+
+    async def query_items(
+        self,
+        partition_key_value: str,
+        sort_key_condition: SortKeyCondition = None,
+        **query_options: Any,
+    ) -> Dict[str, Union[int, Union[str, List[Dict[str, str]]]]]:
+        return await self.run(
+            self.dynamodb_client.query_items,
+            partition_key_value=partition_key_value,
+            sort_key_condition=sort_key_condition,
+            **query_options,
+        )
+
+    async def delete_item(
+        self, key: Dict[str, str], expected_version: int = None
+    ) -> Dict[str, int]:
+        return await self.run(
+            self.dynamodb_client.delete_item, key=key, expected_version=expected_version
+        )
+
+    async def delete_items(
+        self, keys: Iterable[Dict[str, str]]
+    ) -> Dict[str, Union[int, List[Dict[str, Union[int, str]]]]]:
+        return await self.run(self.dynamodb_client.delete_items, keys=list(keys))
@@ -1,22 +1,66 @@
 import dynamagic.modules.exceptions as dynamodb_exceptions
-
-try:
-    from schema import Schema
-except ModuleNotFoundError:
-    pass
-    # from dynamagic.modules.schema import Schema
-
-from typing import Dict, List, Union, Tuple
+from functools import cached_property
+import time
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Callable,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Union,
+    Tuple,
+)
 from dynamagic.modules.validation import Validation
 from dynamagic.modules.dynamodb_api import DynamodbApi
+from dynamagic.modules.item_cache import ItemCache
+from dynamagic.tracked_item import TrackedItem
+from dynamagic.transaction import TransactionBuilder
+from dynamagic.modules.conditions import FilterCondition, SortKeyCondition
+from dynamagic.modules.projection import Projection
+from dynamagic.modules.retry import RetryPolicy
+from dynamagic.modules.metrics import MetricsRecorder, timed
+from dynamagic.modules.capacity import CapacityTracker
+
+if TYPE_CHECKING:
+    from boto3.session import Session
+    from botocore.config import Config
+    from schema import Schema
 
 
 class DynamodbClient(DynamodbApi):
     def __init__(
-        self, dynamodb_table: str, table_schema: Union[Dict[str, type], Dict[str, str]]
+        self,
+        dynamodb_table: str,
+        table_schema: Union[Dict[str, type], Dict[str, str]],
+        client: object = None,
+        region_name: str = None,
+        endpoint_url: str = None,
+        client_config: "Config" = None,
+        session: "Session" = None,
+        validation_engine: str = "compiled",
+        item_cache: ItemCache = None,
+        retry_policy: RetryPolicy = None,
+        metrics: MetricsRecorder = None,
+        capacity_tracker: CapacityTracker = None,
     ):
-        super().__init__(dynamodb_table=dynamodb_table)
-        self.validation = Validation(table_schema=table_schema)
+        super().__init__(
+            dynamodb_table=dynamodb_table,
+            client=client,
+            region_name=region_name,
+            endpoint_url=endpoint_url,
+            client_config=client_config,
+            session=session,
+            retry_policy=retry_policy,
+            metrics=metrics,
+            capacity_tracker=capacity_tracker,
+        )
+        if validation_engine not in Validation.validation_engines:
+            raise dynamodb_exceptions.ValidationWrongEngineError(data=validation_engine)
+        self.table_schema = dict(table_schema)
+        self.validation_engine = validation_engine
+        self.item_cache = item_cache
         self.client_exceptions: tuple(Exception) = (
             dynamodb_exceptions.DynamoDbWrongKeyError,
             dynamodb_exceptions.ValidationWrongSchemaTypeError,
@@ -24,9 +68,74 @@ class DynamodbClient(DynamodbApi):
             dynamodb_exceptions.ValidationMissingKeyError,
             dynamodb_exceptions.ValidationIncorrectKeyTypeError,
             dynamodb_exceptions.ValidationIncorrectAttributeError,
+            dynamodb_exceptions.ValidationIncorrectAttributesError,
             dynamodb_exceptions.ValidationFailedAttributesUpdateError,
             dynamodb_exceptions.DynamoDbInvalidTableError,
             dynamodb_exceptions.DynamoDbWrongKeyFormatError,
+            dynamodb_exceptions.DynamoDbUnprocessedItemError,
+            dynamodb_exceptions.ValidationNoNewAttributesError,
+            dynamodb_exceptions.ValidationWrongIndexError,
+            dynamodb_exceptions.DynamoDbInvalidQueryError,
+            dynamodb_exceptions.DynamoDbInvalidScanError,
+            dynamodb_exceptions.DynamoDbThrottlingError,
+            dynamodb_exceptions.DynamoDbCapacityTrackingDisabledError,
+            dynamodb_exceptions.ValidationWrongUpdateActionError,
+            dynamodb_exceptions.DynamoDbVersionConflictError,
+            dynamodb_exceptions.ValidationMissingVersionError,
+            dynamodb_exceptions.DynamoDbItemExistsError,
+            dynamodb_exceptions.ValidationTooManyTransactionItemsError,
+            dynamodb_exceptions.ValidationDuplicateTransactionItemError,
+            dynamodb_exceptions.DynamoDbTransactionCanceledError,
+            dynamodb_exceptions.DynamoDbTransactionConflictError,
+            dynamodb_exceptions.DynamoDbIdempotencyMismatchError,
+            dynamodb_exceptions.ValidationInvalidFilterError,
+        )
+
+    @cached_property
+    def validation(self) -> Validation:
+        """The validation for the table schema, built the first time an operation needs it"""
+        return Validation(table_schema=self.table_schema, engine=self.validation_engine)
+
+    def warm(self, connect: bool = False) -> None:
+        """Build the boto3 client and the validation schemas ahead of the first operation,
+        call this during lambda init or provisioned concurrency so requests do not pay for it
+
+        Args:
+            connect (bool, optional): Also call describe_table so the connection to dynamodb is opened. Defaults to False.
+        """
+        self.validation
+        self.client
+        self.param_validation_error
+        if connect:
+            self.call("describe_table", TableName=self.dynamodb_table)
+
+    def capacity_report(
+        self,
+    ) -> Dict[str, Union[int, str, Dict[str, Union[float, List[Dict[str, Union[str, float]]]]]]]:
+        """Report the capacity consumed by each operation, table and index so far with its estimated cost
+
+        Returns:
+            Dict[str, Union[int, str, Dict[str, Union[float, List[Dict[str, Union[str, float]]]]]]]: Returns the
+            status code and the report, or the error if capacity is not being tracked
+        """
+        try:
+            if self.capacity_tracker is None:
+                raise dynamodb_exceptions.DynamoDbCapacityTrackingDisabledError
+            return {"statusCode": 200, "body": self.capacity_tracker.report()}
+        except self.client_exceptions as error:
+            return {"statusCode": 400, "body": str(error)}
+
+    def transaction(self, client_request_token: str = None) -> TransactionBuilder:
+        """Start a transaction that writes items on this table, and others, all at once or not at all
+
+        Args:
+            client_request_token (str, optional): Token that makes committing the transaction idempotent
+
+        Returns:
+            TransactionBuilder: Add the writes to it then call commit
+        """
+        return TransactionBuilder(
+            dynamodb_client=self, client_request_token=client_request_token
         )
 
     def validate_data(
@@ -41,16 +150,20 @@ class DynamodbClient(DynamodbApi):
         Returns:
             Dict[str, str]: Validated data with the correct format
         """
-        validation_schema: Schema = self.validation.validation_schema(
+        validation_schema: "Schema" = self.validation.validation_schema(
             validation_type=validation_type
         )
         return self.validation.validate_item_data_entegrity(
             dynamodb_schema=validation_schema, unvalidated_item=unvalidated_data
         )
 
+    @timed("create_item")
     def create_item(self, dynamodb_item: Dict[str, str]) -> Dict[str, int]:
         """Create a new item on the table
 
+        When the schema has a version_attribute the item is written at version 1 and only when there is no
+        item with the key already, pass the version you read to replace an existing item.
+
         Args:
             dynamodb_item (Dict[str, str]): Attributes for the item, must include the key specified on your table.
 
@@ -58,18 +171,389 @@ class DynamodbClient(DynamodbApi):
             Dict[str, int]: Status code of the results of the action
         """
         try:
-            validated_item: Dict[str, str] = self.validate_data(
-                validation_type="new_item", unvalidated_data=dynamodb_item
+            key_values: Tuple[str, ...] = self.put_new_item(dynamodb_item=dynamodb_item)
+            return {
+                "statusCode": 200,
+                "body": f"Created new item with key: {self.readable_key(key_values)}",
+            }
+        except self.client_exceptions as error:
+            self.metrics.record_error("create_item", error)
+            return {"statusCode": 400, "body": str(error)}
+
+    def put_new_item(self, dynamodb_item: Dict[str, str]) -> Tuple[str, ...]:
+        """The put behind create_item, raising the exception rather than returning a status code
+
+        Args:
+            dynamodb_item (Dict[str, str]): Attributes for the item, must include the key specified on your table.
+
+        Returns:
+            Tuple[str, ...]: Returns the key values of the item that was written
+        """
+        validated_item: Dict[str, str] = self.validate_data(
+            validation_type="new_item", unvalidated_data=dynamodb_item
+        )
+        key_values: Tuple[str, ...] = self.key_values(validated_item)
+        expected_version, condition_arguments = self.prepare_versioned_put(
+            validated_item=validated_item
+        )
+        formated_db_item: Dict[
+            str, Dict[str, str]
+        ] = self.validation.validate_item_to_db_format(validated_item)
+        try:
+            self.add_item(dynamodb_item=formated_db_item, **condition_arguments)
+        except dynamodb_exceptions.DynamoDbWrongKeyError as error:
+            if not condition_arguments:
+                raise
+            if expected_version is None:
+                raise dynamodb_exceptions.DynamoDbItemExistsError(
+                    data=self.readable_key(key_values)
+                ) from error
+            raise dynamodb_exceptions.DynamoDbVersionConflictError(
+                data=expected_version
+            ) from error
+        finally:
+            self.invalidate_cached_item(key_values=key_values)
+        return key_values
+
+    def prepare_versioned_put(
+        self, validated_item: Dict[str, Any]
+    ) -> Tuple[int, Dict[str, Union[str, Dict[str, str]]]]:
+        """Move a validated new item on to its next version when the schema has a version_attribute, the put
+        only replaces an item at the version in validated_item and without one only writes an item that does not exist
+
+        Args:
+            validated_item (Dict[str, Any]): Item that has been through validate_data, its version is changed in place
+
+        Returns:
+            Tuple[int, Dict[str, Union[str, Dict[str, str]]]]: Returns the version the put replaces, None when the item
+            must not exist yet, and its condition arguments, no arguments when the schema has no version_attribute
+        """
+        version_attribute: str = self.validation.version_attribute
+        if version_attribute is None:
+            return None, dict()
+        expected_version: int = validated_item.get(version_attribute)
+        if expected_version is None:
+            (
+                condition_expression,
+                expression_attribute_names,
+            ) = self.generate_key_not_exists_condition()
+            validated_item[version_attribute] = 1
+            return None, {
+                "ConditionExpression": condition_expression,
+                "ExpressionAttributeNames": expression_attribute_names,
+            }
+        condition_arguments = self.generate_version_condition_arguments(
+            expected_version=expected_version
+        )
+        validated_item[version_attribute] = expected_version + 1
+        return expected_version, condition_arguments
+
+    def key_values(self, validated_item: Dict[str, str]) -> Tuple[str, ...]:
+        """Get the values of the key attributes from a validated item
+
+        Args:
+            validated_item (Dict[str, str]): Item or key that has been through validate_data
+
+        Returns:
+            Tuple[str, ...]: Values of the key attributes in the order of the key_template
+        """
+        return tuple(
+            validated_item[key_name] for key_name in self.validation.key_template
+        )
+
+    def read_projection(
+        self, attributes: Iterable[str] = None, *required_attributes: str
+    ) -> Union[Projection, None]:
+        """The projection for a read of only some attributes, None to read every attribute
+
+        Args:
+            attributes (Iterable[str], optional): Attributes the caller asked for
+            required_attributes (str): Attributes the read needs as well, such as the key
+
+        Returns:
+            Union[Projection, None]: Returns the projection or None when no attributes were given
+        """
+        if not attributes:
+            return None
+        return self.validation.projection(
+            attributes=(*required_attributes, *attributes)
+        )
+
+    @staticmethod
+    def projection_arguments(projection: Projection = None) -> Dict[str, Any]:
+        """The projection_expression and projection_attribute_names arguments of a read"""
+        if projection is None:
+            return dict()
+        return {
+            "projection_expression": projection.projection_expression,
+            "projection_attribute_names": projection.expression_attribute_names,
+        }
+
+    def decode_items(
+        self,
+        dynamodb_items: Iterable[Dict[str, Dict[str, Any]]],
+        projection: Projection = None,
+    ) -> List[Dict[str, Any]]:
+        """Convert a page of items to a readable format with the codec of the projection they were read with"""
+        if projection is None:
+            return self.validation.validate_items_to_readable_format(
+                dynamodb_items=dynamodb_items
             )
-            formated_db_item: Dict[
-                str, Dict[str, str]
-            ] = self.validation.validate_item_to_db_format(validated_item)
-            self.add_item(dynamodb_item=formated_db_item)
+        return projection.codec.decode_items(dynamodb_items)
+
+    def cache_key(self, key_values: Tuple[str, ...]) -> Tuple[str, Tuple[str, ...]]:
+        """The key of an item in the item cache, scoped to the table so clients can share a cache"""
+        return (self.dynamodb_table, key_values)
+
+    def invalidate_cached_item(self, key_values: Tuple[str, ...]) -> None:
+        """Drop an item from the item cache after it has been written to"""
+        if self.item_cache is not None:
+            self.item_cache.invalidate(self.cache_key(key_values))
+
+    @staticmethod
+    def readable_key(key_values: Tuple[str, ...]) -> Union[str, Tuple[str, ...]]:
+        """The value used to identify an item in a response, the key itself or a tuple for a composite key"""
+        return key_values[0] if len(key_values) == 1 else key_values
+
+    @staticmethod
+    def chunk_write_requests(
+        write_requests: List[Tuple[int, Tuple[str, ...], Dict[str, dict]]],
+        chunk_size: int = 25,
+    ) -> Iterator[List[Tuple[int, Tuple[str, ...], Dict[str, dict]]]]:
+        """Split write requests into batches, starting a new batch whenever a key repeats
+        so writes to the same key are applied in the order they were given
+
+        Args:
+            write_requests (List[Tuple[int, Tuple[str, ...], Dict[str, dict]]]): Position, key values and request for each item
+            chunk_size (int, optional): Maximum requests per batch. Defaults to 25.
+
+        Yields:
+            Iterator[List[Tuple[int, Tuple[str, ...], Dict[str, dict]]]]: Batches of write requests
+        """
+        chunk = list()
+        chunk_keys = set()
+        for write_request in write_requests:
+            if len(chunk) == chunk_size or write_request[1] in chunk_keys:
+                yield chunk
+                chunk = list()
+                chunk_keys = set()
+            chunk.append(write_request)
+            chunk_keys.add(write_request[1])
+        if chunk:
+            yield chunk
+
+    def push_write_requests(
+        self,
+        write_requests: List[Tuple[int, Tuple[str, ...], Dict[str, dict]]],
+        results: List[Dict[str, Union[int, str]]],
+        success_body: Callable[[Tuple[str, ...]], str],
+    ) -> None:
+        """Write the requests in batches and record the outcome of each one in results
+
+        Args:
+            write_requests (List[Tuple[int, Tuple[str, ...], Dict[str, dict]]]): Position, key values and request for each item
+            results (List[Dict[str, Union[int, str]]]): Per item status report, updated in place
+            success_body (Callable[[Tuple[str, ...]], str]): Builds the body for an item that was written
+        """
+        for chunk in self.chunk_write_requests(write_requests=write_requests):
+            try:
+                unprocessed_requests = self.batch_write(
+                    write_requests=[write_request for _, _, write_request in chunk]
+                )
+            except self.client_exceptions as error:
+                for index, _, _ in chunk:
+                    results[index] = {"statusCode": 400, "body": str(error)}
+                continue
+            finally:
+                for _, key_values, _ in chunk:
+                    self.invalidate_cached_item(key_values=key_values)
+
+            unprocessed_keys = set()
+            for unprocessed_request in unprocessed_requests:
+                for request in unprocessed_request.values():
+                    dynamodb_item = request.get("Item", request.get("Key"))
+                    unprocessed_keys.add(
+                        self.key_values(
+                            self.validation.validate_item_to_readable_format(
+                                dynamodb_item={
+                                    key_name: dynamodb_item[key_name]
+                                    for key_name in self.validation.key_template
+                                }
+                            )
+                        )
+                    )
+            for index, key_values, _ in chunk:
+                if key_values in unprocessed_keys:
+                    results[index] = {
+                        "statusCode": 400,
+                        "body": str(dynamodb_exceptions.DynamoDbUnprocessedItemError()),
+                    }
+                else:
+                    results[index] = {
+                        "statusCode": 200,
+                        "body": success_body(key_values),
+                    }
+
+    @staticmethod
+    def batch_status_code(results: List[Dict[str, Union[int, str]]]) -> int:
+        """Summarise a per item status report, 200 when every item passed, 400 when every item failed
+        and 207 when the results are mixed
+        """
+        status_codes = {result["statusCode"] for result in results}
+        if status_codes <= {200}:
+            return 200
+        if status_codes == {400}:
+            return 400
+        return 207
+
+    @timed("create_items")
+    def create_items(
+        self, dynamodb_items: Iterable[Dict[str, str]]
+    ) -> Dict[str, Union[int, List[Dict[str, Union[int, str]]]]]:
+        """Create many new items on the table using batch_write_item. Batch writes cannot be conditional, so when
+        the schema has a version_attribute each item is written with its own conditional put like create_item
+
+        Args:
+            dynamodb_items (Iterable[Dict[str, str]]): Attributes for each item, each must include the key specified on your table.
+
+        Returns:
+            Dict[str, Union[int, List[Dict[str, Union[int, str]]]]]: An overall status code and a body with the
+            status code and message for every item in the order they were given
+        """
+        results: List[Dict[str, Union[int, str]]] = list()
+        if self.validation.version_attribute is not None:
+            for dynamodb_item in dynamodb_items:
+                try:
+                    key_values: Tuple[str, ...] = self.put_new_item(
+                        dynamodb_item=dynamodb_item
+                    )
+                except self.client_exceptions as error:
+                    results.append({"statusCode": 400, "body": str(error)})
+                    continue
+                results.append(
+                    {
+                        "statusCode": 200,
+                        "body": f"Created new item with key: {self.readable_key(key_values)}",
+                    }
+                )
+            return {"statusCode": self.batch_status_code(results), "body": results}
+        write_requests: List[Tuple[int, Tuple[str, ...], Dict[str, dict]]] = list()
+        for index, dynamodb_item in enumerate(dynamodb_items):
+            results.append(None)
+            try:
+                validated_item: Dict[str, str] = self.validate_data(
+                    validation_type="new_item", unvalidated_data=dynamodb_item
+                )
+                formated_db_item: Dict[
+                    str, Dict[str, str]
+                ] = self.validation.validate_item_to_db_format(validated_item)
+            except self.client_exceptions as error:
+                results[index] = {"statusCode": 400, "body": str(error)}
+                continue
+            write_requests.append(
+                (
+                    index,
+                    self.key_values(validated_item),
+                    {"PutRequest": {"Item": formated_db_item}},
+                )
+            )
+
+        self.push_write_requests(
+            write_requests=write_requests,
+            results=results,
+            success_body=lambda key_values: f"Created new item with key: {self.readable_key(key_values)}",
+        )
+        return {"statusCode": self.batch_status_code(results), "body": results}
+
+    @timed("fetch_items_by_keys")
+    def fetch_items_by_keys(
+        self,
+        keys: Iterable[Dict[str, str]],
+        max_workers: int = None,
+        attributes: Iterable[str] = None,
+    ) -> Dict[str, Union[int, str, Dict[str, Union[dict, list]]]]:
+        """Get many existing items from the database using batch_get_item
+
+        Args:
+            keys (Iterable[Dict[str, str]]): The keys for the items in the database, duplicates are only fetched once
+            max_workers (int, optional): Fetch the 100 key batches concurrently on this many threads. Defaults to fetching them one after another.
+            attributes (Iterable[str], optional): Only read these attributes, the key attributes are always read. Defaults to every attribute.
+
+        Returns:
+            Dict[str, Union[int, str, Dict[str, Union[dict, list]]]]: Returns the
+            status code and a body with the found items keyed by their key, the keys that do not exist and any keys that
+            were still unprocessed after retrying, or the error why it failed
+        """
+        try:
+            projection: Projection = self.read_projection(
+                attributes, *self.validation.key_template
+            )
+            projection_arguments: Dict[str, Any] = self.projection_arguments(projection)
+            unique_keys: Dict[Tuple[str, ...], Dict[str, str]] = dict()
+            for key in keys:
+                validated_key: Dict[str, str] = self.validate_data(
+                    validation_type="read_item", unvalidated_data=key
+                )
+                unique_keys.setdefault(self.key_values(validated_key), validated_key)
+            formated_keys: List[Dict[str, Dict[str, str]]] = [
+                self.validation.validate_item_to_db_format(dynamodb_item=validated_key)
+                for validated_key in unique_keys.values()
+            ]
+            key_chunks: List[List[Dict[str, Dict[str, str]]]] = [
+                formated_keys[index : index + 100]
+                for index in range(0, len(formated_keys), 100)
+            ]
+            if max_workers and len(key_chunks) > 1:
+                from concurrent.futures import ThreadPoolExecutor
+
+                with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                    chunk_results = list(
+                        executor.map(
+                            lambda key_chunk: self.batch_get(
+                                keys=key_chunk, **projection_arguments
+                            ),
+                            key_chunks,
+                        )
+                    )
+            else:
+                chunk_results = [
+                    self.batch_get(keys=key_chunk, **projection_arguments)
+                    for key_chunk in key_chunks
+                ]
+
+            found_items: Dict[Union[str, Tuple[str, ...]], Dict[str, str]] = dict()
+            unprocessed_keys: List[Dict[str, str]] = list()
+            for fetched_items, chunk_unprocessed_keys in chunk_results:
+                for readable_item in self.decode_items(
+                    dynamodb_items=fetched_items, projection=projection
+                ):
+                    found_items[
+                        self.readable_key(self.key_values(readable_item))
+                    ] = readable_item
+                unprocessed_keys.extend(
+                    self.validation.validate_items_to_readable_format(
+                        dynamodb_items=chunk_unprocessed_keys
+                    )
+                )
+            unprocessed_key_values = {
+                self.key_values(unprocessed_key) for unprocessed_key in unprocessed_keys
+            }
+            missing_keys: List[Dict[str, str]] = [
+                validated_key
+                for key_values, validated_key in unique_keys.items()
+                if self.readable_key(key_values) not in found_items
+                and key_values not in unprocessed_key_values
+            ]
             return {
                 "statusCode": 200,
-                "body": f"Created new item with key: {validated_item[list(self.validation.key_template.keys())[0]]}",
+                "body": {
+                    "items": found_items,
+                    "missing_keys": missing_keys,
+                    "unprocessed_keys": unprocessed_keys,
+                },
             }
         except self.client_exceptions as error:
+            self.metrics.record_error("fetch_items_by_keys", error)
             return {"statusCode": 400, "body": str(error)}
 
     def delete_existing_attributes(
@@ -96,38 +580,127 @@ class DynamodbClient(DynamodbApi):
         )
 
     def generate_expressions(
-        self, confirmed_new_attributes: Dict[str, str]
-    ) -> Tuple[str, Dict[str, str]]:
-        """Used to generate expressions required to update an item in dynamodb
+        self,
+        confirmed_new_attributes: Dict[str, Any],
+        remove_attributes: Iterable[str] = (),
+        add_attributes: Dict[str, Any] = None,
+        if_not_exists: Iterable[str] = (),
+    ) -> Tuple[str, Dict[str, str], Dict[str, Dict[str, Any]]]:
+        """Used to generate expressions required to update an item in dynamodb, the expression and names come
+        from a plan cached for each combination of attributes so only the values are converted on each call
 
         Args:
-            confirmed_new_attributes (Dict[str, str]): Only parse in the attributes after you've used delete_existing_attributes
+            confirmed_new_attributes (Dict[str, Any]): Only parse in the attributes after you've used delete_existing_attributes
+            remove_attributes (Iterable[str], optional): Attributes to remove from the item
+            add_attributes (Dict[str, Any], optional): Validated amounts to add to numbers or members to add to sets
+            if_not_exists (Iterable[str], optional): Attributes of confirmed_new_attributes only set when the item does not have them
 
         Returns:
-            Tuple[str, Dict[str, str]]: Returns the update_expression string, attribute_names and attribute_values
+            Tuple[str, Dict[str, str], Dict[str, Dict[str, Any]]]: Returns the update_expression string, attribute_names and attribute_values
         """
-        update_expression: str = self.generate_update_expression(
-            new_attributes=confirmed_new_attributes,
-            expression_mapping=self.validation.expression_mapping,
+        if add_attributes is None:
+            add_attributes = dict()
+        update_plan = self.validation.update_planner.plan(
+            set_attributes=confirmed_new_attributes,
+            remove_attributes=remove_attributes,
+            add_attributes=add_attributes,
+            if_not_exists_attributes=if_not_exists,
         )
-        expression_attribute_names: Dict[
-            str, str
-        ] = self.generate_expression_attribute_names(
-            new_attributes=confirmed_new_attributes,
-            expression_mapping=self.validation.expression_mapping,
+        return (
+            update_plan.update_expression,
+            dict(update_plan.expression_attribute_names),
+            update_plan.bind(
+                self.validation.validate_item_to_db_format(
+                    dynamodb_item={**confirmed_new_attributes, **add_attributes}
+                )
+            ),
         )
-        expression_attribute_values: Dict[
-            str, str
-        ] = self.generate_expression_attribute_values(
-            new_attributes=confirmed_new_attributes,
-            dynamodb_validation_format_mapper=self.validation.dynamodb_format_mapper,
-            expression_mapping=self.validation.expression_mapping,
+
+    def generate_key_exists_condition(self) -> Tuple[str, Dict[str, str]]:
+        """Used to generate a condition that only passes when the item already exists in dynamodb
+
+        Returns:
+            Tuple[str, Dict[str, str]]: Returns the condition_expression string and the attribute_names it uses
+        """
+        key_name: str = self.validation.partition_key
+        expression_attribute_name: str = self.validation.expression_mapping[key_name][
+            "expression_attribute_name"
+        ]
+        return (
+            f"attribute_exists({expression_attribute_name})",
+            {expression_attribute_name: key_name},
         )
+
+    def generate_key_not_exists_condition(self) -> Tuple[str, Dict[str, str]]:
+        """Used to generate a condition that only passes when there is no item with the key in dynamodb
+
+        Returns:
+            Tuple[str, Dict[str, str]]: Returns the condition_expression string and the attribute_names it uses
+        """
+        key_name: str = self.validation.partition_key
+        expression_attribute_name: str = self.validation.expression_mapping[key_name][
+            "expression_attribute_name"
+        ]
         return (
-            update_expression,
+            f"attribute_not_exists({expression_attribute_name})",
+            {expression_attribute_name: key_name},
+        )
+
+    def generate_version_condition(
+        self, expected_version: int
+    ) -> Tuple[str, Dict[str, str], Dict[str, Dict[str, str]]]:
+        """Used to generate a condition that only passes while the item is still at the expected version,
+        version 0 is an item that was written before it had a version
+
+        Args:
+            expected_version (int): The version the item had when it was read
+
+        Returns:
+            Tuple[str, Dict[str, str], Dict[str, Dict[str, str]]]: Returns the condition_expression string, attribute_names and attribute_values
+        """
+        version_attribute: str = self.validation.version_attribute
+        if version_attribute is None:
+            raise dynamodb_exceptions.ValidationIncorrectAttributeError(
+                data="version_attribute"
+            )
+        expression_attribute_name: str = self.validation.expression_mapping[
+            version_attribute
+        ]["expression_attribute_name"]
+        if not expected_version:
+            return (
+                f"attribute_not_exists({expression_attribute_name})",
+                {expression_attribute_name: version_attribute},
+                dict(),
+            )
+        expression_attribute_var: str = (
+            f"{self.validation.expression_mapping[version_attribute]['expression_attribute_var']}_0"
+        )
+        return (
+            f"{expression_attribute_name} = {expression_attribute_var}",
+            {expression_attribute_name: version_attribute},
+            {
+                expression_attribute_var: self.validation.validate_item_to_db_format(
+                    dynamodb_item={version_attribute: expected_version}
+                )[version_attribute]
+            },
+        )
+
+    def generate_version_condition_arguments(
+        self, expected_version: int
+    ) -> Dict[str, Union[str, Dict[str, str]]]:
+        """The version condition as the ConditionExpression, names and values arguments of a put or delete"""
+        (
+            condition_expression,
             expression_attribute_names,
             expression_attribute_values,
-        )
+        ) = self.generate_version_condition(expected_version=expected_version)
+        condition_arguments: Dict[str, Union[str, Dict[str, str]]] = {
+            "ConditionExpression": condition_expression,
+            "ExpressionAttributeNames": expression_attribute_names,
+        }
+        if expression_attribute_values:
+            condition_arguments["ExpressionAttributeValues"] = expression_attribute_values
+        return condition_arguments
 
     def confirm_item_updated(
         self,
@@ -153,67 +726,248 @@ class DynamodbClient(DynamodbApi):
             response=update_response, validated_new_attributes=formated_attributes
         )
 
-    def update_item(self, dynamodb_attributes: Dict[str, str]) -> Dict[str, int]:
+    @timed("update_item")
+    def update_item(
+        self,
+        dynamodb_attributes: Dict[str, str],
+        diff_existing: bool = False,
+        remove_attributes: Iterable[str] = (),
+        add_attributes: Dict[str, Any] = None,
+        if_not_exists: Iterable[str] = (),
+        expected_version: int = None,
+    ) -> Dict[str, int]:
         """Updates an existing item to the database
 
+        By default this is a single update_item call conditioned on the item existing. Set diff_existing to
+        read the item first and only send the attributes that have changed. When the schema has a version_attribute
+        the update is conditioned on the version passed in dynamodb_attributes or expected_version and increases it
+        by one, an update without either is rejected with ValidationMissingVersionError.
+
         Args:
             dynamodb_attributes (Dict[str, str]): Provide your key along with the attribute names you want to update
+            diff_existing (bool, optional): Fetch the existing item and drop attributes that have not changed. Defaults to False.
+            remove_attributes (Iterable[str], optional): Attributes to remove from the item
+            add_attributes (Dict[str, Any], optional): Amounts to add to number attributes or members to add to set attributes
+            if_not_exists (Iterable[str], optional): Attributes of dynamodb_attributes that are only set when the item does not have them yet
+            expected_version (int, optional): Only update while the item is at this version and increase it by one, required when the schema has a version_attribute
 
         Returns:
             Dict[str, int]: Returns a status code and a body telling you if it passed or failed
         """
         try:
-            validated_attributes: Dict[str, str] = self.validate_data(
-                validation_type="update_item", unvalidated_data=dynamodb_attributes
+            self.apply_update(
+                dynamodb_attributes=dynamodb_attributes,
+                diff_existing=diff_existing,
+                remove_attributes=remove_attributes,
+                add_attributes=add_attributes,
+                if_not_exists=if_not_exists,
+                expected_version=expected_version,
             )
-            key: Dict[str, Dict[str, str]] = self.validation.validate_item_to_db_format(
-                dynamodb_item={
-                    list(self.validation.key_template.keys())[
-                        0
-                    ]: validated_attributes.pop(
-                        list(self.validation.key_template.keys())[0]
-                    )
-                }
+            return {
+                "statusCode": 200,
+                "body": "Item with the key provided has been updated successfully",
+            }
+        except self.client_exceptions as error:
+            self.metrics.record_error("update_item", error)
+            return {"statusCode": 400, "body": str(error)}
+
+    def validate_update(
+        self, dynamodb_attributes: Dict[str, str], expected_version: int = None
+    ) -> Tuple[Dict[str, Dict[str, str]], Tuple[str, ...], Dict[str, Any], int]:
+        """Validate the attributes of an update and split off the key and the version
+
+        Args:
+            dynamodb_attributes (Dict[str, str]): The key along with the attributes to update
+            expected_version (int, optional): The version to update from, otherwise the version in dynamodb_attributes if there is one
+
+        Returns:
+            Tuple[Dict[str, Dict[str, str]], Tuple[str, ...], Dict[str, Any], int]: Returns the formated key, the key values,
+            the validated attributes without the key and version and the expected version
+        """
+        validated_attributes: Dict[str, str] = self.validate_data(
+            validation_type="update_item", unvalidated_data=dynamodb_attributes
+        )
+        key_values: Tuple[str, ...] = self.key_values(validated_attributes)
+        key: Dict[str, Dict[str, str]] = self.validation.validate_item_to_db_format(
+            dynamodb_item={
+                key_name: validated_attributes.pop(key_name)
+                for key_name in self.validation.key_template
+            }
+        )
+        version_attribute: str = self.validation.version_attribute
+        if version_attribute in validated_attributes:
+            passed_version: int = validated_attributes.pop(version_attribute)
+            if expected_version is None:
+                expected_version = passed_version
+        if version_attribute is not None and expected_version is None:
+            raise dynamodb_exceptions.ValidationMissingVersionError(data="update_item")
+        return key, key_values, validated_attributes, expected_version
+
+    def plan_update(
+        self,
+        validated_attributes: Dict[str, Any],
+        remove_attributes: Iterable[str] = (),
+        add_attributes: Dict[str, Any] = None,
+        if_not_exists: Iterable[str] = (),
+        expected_version: int = None,
+        diff_existing: bool = False,
+    ) -> Tuple[str, Dict[str, str], Dict[str, Dict[str, Any]], str, Dict[str, Any]]:
+        """Build the update and condition expressions for attributes that went through validate_update
+
+        Returns:
+            Tuple[str, Dict[str, str], Dict[str, Dict[str, Any]], str, Dict[str, Any]]: Returns the update_expression,
+            attribute_names, attribute_values, condition_expression and the attributes the response should confirm
+        """
+        version_attribute: str = self.validation.version_attribute
+        remove_attributes = tuple(remove_attributes)
+        validated_add_attributes: Dict[str, Any] = {
+            attribute: self.validation.validate_attribute_value(
+                attribute=attribute, value=value
             )
-            removed_duplicated_attributes: Dict[
-                str, str
-            ] = self.delete_existing_attributes(
-                key=key, validated_attributes=validated_attributes
+            for attribute, value in (add_attributes or dict()).items()
+        }
+        validated_new_attributes: Dict[str, Any] = (
+            validated_attributes
+            if remove_attributes or validated_add_attributes
+            else self.validation.validate_new_attributes_exist(
+                item_attributes=validated_attributes
             )
-            validated_new_attributes: Dict[
-                str, str
-            ] = self.validation.validate_new_attributes_exist(
-                item_attributes=removed_duplicated_attributes
+        )
+        if_not_exists = [
+            attribute
+            for attribute in if_not_exists
+            if not diff_existing or attribute in validated_new_attributes
+        ]
+        if expected_version is not None:
+            (
+                version_condition,
+                version_attribute_names,
+                version_attribute_values,
+            ) = self.generate_version_condition(expected_version=expected_version)
+            validated_new_attributes[version_attribute] = expected_version + 1
+        (
+            update_expression,
+            expression_attribute_names,
+            expression_attribute_values,
+        ) = self.generate_expressions(
+            confirmed_new_attributes=validated_new_attributes,
+            remove_attributes=remove_attributes,
+            add_attributes=validated_add_attributes,
+            if_not_exists=if_not_exists,
+        )
+        condition_expression: str = None
+        if not diff_existing:
+            (
+                condition_expression,
+                condition_attribute_names,
+            ) = self.generate_key_exists_condition()
+            expression_attribute_names.update(condition_attribute_names)
+        if expected_version is not None:
+            condition_expression = " AND ".join(
+                condition
+                for condition in (condition_expression, version_condition)
+                if condition
+            )
+            expression_attribute_names.update(version_attribute_names)
+            expression_attribute_values.update(version_attribute_values)
+        confirmed_attributes: Dict[str, Any] = {
+            attribute: value
+            for attribute, value in validated_new_attributes.items()
+            if attribute not in if_not_exists
+        }
+        return (
+            update_expression,
+            expression_attribute_names,
+            expression_attribute_values,
+            condition_expression,
+            confirmed_attributes,
+        )
+
+    def apply_update(
+        self,
+        dynamodb_attributes: Dict[str, str],
+        diff_existing: bool = False,
+        remove_attributes: Iterable[str] = (),
+        add_attributes: Dict[str, Any] = None,
+        if_not_exists: Iterable[str] = (),
+        expected_version: int = None,
+    ) -> Union[bool, Exception]:
+        """The update behind update_item, raising the exception rather than returning a status code, see
+        update_item for the arguments
+
+        Returns:
+            Union[bool, Exception]: Returns True once the update is confirmed or raises the exception that stopped it
+        """
+        with self.metrics.timer("update_item", phase="validation"):
+            (
+                key,
+                key_values,
+                validated_attributes,
+                expected_version,
+            ) = self.validate_update(
+                dynamodb_attributes=dynamodb_attributes,
+                expected_version=expected_version,
             )
+        if diff_existing:
+            with self.metrics.timer("update_item", phase="pre_read"):
+                validated_attributes = self.delete_existing_attributes(
+                    key=key, validated_attributes=validated_attributes
+                )
+        with self.metrics.timer("update_item", phase="expressions"):
             (
                 update_expression,
                 expression_attribute_names,
                 expression_attribute_values,
-            ) = self.generate_expressions(
-                confirmed_new_attributes=validated_new_attributes
-            )
-            update_response: Dict[str, str] = self.push_update(
-                key=key,
-                update_expression=update_expression,
-                expression_attribute_names=expression_attribute_names,
-                expression_attribute_values=expression_attribute_values,
-            )
-            self.confirm_item_updated(
-                update_response=update_response,
-                confirmed_new_attributes=validated_new_attributes,
+                condition_expression,
+                confirmed_attributes,
+            ) = self.plan_update(
+                validated_attributes=validated_attributes,
+                remove_attributes=remove_attributes,
+                add_attributes=add_attributes,
+                if_not_exists=if_not_exists,
+                expected_version=expected_version,
+                diff_existing=diff_existing,
             )
-            return {
-                "statusCode": 200,
-                "body": "Item with the key provided has been updated successfully",
-            }
-        except self.client_exceptions as error:
-            return {"statusCode": 400, "body": str(error)}
+        with self.metrics.timer("update_item", phase="update"):
+            try:
+                update_response: Dict[str, str] = self.push_update(
+                    key=key,
+                    update_expression=update_expression,
+                    expression_attribute_names=expression_attribute_names,
+                    expression_attribute_values=expression_attribute_values,
+                    condition_expression=condition_expression,
+                )
+            except dynamodb_exceptions.DynamoDbWrongKeyError as error:
+                if expected_version is None:
+                    raise
+                raise dynamodb_exceptions.DynamoDbVersionConflictError(
+                    data=expected_version
+                ) from error
+            finally:
+                self.invalidate_cached_item(key_values=key_values)
+        with self.metrics.timer("update_item", phase="confirmation"):
+            if confirmed_attributes:
+                self.confirm_item_updated(
+                    update_response=update_response,
+                    confirmed_new_attributes=confirmed_attributes,
+                )
+        return True
 
-    def fetch_item(self, key: Dict[str, str]) -> Dict[str, Union[int, Dict[str, str]]]:
-        """Get an existing item from the database
+    @timed("fetch_item")
+    def fetch_item(
+        self,
+        key: Dict[str, str],
+        tracked: bool = False,
+        consistent_read: bool = False,
+        attributes: Iterable[str] = None,
+    ) -> Dict[str, Union[int, Dict[str, str], TrackedItem]]:
+        """Get an existing item from the database, served from the item cache when the client has one
 
         Args:
             key (Dict[str, str]): They key for the item in the database
+            tracked (bool, optional): Return a TrackedItem which can be changed and saved. Defaults to False.
+            consistent_read (bool, optional): Read the latest write from the table rather than the cache or a replica. Defaults to False.
+            attributes (Iterable[str], optional): Only read these attributes, a tracked item also reads its key and version. Defaults to every attribute.
 
         Returns:
             Dict[str, Union[int, Dict[str, str]]]: Returns the status code and the item or the error why it failed
@@ -222,55 +976,539 @@ class DynamodbClient(DynamodbApi):
             validated_key: Dict[str, str] = self.validate_data(
                 validation_type="read_item", unvalidated_data=key
             )
+            key_values: Tuple[str, ...] = self.key_values(validated_key)
+            required_attributes: List[str] = list()
+            if tracked:
+                required_attributes.extend(self.validation.key_template)
+                if self.validation.version_attribute is not None:
+                    required_attributes.append(self.validation.version_attribute)
+            projection: Projection = self.read_projection(
+                attributes, *required_attributes
+            )
+            if self.item_cache is not None:
+                if not consistent_read:
+                    cached_item: Dict[str, str] = self.item_cache.get(
+                        self.cache_key(key_values)
+                    )
+                    if cached_item is not None and projection is not None:
+                        cached_item = projection.project(cached_item)
+                    if cached_item is not None:
+                        return {
+                            "statusCode": 200,
+                            "body": TrackedItem(self, cached_item)
+                            if tracked
+                            else cached_item,
+                        }
+                cache_generation: int = self.item_cache.generation
             formated_key: Dict[
                 str, Dict[str, str]
             ] = self.validation.validate_item_to_db_format(dynamodb_item=validated_key)
-            fetched_item: Dict[str, str] = self.get_item(key=formated_key)
-            readable_item: Dict[
-                str, str
-            ] = self.validation.validate_item_to_readable_format(
-                dynamodb_item=fetched_item
+            fetched_item: Dict[str, str] = self.get_item(
+                key=formated_key,
+                consistent_read=consistent_read,
+                **self.projection_arguments(projection),
             )
-            return {"statusCode": 200, "body": readable_item}
+            if projection is not None:
+                readable_item: Dict[str, str] = projection.codec.decode_item(
+                    fetched_item
+                )
+            else:
+                readable_item = self.validation.validate_item_to_readable_format(
+                    dynamodb_item=fetched_item
+                )
+                if self.item_cache is not None:
+                    self.item_cache.put(
+                        self.cache_key(key_values),
+                        readable_item,
+                        generation=cache_generation,
+                    )
+            return {
+                "statusCode": 200,
+                "body": TrackedItem(self, readable_item) if tracked else readable_item,
+            }
+        except self.client_exceptions as error:
+            self.metrics.record_error("fetch_item", error)
+            return {"statusCode": 400, "body": str(error)}
+
+    @timed("modify_item")
+    def modify_item(
+        self,
+        key: Dict[str, str],
+        modifier: Callable[[TrackedItem], None],
+        max_attempts: int = 3,
+    ) -> Dict[str, Union[int, str]]:
+        """Read an item, change it and save it, reading it again and reapplying the change when another
+        writer saved the item first. Needs a version_attribute in the schema to notice the other writers.
+
+        Args:
+            key (Dict[str, str]): The key for the item in the database
+            modifier (Callable[[TrackedItem], None]): Changes the tracked item, called again on every attempt
+            max_attempts (int, optional): Times the item is read and saved before the conflict is returned. Defaults to 3.
+
+        Returns:
+            Dict[str, Union[int, str]]: Returns a status code and a body telling you if it passed or failed
+        """
+        try:
+            for attempt in range(max(1, max_attempts)):
+                fetch_response = self.fetch_item(
+                    key=key, tracked=True, consistent_read=True
+                )
+                if fetch_response["statusCode"] != 200:
+                    return fetch_response
+                tracked_item: TrackedItem = fetch_response["body"]
+                modifier(tracked_item)
+                try:
+                    tracked_item.push()
+                except dynamodb_exceptions.DynamoDbVersionConflictError:
+                    if attempt + 1 >= max_attempts:
+                        raise
+                    time.sleep(self.calculate_backoff(attempt))
+                    continue
+                return {
+                    "statusCode": 200,
+                    "body": "Item with the key provided has been updated successfully",
+                }
         except self.client_exceptions as error:
+            self.metrics.record_error("modify_item", error)
             return {"statusCode": 400, "body": str(error)}
 
-    def fetch_items(self) -> Dict[str, Union[int, Union[str, List[Dict[str, str]]]]]:
-        """Fetch a bulk amount of items from the database
+    def generate_key_condition(
+        self,
+        partition_key_value: str,
+        sort_key_condition: SortKeyCondition = None,
+        index_name: str = None,
+    ) -> Tuple[str, Dict[str, str], Dict[str, Dict[str, str]]]:
+        """Used to generate the key condition for a query on the table or one of its indexes
+
+        Args:
+            partition_key_value (str): Value of the partition key to query
+            sort_key_condition (SortKeyCondition, optional): Condition on the sort key
+            index_name (str, optional): Name of an index declared in the table schema
+
+        Returns:
+            Tuple[str, Dict[str, str], Dict[str, Dict[str, str]]]: Returns the key_condition_expression string,
+            attribute_names and attribute_values
+        """
+        partition_key, sort_key = self.validation.key_attributes(index_name=index_name)
+        if sort_key_condition is not None and sort_key is None:
+            raise dynamodb_exceptions.DynamoDbInvalidQueryError
+        key_conditions = [
+            (
+                partition_key,
+                f"{self.validation.expression_mapping[partition_key]['expression_attribute_name']} = "
+                f"{self.validation.expression_mapping[partition_key]['expression_attribute_var']}",
+                {
+                    self.validation.expression_mapping[partition_key][
+                        "expression_attribute_var"
+                    ]: partition_key_value
+                },
+            )
+        ]
+        if sort_key_condition is not None:
+            key_conditions.append(
+                (
+                    sort_key,
+                    *sort_key_condition.render(
+                        expression_attribute_name=self.validation.expression_mapping[
+                            sort_key
+                        ]["expression_attribute_name"],
+                        expression_attribute_var=self.validation.expression_mapping[
+                            sort_key
+                        ]["expression_attribute_var"],
+                    ),
+                )
+            )
+
+        expression_attribute_names: Dict[str, str] = dict()
+        expression_attribute_values: Dict[str, Dict[str, str]] = dict()
+        for attribute, _, readable_values in key_conditions:
+            expression_attribute_names[
+                self.validation.expression_mapping[attribute]["expression_attribute_name"]
+            ] = attribute
+            for expression_attribute_var, value in readable_values.items():
+                expression_attribute_values[
+                    expression_attribute_var
+                ] = self.validation.validate_item_to_db_format(
+                    dynamodb_item={
+                        attribute: self.validation.validate_attribute_value(
+                            attribute=attribute, value=value
+                        )
+                    }
+                )[attribute]
+        return (
+            " AND ".join(condition for _, condition, _ in key_conditions),
+            expression_attribute_names,
+            expression_attribute_values,
+        )
+
+    def generate_filter_expression(
+        self, filter_condition: FilterCondition
+    ) -> Tuple[str, Dict[str, str], Dict[str, Dict[str, str]]]:
+        """Used to generate the filter expression of a scan, every attribute, operator and value is checked against the schema
+
+        Args:
+            filter_condition (FilterCondition): Condition the returned items must match
+
+        Returns:
+            Tuple[str, Dict[str, str], Dict[str, Dict[str, str]]]: Returns the filter_expression string,
+            attribute_names and attribute_values
+        """
+        return filter_condition.render(
+            expression_mapping=self.validation.expression_mapping,
+            type_tags=self.validation.codec.type_tags,
+            encode_value=lambda attribute, value, member: self.validation.encode_condition_value(
+                attribute=attribute, value=value, member=member
+            ),
+        )
+
+    def stream_query(
+        self,
+        partition_key_value: str,
+        sort_key_condition: SortKeyCondition = None,
+        index_name: str = None,
+        page_size: int = None,
+        max_pages: int = None,
+        max_items: int = None,
+        scan_forward: bool = True,
+        attributes: Iterable[str] = None,
+    ) -> Iterator[Dict[str, str]]:
+        """Stream the items matching a key condition in a readable format, fetching one page at a time
+
+        Exceptions are raised from the generator rather than returned as a status code.
+
+        Args:
+            partition_key_value (str): Value of the partition key to query
+            sort_key_condition (SortKeyCondition, optional): Condition on the sort key, such as SortKeyCondition.begins_with("2021-")
+            index_name (str, optional): Name of an index declared in the table schema
+            page_size (int, optional): Maximum number of items evaluated per query request
+            max_pages (int, optional): Stop after this many pages have been read
+            max_items (int, optional): Stop after this many items have been yielded
+            scan_forward (bool, optional): Order by the sort key ascending. Defaults to True.
+            attributes (Iterable[str], optional): Only read these attributes. Defaults to every attribute.
+
+        Yields:
+            Iterator[Dict[str, str]]: Matching items in a readable format
+        """
+        projection: Projection = self.read_projection(attributes)
+        (
+            key_condition_expression,
+            expression_attribute_names,
+            expression_attribute_values,
+        ) = self.generate_key_condition(
+            partition_key_value=partition_key_value,
+            sort_key_condition=sort_key_condition,
+            index_name=index_name,
+        )
+        if max_items is not None and (page_size is None or page_size > max_items):
+            page_size = max_items
+        items_yielded = 0
+        for page in self.query_pages(
+            key_condition_expression=key_condition_expression,
+            expression_attribute_names=expression_attribute_names,
+            expression_attribute_values=expression_attribute_values,
+            index_name=index_name,
+            page_size=page_size,
+            max_pages=max_pages,
+            scan_forward=scan_forward,
+            **self.projection_arguments(projection),
+        ):
+            if max_items is not None:
+                page = page[: max_items - items_yielded]
+            items_yielded += len(page)
+            yield from self.decode_items(dynamodb_items=page, projection=projection)
+            if max_items is not None and items_yielded >= max_items:
+                return
+
+    @timed("query_items")
+    def query_items(
+        self,
+        partition_key_value: str,
+        sort_key_condition: SortKeyCondition = None,
+        index_name: str = None,
+        page_size: int = None,
+        max_pages: int = None,
+        max_items: int = None,
+        scan_forward: bool = True,
+        attributes: Iterable[str] = None,
+    ) -> Dict[str, Union[int, Union[str, List[Dict[str, str]]]]]:
+        """Fetch the items matching a key condition from the table or one of its indexes
+
+        Args:
+            partition_key_value (str): Value of the partition key to query
+            sort_key_condition (SortKeyCondition, optional): Condition on the sort key, such as SortKeyCondition.between("a", "m")
+            index_name (str, optional): Name of an index declared in the table schema
+            page_size (int, optional): Maximum number of items evaluated per query request
+            max_pages (int, optional): Stop after this many pages have been read
+            max_items (int, optional): Stop after this many items have been fetched
+            scan_forward (bool, optional): Order by the sort key ascending. Defaults to True.
+            attributes (Iterable[str], optional): Only read these attributes. Defaults to every attribute.
 
         Returns:
             Dict[str, Union[int, Union[str, List[Dict[str, str]]]]]: Returns either a status code with a list of dictionaries or an error body
         """
         try:
-            unformated_table_items: List[Dict[str, Dict[str, str]]] = self.get_items()
-            formated_table_items: List[Dict[str, str]] = [
-                self.validation.validate_item_to_readable_format(table_item)
-                for table_item in unformated_table_items
-            ]
+            queried_items: List[Dict[str, str]] = list(
+                self.stream_query(
+                    partition_key_value=partition_key_value,
+                    sort_key_condition=sort_key_condition,
+                    index_name=index_name,
+                    page_size=page_size,
+                    max_pages=max_pages,
+                    max_items=max_items,
+                    scan_forward=scan_forward,
+                    attributes=attributes,
+                )
+            )
+            return {"statusCode": 200, "body": queried_items}
+        except self.client_exceptions as error:
+            self.metrics.record_error("query_items", error)
+            return {"statusCode": 400, "body": str(error)}
+
+    def stream_items(
+        self,
+        page_size: int = None,
+        max_pages: int = None,
+        max_items: int = None,
+        max_bytes: int = None,
+        total_segments: int = None,
+        max_workers: int = None,
+        ordered: bool = True,
+        attributes: Iterable[str] = None,
+        filter_condition: FilterCondition = None,
+    ) -> Iterator[Dict[str, str]]:
+        """Stream items from the table in a readable format, fetching one page at a time
+
+        Exceptions are raised from the generator rather than returned as a status code as the
+        pages are only requested while the generator is consumed.
+
+        Args:
+            page_size (int, optional): Maximum number of items evaluated per scan request
+            max_pages (int, optional): Stop after this many pages have been read, per segment when scanning in parallel
+            max_items (int, optional): Stop after this many items have been yielded
+            max_bytes (int, optional): Stop before the approximate size of the yielded items goes over this
+            total_segments (int, optional): Scan the table as this many segments in parallel
+            max_workers (int, optional): Threads used for a parallel scan. Defaults to one per segment.
+            ordered (bool, optional): Yield parallel segments in segment order. Defaults to True.
+            attributes (Iterable[str], optional): Only read these attributes. Defaults to every attribute.
+            filter_condition (FilterCondition, optional): Only return the items matching this condition, such as FilterCondition.eq("car", "Black Skoda")
+
+        Yields:
+            Iterator[Dict[str, str]]: Items from the table in a readable format
+        """
+        projection: Projection = self.read_projection(attributes)
+        read_arguments: Dict[str, Any] = self.projection_arguments(projection)
+        if filter_condition is not None:
+            (
+                read_arguments["filter_expression"],
+                read_arguments["filter_attribute_names"],
+                read_arguments["filter_attribute_values"],
+            ) = self.generate_filter_expression(filter_condition=filter_condition)
+        if max_items is not None and (page_size is None or page_size > max_items):
+            page_size = max_items
+        if total_segments and total_segments > 1:
+            pages: Iterator[List[Dict[str, Dict[str, str]]]] = self.parallel_scan_pages(
+                total_segments=total_segments,
+                max_workers=max_workers,
+                ordered=ordered,
+                page_size=page_size,
+                max_pages=max_pages,
+                **read_arguments,
+            )
+        else:
+            pages = self.scan_pages(
+                page_size=page_size, max_pages=max_pages, **read_arguments
+            )
+        items_yielded = 0
+        bytes_yielded = 0
+        for page in pages:
+            limit_reached = False
+            if max_items is not None:
+                page = page[: max_items - items_yielded]
+                limit_reached = items_yielded + len(page) >= max_items
+            if max_bytes is not None:
+                for index, table_item in enumerate(page):
+                    bytes_yielded += self.calculate_item_size(table_item)
+                    if bytes_yielded > max_bytes:
+                        page = page[:index]
+                        limit_reached = True
+                        break
+            items_yielded += len(page)
+            yield from self.decode_items(dynamodb_items=page, projection=projection)
+            if limit_reached:
+                pages.close()
+                return
+
+    @timed("fetch_items")
+    def fetch_items(
+        self,
+        page_size: int = None,
+        max_pages: int = None,
+        max_items: int = None,
+        max_bytes: int = None,
+        total_segments: int = None,
+        max_workers: int = None,
+        ordered: bool = True,
+        attributes: Iterable[str] = None,
+        filter_condition: FilterCondition = None,
+    ) -> Dict[str, Union[int, Union[str, List[Dict[str, str]]]]]:
+        """Fetch a bulk amount of items from the database, following every page of the scan
+
+        Args:
+            page_size (int, optional): Maximum number of items evaluated per scan request
+            max_pages (int, optional): Stop after this many pages have been read
+            max_items (int, optional): Stop after this many items have been fetched
+            max_bytes (int, optional): Stop before the approximate size of the fetched items goes over this
+            total_segments (int, optional): Scan the table as this many segments in parallel
+            max_workers (int, optional): Threads used for a parallel scan. Defaults to one per segment.
+            ordered (bool, optional): Return parallel segments in segment order. Defaults to True.
+            attributes (Iterable[str], optional): Only read these attributes. Defaults to every attribute.
+            filter_condition (FilterCondition, optional): Only return the items matching this condition
+
+        Returns:
+            Dict[str, Union[int, Union[str, List[Dict[str, str]]]]]: Returns either a status code with a list of dictionaries or an error body
+        """
+        try:
+            formated_table_items: List[Dict[str, str]] = list(
+                self.stream_items(
+                    page_size=page_size,
+                    max_pages=max_pages,
+                    max_items=max_items,
+                    max_bytes=max_bytes,
+                    total_segments=total_segments,
+                    max_workers=max_workers,
+                    ordered=ordered,
+                    attributes=attributes,
+                    filter_condition=filter_condition,
+                )
+            )
             return {"statusCode": 200, "body": formated_table_items}
         except self.client_exceptions as error:
+            self.metrics.record_error("fetch_items", error)
             return {"statusCode": 400, "body": str(error)}
 
-    def delete_item(self, key: Dict[str, str]) -> Dict[str, int]:
+    @timed("delete_item")
+    def delete_item(
+        self, key: Dict[str, str], expected_version: int = None
+    ) -> Dict[str, int]:
         """Delete an existing item from the database
 
         Args:
             key (Dict[str, str]): The key for the item in the database
+            expected_version (int, optional): Only delete while the item is at this version, required when the schema has a version_attribute
 
         Returns:
             Dict[str, int]: Returns a status code either passing or failing.
         """
         try:
-            validated_key: Dict[str, str] = self.validate_data(
-                validation_type="delete_item", unvalidated_data=key
+            key_values: Tuple[str, ...] = self.remove_existing_item(
+                key=key, expected_version=expected_version
             )
-            formated_key: Dict[
-                str, Dict[str, str]
-            ] = self.validation.validate_item_to_db_format(dynamodb_item=validated_key)
-            self.remove_item(key=formated_key)
             return {
                 "statusCode": 200,
-                "body": f"Item with key: {validated_key[list(self.validation.key_template.keys())[0]]} has been deleted",
+                "body": f"Item with key: {self.readable_key(key_values)} has been deleted",
             }
         except self.client_exceptions as error:
+            self.metrics.record_error("delete_item", error)
             return {"statusCode": 400, "body": str(error)}
+
+    def remove_existing_item(
+        self, key: Dict[str, str], expected_version: int = None
+    ) -> Tuple[str, ...]:
+        """The delete behind delete_item, raising the exception rather than returning a status code
+
+        Args:
+            key (Dict[str, str]): The key for the item in the database
+            expected_version (int, optional): Only delete while the item is at this version, required when the schema has a version_attribute
+
+        Returns:
+            Tuple[str, ...]: Returns the key values of the item that was deleted
+        """
+        validated_key: Dict[str, str] = self.validate_data(
+            validation_type="delete_item", unvalidated_data=key
+        )
+        key_values: Tuple[str, ...] = self.key_values(validated_key)
+        if self.validation.version_attribute is not None and expected_version is None:
+            raise dynamodb_exceptions.ValidationMissingVersionError(data="delete_item")
+        formated_key: Dict[
+            str, Dict[str, str]
+        ] = self.validation.validate_item_to_db_format(dynamodb_item=validated_key)
+        condition_arguments: Dict[str, Union[str, Dict[str, str]]] = dict()
+        if expected_version is not None:
+            condition_arguments = self.generate_version_condition_arguments(
+                expected_version=expected_version
+            )
+        try:
+            self.remove_item(key=formated_key, **condition_arguments)
+        except dynamodb_exceptions.DynamoDbWrongKeyError as error:
+            if expected_version is None:
+                raise
+            raise dynamodb_exceptions.DynamoDbVersionConflictError(
+                data=expected_version
+            ) from error
+        finally:
+            self.invalidate_cached_item(key_values=key_values)
+        return key_values
+
+    @timed("delete_items")
+    def delete_items(
+        self, keys: Iterable[Dict[str, str]]
+    ) -> Dict[str, Union[int, List[Dict[str, Union[int, str]]]]]:
+        """Delete many existing items from the table using batch_write_item. Batch writes cannot be conditional, so
+        when the schema has a version_attribute each key must also hold the version of its item and each item is
+        deleted with its own conditional delete like delete_item
+
+        Args:
+            keys (Iterable[Dict[str, str]]): The keys for the items in the database
+
+        Returns:
+            Dict[str, Union[int, List[Dict[str, Union[int, str]]]]]: An overall status code and a body with the
+            status code and message for every key in the order they were given
+        """
+        results: List[Dict[str, Union[int, str]]] = list()
+        version_attribute: str = self.validation.version_attribute
+        if version_attribute is not None:
+            for key in keys:
+                key = dict(key)
+                try:
+                    key_values: Tuple[str, ...] = self.remove_existing_item(
+                        key=key, expected_version=key.pop(version_attribute, None)
+                    )
+                except self.client_exceptions as error:
+                    results.append({"statusCode": 400, "body": str(error)})
+                    continue
+                results.append(
+                    {
+                        "statusCode": 200,
+                        "body": f"Item with key: {self.readable_key(key_values)} has been deleted",
+                    }
+                )
+            return {"statusCode": self.batch_status_code(results), "body": results}
+        write_requests: List[Tuple[int, Tuple[str, ...], Dict[str, dict]]] = list()
+        for index, key in enumerate(keys):
+            results.append(None)
+            try:
+                validated_key: Dict[str, str] = self.validate_data(
+                    validation_type="delete_item", unvalidated_data=key
+                )
+                formated_key: Dict[
+                    str, Dict[str, str]
+                ] = self.validation.validate_item_to_db_format(
+                    dynamodb_item=validated_key
+                )
+            except self.client_exceptions as error:
+                results[index] = {"statusCode": 400, "body": str(error)}
+                continue
+            write_requests.append(
+                (
+                    index,
+                    self.key_values(validated_key),
+                    {"DeleteRequest": {"Key": formated_key}},
+                )
+            )
+
+        self.push_write_requests(
+            write_requests=write_requests,
+            results=results,
+            success_body=lambda key_values: f"Item with key: {self.readable_key(key_values)} has been deleted",
+        )
+        return {"statusCode": self.batch_status_code(results), "body": results}
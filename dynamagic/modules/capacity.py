@@ -0,0 +1,125 @@
+from typing import Dict, List, Tuple, Union
+import threading
+from dynamagic.modules.exceptions import ValidationWrongCapacityModeError
+
+
+class CapacityTracker:
+    """Aggregates the capacity DynamoDB reports with ReturnConsumedCapacity per operation, table
+    and index, and turns it into a cost report using on-demand request unit prices.
+
+    With the TOTAL mode capacity is attributed to the index the request named, with INDEXES
+    DynamoDB splits it between the table and each index it touched. Prices are per million
+    request units."""
+
+    capacity_modes = ("TOTAL", "INDEXES")
+    read_operations = frozenset({"get_item", "batch_get_item", "scan", "query"})
+
+    def __init__(
+        self,
+        mode: str = "TOTAL",
+        read_unit_price: float = 0.125,
+        write_unit_price: float = 0.625,
+    ) -> None:
+        if mode not in self.capacity_modes:
+            raise ValidationWrongCapacityModeError(data=mode)
+        self.mode = mode
+        self.read_unit_price = read_unit_price
+        self.write_unit_price = write_unit_price
+        self.lock = threading.Lock()
+        self.capacity: Dict[Tuple[str, str, str], Dict[str, float]] = dict()
+
+    def add(
+        self, operation: str, table_name: str, index_name: str, capacity_units: float
+    ) -> None:
+        usage = self.capacity.get((operation, table_name, index_name))
+        if usage is None:
+            usage = self.capacity[(operation, table_name, index_name)] = {
+                "calls": 0,
+                "capacity_units": 0.0,
+            }
+        usage["calls"] += 1
+        usage["capacity_units"] += capacity_units
+
+    def record(
+        self,
+        operation: str,
+        consumed_capacity: Union[Dict[str, dict], List[Dict[str, dict]]],
+        index_name: str = None,
+    ) -> None:
+        """Add the ConsumedCapacity of one response
+
+        Args:
+            operation (str): Name of the client method such as update_item
+            consumed_capacity (Union[Dict[str, dict], List[Dict[str, dict]]]): ConsumedCapacity from the response,
+            a list for batch operations
+            index_name (str, optional): The index named by the request
+        """
+        if isinstance(consumed_capacity, dict):
+            consumed_capacity = [consumed_capacity]
+        with self.lock:
+            for table_capacity in consumed_capacity:
+                table_name = table_capacity.get("TableName")
+                index_capacities = {
+                    **table_capacity.get("GlobalSecondaryIndexes", {}),
+                    **table_capacity.get("LocalSecondaryIndexes", {}),
+                }
+                if self.mode == "TOTAL" or not (
+                    "Table" in table_capacity or index_capacities
+                ):
+                    self.add(
+                        operation,
+                        table_name,
+                        index_name,
+                        table_capacity.get("CapacityUnits", 0.0),
+                    )
+                    continue
+                if "Table" in table_capacity:
+                    self.add(
+                        operation,
+                        table_name,
+                        None,
+                        table_capacity["Table"].get("CapacityUnits", 0.0),
+                    )
+                for consumed_index, index_capacity in index_capacities.items():
+                    self.add(
+                        operation,
+                        table_name,
+                        consumed_index,
+                        index_capacity.get("CapacityUnits", 0.0),
+                    )
+
+    def reset(self) -> None:
+        with self.lock:
+            self.capacity.clear()
+
+    def report(self) -> Dict[str, Union[float, List[Dict[str, Union[str, float]]]]]:
+        """Capacity and estimated cost so far, the most expensive operations first
+
+        Returns:
+            Dict[str, Union[float, List[Dict[str, Union[str, float]]]]]: A row for every operation, table and index
+            along with the totals
+        """
+        with self.lock:
+            usage_rows = list()
+            for (operation, table_name, index_name), usage in self.capacity.items():
+                is_read = operation in self.read_operations
+                usage_rows.append(
+                    {
+                        "operation": operation,
+                        "table": table_name,
+                        "index": index_name,
+                        "calls": usage["calls"],
+                        "read_capacity_units": usage["capacity_units"] if is_read else 0.0,
+                        "write_capacity_units": 0.0 if is_read else usage["capacity_units"],
+                        "estimated_cost": usage["capacity_units"]
+                        * (self.read_unit_price if is_read else self.write_unit_price)
+                        / 1000000,
+                    }
+                )
+        usage_rows.sort(key=lambda usage_row: usage_row["estimated_cost"], reverse=True)
+        return {
+            "operations": usage_rows,
+            "read_capacity_units": sum(row["read_capacity_units"] for row in usage_rows),
+            "write_capacity_units": sum(row["write_capacity_units"] for row in usage_rows),
+            "estimated_cost": sum(row["estimated_cost"] for row in usage_rows),
+        }
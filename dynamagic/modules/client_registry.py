@@ -0,0 +1,216 @@
+from typing import TYPE_CHECKING, Any, Dict, Tuple
+import os
+import threading
+from dynamagic.modules.retry import RetryPolicy
+
+if TYPE_CHECKING:
+    from boto3.session import Session
+    from botocore.config import Config
+
+
+class ClientRegistry:
+    """Process wide store of boto3 dynamodb clients so every table shares one client,
+    and with it one HTTP connection pool, per region, endpoint, config and credentials, and of one
+    RetryPolicy per table so its retry budget and rate limit cover every client of the table.
+    Clients are built with botocore's own retries switched off so the RetryPolicy is the only retry layer.
+    boto3 is only imported when the first client is created to keep cold starts short."""
+
+    botocore_retries = {"mode": "standard", "total_max_attempts": 1}
+
+    def __init__(self) -> None:
+        self.clients: Dict[Tuple[Any, ...], object] = dict()
+        self.retry_policies: Dict[Tuple[Any, ...], RetryPolicy] = dict()
+        self.lock = threading.Lock()
+
+    @staticmethod
+    def default_region() -> str:
+        return (
+            os.environ.get("AWS_DEFAULT_REGION")
+            if os.environ.get("AWS_DEFAULT_REGION")
+            else "eu-west-2"
+        )
+
+    @staticmethod
+    def build_config(
+        max_pool_connections: int = None,
+        tcp_keepalive: bool = None,
+        connect_timeout: float = None,
+        read_timeout: float = None,
+    ) -> "Config":
+        """Build a botocore Config with the connection settings that matter for reusing clients
+
+        Args:
+            max_pool_connections (int, optional): Maximum connections kept in the HTTP pool. Defaults to botocore's 10.
+            tcp_keepalive (bool, optional): Turn on TCP keep-alive for the pooled connections
+            connect_timeout (float, optional): Seconds to wait when opening a connection
+            read_timeout (float, optional): Seconds to wait for a response
+
+        Returns:
+            Config: Config with only the options that were provided
+        """
+        from botocore.config import Config
+
+        config_options = {
+            "max_pool_connections": max_pool_connections,
+            "tcp_keepalive": tcp_keepalive,
+            "connect_timeout": connect_timeout,
+            "read_timeout": read_timeout,
+        }
+        return Config(
+            **{
+                option: value
+                for option, value in config_options.items()
+                if value is not None
+            }
+        )
+
+    @classmethod
+    def config_identity(cls, config: "Config" = None) -> Tuple[Tuple[str, str], ...]:
+        """Every public option of a config, two callers only share a client when all of them match"""
+        if config is None:
+            return ()
+        return tuple(
+            (option, repr(cls.comparable_option(getattr(config, option, None))))
+            for option in sorted(type(config).OPTION_DEFAULTS)
+        )
+
+    @classmethod
+    def comparable_option(cls, value: Any) -> Any:
+        """A config option with its dicts sorted, so {"a": 1, "b": 2} and {"b": 2, "a": 1} compare equal"""
+        if isinstance(value, dict):
+            return sorted(
+                (key, cls.comparable_option(member)) for key, member in value.items()
+            )
+        return value
+
+    @staticmethod
+    def credentials_identity(session: "Session" = None) -> Tuple[str, str]:
+        """The profile and access key a client signs requests with, so callers with different
+        credentials never share a client. Without a session the environment decides the credentials"""
+        if session is None:
+            return (
+                os.environ.get("AWS_PROFILE", ""),
+                os.environ.get("AWS_ACCESS_KEY_ID", ""),
+            )
+        credentials = session.get_credentials()
+        return (
+            session.profile_name or "",
+            credentials.access_key if credentials is not None else "",
+        )
+
+    def registry_key(
+        self,
+        region_name: str = None,
+        endpoint_url: str = None,
+        config: "Config" = None,
+        session: "Session" = None,
+    ) -> Tuple[Any, ...]:
+        return (
+            region_name
+            or (session.region_name if session is not None else None)
+            or self.default_region(),
+            endpoint_url or "",
+            self.config_identity(config),
+            self.credentials_identity(session),
+        )
+
+    def get_client(
+        self,
+        region_name: str = None,
+        endpoint_url: str = None,
+        config: "Config" = None,
+        session: "Session" = None,
+    ) -> object:
+        """Get the shared client for these settings, creating it the first time they are used
+
+        Args:
+            region_name (str, optional): Defaults to the region of the session, AWS_DEFAULT_REGION or eu-west-2
+            endpoint_url (str, optional): Custom endpoint such as dynamodb local
+            config (Config, optional): botocore Config, see build_config
+            session (Session, optional): boto3 Session to create the client from, such as one for another profile
+
+        Returns:
+            object: boto3 dynamodb client
+        """
+        registry_key = self.registry_key(
+            region_name=region_name,
+            endpoint_url=endpoint_url,
+            config=config,
+            session=session,
+        )
+        client = self.clients.get(registry_key)
+        if client is not None:
+            return client
+        with self.lock:
+            if registry_key not in self.clients:
+                if session is None:
+                    import boto3
+
+                    create_client = boto3.client
+                else:
+                    create_client = session.client
+                from botocore.config import Config
+
+                client_config = Config(retries=self.botocore_retries)
+                self.clients[registry_key] = create_client(
+                    "dynamodb",
+                    region_name=registry_key[0],
+                    endpoint_url=endpoint_url,
+                    config=client_config.merge(config) if config else client_config,
+                )
+            return self.clients[registry_key]
+
+    def get_retry_policy(
+        self,
+        dynamodb_table: str,
+        region_name: str = None,
+        endpoint_url: str = None,
+        session: "Session" = None,
+    ) -> RetryPolicy:
+        """Get the shared RetryPolicy of a table, creating it the first time the table is used
+
+        Args:
+            dynamodb_table (str): Name of the table
+            region_name (str, optional): Defaults to the region of the session, AWS_DEFAULT_REGION or eu-west-2
+            endpoint_url (str, optional): Custom endpoint such as dynamodb local
+            session (Session, optional): boto3 Session the table is reached with
+
+        Returns:
+            RetryPolicy: The policy every client of the table retries through
+        """
+        region_name, endpoint_url, _, credentials_identity = self.registry_key(
+            region_name=region_name, endpoint_url=endpoint_url, session=session
+        )
+        policy_key = (region_name, endpoint_url, credentials_identity, dynamodb_table)
+        with self.lock:
+            if policy_key not in self.retry_policies:
+                self.retry_policies[policy_key] = RetryPolicy()
+            return self.retry_policies[policy_key]
+
+    def register_client(
+        self,
+        client: object,
+        region_name: str = None,
+        endpoint_url: str = None,
+        config: "Config" = None,
+        session: "Session" = None,
+    ) -> None:
+        """Inject an existing client so it is shared for these settings"""
+        with self.lock:
+            self.clients[
+                self.registry_key(
+                    region_name=region_name,
+                    endpoint_url=endpoint_url,
+                    config=config,
+                    session=session,
+                )
+            ] = client
+
+    def clear(self) -> None:
+        """Forget every shared client and retry policy, new ones are created on the next use"""
+        with self.lock:
+            self.clients.clear()
+            self.retry_policies.clear()
+
+
+client_registry = ClientRegistry()
@@ -0,0 +1,99 @@
+from typing import Any, Callable, Dict, Iterable, Union, get_args, get_origin
+from dynamagic.modules.exceptions import (
+    ValidationWrongKeyError,
+    ValidationMissingKeyError,
+    ValidationIncorrectKeyTypeError,
+)
+
+
+class CompiledSchema:
+    """Validates items against a table schema without the schema package, the attribute
+    sets and coercion function for every attribute are worked out once when it is built"""
+
+    def __init__(
+        self, attribute_types: Dict[str, type], required_attributes: Iterable[str]
+    ) -> None:
+        self.coercers: Dict[str, Callable[[Any], Any]] = {
+            attribute: self.compile_coercer(data_type)
+            for attribute, data_type in attribute_types.items()
+        }
+        self.attribute_names = frozenset(attribute_types)
+        self.required_attributes = frozenset(required_attributes)
+        self.required_order = tuple(
+            attribute
+            for attribute in attribute_types
+            if attribute in self.required_attributes
+        )
+
+    @staticmethod
+    def compile_coercer(data_type: Union[type, Any]) -> Callable[[Any], Any]:
+        """Build the function that converts a value to the schema type, typed lists and
+        sets such as List[int] convert each of their members
+
+        Args:
+            data_type (Union[type, Any]): Type from the table schema
+
+        Returns:
+            Callable[[Any], Any]: Converts a value or raises TypeError or ValueError
+        """
+        if data_type is Any:
+            return lambda value: value
+        container_type = get_origin(data_type)
+        if container_type is dict:
+            return dict
+        if container_type in (list, set, frozenset):
+            member_types = get_args(data_type)
+            if not member_types:
+                return container_type
+            member_coercer = CompiledSchema.compile_coercer(member_types[0])
+
+            def coerce_members(value: Iterable[Any]) -> Any:
+                if isinstance(value, (str, bytes)):
+                    raise TypeError(f"{value!r} is not a collection")
+                return container_type(member_coercer(member) for member in value)
+
+            return coerce_members
+        return data_type
+
+    def validate(self, unvalidated_item: Dict[str, Any]) -> Union[Dict[str, Any], Exception]:
+        """Validate and convert an item, errors are checked in the same order as the schema package:
+        values that cannot be converted, then missing attributes, then unknown attributes
+
+        Args:
+            unvalidated_item (Dict[str, Any]): Item to validate
+
+        Returns:
+            Union[Dict[str, Any], Exception]: The item with every value converted to the schema type
+        """
+        if not isinstance(unvalidated_item, dict):
+            raise ValidationIncorrectKeyTypeError(data=repr(unvalidated_item))
+
+        coercers = self.coercers
+        validated_item = dict()
+        unknown_attributes = list()
+        for attribute, value in unvalidated_item.items():
+            coercer = coercers.get(attribute)
+            if coercer is None:
+                unknown_attributes.append(attribute)
+                continue
+            try:
+                validated_item[attribute] = coercer(value)
+            except (TypeError, ValueError) as error:
+                raise ValidationIncorrectKeyTypeError(
+                    data=repr(attribute), attributes=[attribute]
+                ) from error
+
+        if not self.required_attributes.issubset(validated_item.keys()):
+            missing_attributes = [
+                attribute
+                for attribute in self.required_order
+                if attribute not in validated_item
+            ]
+            raise ValidationMissingKeyError(
+                data=repr(missing_attributes[0]), attributes=missing_attributes
+            )
+        if unknown_attributes:
+            raise ValidationWrongKeyError(
+                data=repr(unknown_attributes[0]), attributes=unknown_attributes
+            )
+        return validated_item
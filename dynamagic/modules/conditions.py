@@ -0,0 +1,358 @@
+from decimal import Decimal
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
+from dynamagic.modules.exceptions import (
+    ValidationIncorrectAttributeError,
+    ValidationInvalidFilterError,
+)
+
+
+class SortKeyCondition:
+    """Condition on the sort key of a query, built with one of the class methods such as
+    SortKeyCondition.begins_with("2021-") and rendered into a KeyConditionExpression"""
+
+    comparison_operators = {"eq": "=", "lt": "<", "lte": "<=", "gt": ">", "gte": ">="}
+
+    def __init__(self, operator: str, values: Tuple[Any, ...]) -> None:
+        self.operator = operator
+        self.values = values
+
+    def __eq__(self, other: object) -> bool:
+        return (
+            isinstance(other, SortKeyCondition)
+            and self.operator == other.operator
+            and self.values == other.values
+        )
+
+    def __repr__(self) -> str:
+        return f"SortKeyCondition({self.operator!r}, {self.values!r})"
+
+    @classmethod
+    def eq(cls, value: Any) -> "SortKeyCondition":
+        return cls("eq", (value,))
+
+    @classmethod
+    def lt(cls, value: Any) -> "SortKeyCondition":
+        return cls("lt", (value,))
+
+    @classmethod
+    def lte(cls, value: Any) -> "SortKeyCondition":
+        return cls("lte", (value,))
+
+    @classmethod
+    def gt(cls, value: Any) -> "SortKeyCondition":
+        return cls("gt", (value,))
+
+    @classmethod
+    def gte(cls, value: Any) -> "SortKeyCondition":
+        return cls("gte", (value,))
+
+    @classmethod
+    def between(cls, lower_value: Any, upper_value: Any) -> "SortKeyCondition":
+        return cls("between", (lower_value, upper_value))
+
+    @classmethod
+    def begins_with(cls, prefix: Any) -> "SortKeyCondition":
+        return cls("begins_with", (prefix,))
+
+    def render(
+        self, expression_attribute_name: str, expression_attribute_var: str
+    ) -> Tuple[str, Dict[str, Any]]:
+        """Render the condition using the placeholders of the sort key
+
+        Args:
+            expression_attribute_name (str): Placeholder for the sort key name, such as #C
+            expression_attribute_var (str): Placeholder for the sort key value, such as :c
+
+        Returns:
+            Tuple[str, Dict[str, Any]]: The condition and the readable value for each value placeholder
+        """
+        if self.operator == "between":
+            lower_var = f"{expression_attribute_var}_0"
+            upper_var = f"{expression_attribute_var}_1"
+            return (
+                f"{expression_attribute_name} BETWEEN {lower_var} AND {upper_var}",
+                {lower_var: self.values[0], upper_var: self.values[1]},
+            )
+        if self.operator == "begins_with":
+            return (
+                f"begins_with({expression_attribute_name}, {expression_attribute_var})",
+                {expression_attribute_var: self.values[0]},
+            )
+        return (
+            f"{expression_attribute_name} {self.comparison_operators[self.operator]} {expression_attribute_var}",
+            {expression_attribute_var: self.values[0]},
+        )
+
+
+class FilterCondition:
+    """Condition on the attributes of the items a scan returns, built with one of the class methods such as
+    FilterCondition.eq("car", "Black Skoda"), combined with &, | and ~ and rendered into a FilterExpression
+    so only the matching items are sent back"""
+
+    comparison_operators = {
+        "eq": "=",
+        "ne": "<>",
+        "lt": "<",
+        "lte": "<=",
+        "gt": ">",
+        "gte": ">=",
+    }
+    max_in_values = 100
+    operator_type_tags = {
+        "lt": ("S", "N", "B"),
+        "lte": ("S", "N", "B"),
+        "gt": ("S", "N", "B"),
+        "gte": ("S", "N", "B"),
+        "between": ("S", "N", "B"),
+        "begins_with": ("S", "B"),
+        "contains": ("S", "B", "SS", "NS", "BS", "L"),
+    }
+
+    def __init__(
+        self,
+        operator: str,
+        attribute: str = None,
+        values: Tuple[Any, ...] = (),
+        conditions: Tuple["FilterCondition", ...] = (),
+    ) -> None:
+        self.operator = operator
+        self.attribute = attribute
+        self.values = values
+        self.conditions = conditions
+
+    def __eq__(self, other: object) -> bool:
+        return (
+            isinstance(other, FilterCondition)
+            and self.operator == other.operator
+            and self.attribute == other.attribute
+            and self.values == other.values
+            and self.conditions == other.conditions
+        )
+
+    def __repr__(self) -> str:
+        if self.conditions:
+            return f"FilterCondition({self.operator!r}, {self.conditions!r})"
+        return f"FilterCondition({self.operator!r}, {self.attribute!r}, {self.values!r})"
+
+    def __and__(self, other: "FilterCondition") -> "FilterCondition":
+        return self.and_(self, other)
+
+    def __or__(self, other: "FilterCondition") -> "FilterCondition":
+        return self.or_(self, other)
+
+    def __invert__(self) -> "FilterCondition":
+        return self.not_(self)
+
+    @classmethod
+    def eq(cls, attribute: str, value: Any) -> "FilterCondition":
+        return cls("eq", attribute, (value,))
+
+    @classmethod
+    def ne(cls, attribute: str, value: Any) -> "FilterCondition":
+        return cls("ne", attribute, (value,))
+
+    @classmethod
+    def lt(cls, attribute: str, value: Any) -> "FilterCondition":
+        return cls("lt", attribute, (value,))
+
+    @classmethod
+    def lte(cls, attribute: str, value: Any) -> "FilterCondition":
+        return cls("lte", attribute, (value,))
+
+    @classmethod
+    def gt(cls, attribute: str, value: Any) -> "FilterCondition":
+        return cls("gt", attribute, (value,))
+
+    @classmethod
+    def gte(cls, attribute: str, value: Any) -> "FilterCondition":
+        return cls("gte", attribute, (value,))
+
+    @classmethod
+    def between(
+        cls, attribute: str, lower_value: Any, upper_value: Any
+    ) -> "FilterCondition":
+        return cls("between", attribute, (lower_value, upper_value))
+
+    @classmethod
+    def begins_with(cls, attribute: str, prefix: Any) -> "FilterCondition":
+        return cls("begins_with", attribute, (prefix,))
+
+    @classmethod
+    def contains(cls, attribute: str, value: Any) -> "FilterCondition":
+        """Part of a string, or a member of a set or list attribute"""
+        return cls("contains", attribute, (value,))
+
+    @classmethod
+    def is_in(cls, attribute: str, values: Iterable[Any]) -> "FilterCondition":
+        return cls("in", attribute, tuple(values))
+
+    @classmethod
+    def attribute_exists(cls, attribute: str) -> "FilterCondition":
+        return cls("attribute_exists", attribute)
+
+    @classmethod
+    def attribute_not_exists(cls, attribute: str) -> "FilterCondition":
+        return cls("attribute_not_exists", attribute)
+
+    @classmethod
+    def and_(cls, *conditions: "FilterCondition") -> "FilterCondition":
+        return cls("and", conditions=cls.flatten("and", conditions))
+
+    @classmethod
+    def or_(cls, *conditions: "FilterCondition") -> "FilterCondition":
+        return cls("or", conditions=cls.flatten("or", conditions))
+
+    @classmethod
+    def not_(cls, condition: "FilterCondition") -> "FilterCondition":
+        return cls("not", conditions=(condition,))
+
+    @staticmethod
+    def flatten(
+        operator: str, conditions: Iterable["FilterCondition"]
+    ) -> Tuple["FilterCondition", ...]:
+        """Join nested conditions with the same operator so a & b & c renders without extra brackets"""
+        flat_conditions: List[FilterCondition] = list()
+        for condition in conditions:
+            if condition.operator == operator:
+                flat_conditions.extend(condition.conditions)
+            else:
+                flat_conditions.append(condition)
+        return tuple(flat_conditions)
+
+    def render(
+        self,
+        expression_mapping: Dict[str, Dict[str, str]],
+        type_tags: Dict[str, Optional[str]],
+        encode_value: Callable[[str, Any, bool], Dict[str, Any]],
+    ) -> Tuple[str, Dict[str, str], Dict[str, Dict[str, Any]]]:
+        """Render the condition using the placeholders of the attributes, checking every operator against the
+        type of its attribute. Each value uses the value placeholder of its attribute with a _N suffix so an
+        attribute can be compared more than once
+
+        Args:
+            expression_mapping (Dict[str, Dict[str, str]]): The placeholders of every attribute in the schema
+            type_tags (Dict[str, Optional[str]]): The DynamoDB type tag of every attribute, None when it can hold any type
+            encode_value (Callable[[str, Any, bool], Dict[str, Any]]): Validates a value against its attribute and converts it
+                to the DynamoDB format, told whether the value is looked for inside the attribute
+
+        Returns:
+            Tuple[str, Dict[str, str], Dict[str, Dict[str, Any]]]: The condition, the attribute names and the attribute values
+        """
+        expression_attribute_names: Dict[str, str] = dict()
+        expression_attribute_values: Dict[str, Dict[str, Any]] = dict()
+        value_counts: Dict[str, int] = dict()
+        return (
+            self.render_condition(
+                expression_mapping=expression_mapping,
+                type_tags=type_tags,
+                encode_value=encode_value,
+                expression_attribute_names=expression_attribute_names,
+                expression_attribute_values=expression_attribute_values,
+                value_counts=value_counts,
+            ),
+            expression_attribute_names,
+            expression_attribute_values,
+        )
+
+    @staticmethod
+    def comparable_value(dynamodb_value: Dict[str, Any]) -> Any:
+        """The value DynamoDB orders by, numbers by their size and strings and binary by their bytes"""
+        for dynamodb_type, value in dynamodb_value.items():
+            return Decimal(value) if dynamodb_type == "N" else value
+
+    def render_condition(
+        self,
+        expression_mapping: Dict[str, Dict[str, str]],
+        type_tags: Dict[str, Optional[str]],
+        encode_value: Callable[[str, Any, bool], Dict[str, Any]],
+        expression_attribute_names: Dict[str, str],
+        expression_attribute_values: Dict[str, Dict[str, Any]],
+        value_counts: Dict[str, int],
+    ) -> str:
+        if self.operator in ("and", "or", "not"):
+            if not self.conditions:
+                raise ValidationInvalidFilterError(
+                    data=f"{self.operator} needs at least one condition"
+                )
+            rendered_conditions = [
+                condition.render_condition(
+                    expression_mapping=expression_mapping,
+                    type_tags=type_tags,
+                    encode_value=encode_value,
+                    expression_attribute_names=expression_attribute_names,
+                    expression_attribute_values=expression_attribute_values,
+                    value_counts=value_counts,
+                )
+                for condition in self.conditions
+            ]
+            if self.operator == "not":
+                return f"NOT ({rendered_conditions[0]})"
+            return f" {self.operator.upper()} ".join(
+                f"({rendered_condition})"
+                if condition.operator in ("and", "or")
+                else rendered_condition
+                for condition, rendered_condition in zip(
+                    self.conditions, rendered_conditions
+                )
+            )
+
+        try:
+            expression_placeholders: Dict[str, str] = expression_mapping[
+                self.attribute
+            ]
+        except KeyError as error:
+            raise ValidationIncorrectAttributeError(data=self.attribute) from error
+        expression_attribute_name: str = expression_placeholders[
+            "expression_attribute_name"
+        ]
+        expression_attribute_names[expression_attribute_name] = self.attribute
+        if self.operator == "in" and not 0 < len(self.values) <= self.max_in_values:
+            raise ValidationInvalidFilterError(
+                data=f"in needs between 1 and {self.max_in_values} values and has {len(self.values)}"
+            )
+        supported_type_tags = self.operator_type_tags.get(self.operator)
+        type_tag: Optional[str] = type_tags.get(self.attribute)
+        if supported_type_tags and type_tag is not None and type_tag not in supported_type_tags:
+            raise ValidationInvalidFilterError(
+                data=f"{self.operator} cannot be used on {self.attribute} as it is stored as {type_tag}"
+            )
+        expression_attribute_vars: List[str] = list()
+        for value in self.values:
+            value_count = value_counts.get(self.attribute, 0)
+            value_counts[self.attribute] = value_count + 1
+            expression_attribute_var = (
+                f"{expression_placeholders['expression_attribute_var']}_{value_count}"
+            )
+            expression_attribute_values[expression_attribute_var] = encode_value(
+                self.attribute, value, self.operator == "contains"
+            )
+            expression_attribute_vars.append(expression_attribute_var)
+
+        if self.operator in ("attribute_exists", "attribute_not_exists"):
+            return f"{self.operator}({expression_attribute_name})"
+        if self.operator in ("begins_with", "contains"):
+            return (
+                f"{self.operator}({expression_attribute_name}, "
+                f"{expression_attribute_vars[0]})"
+            )
+        if self.operator == "between":
+            lower_value, upper_value = (
+                expression_attribute_values[expression_attribute_var]
+                for expression_attribute_var in expression_attribute_vars
+            )
+            if lower_value.keys() == upper_value.keys() and self.comparable_value(
+                lower_value
+            ) > self.comparable_value(upper_value):
+                raise ValidationInvalidFilterError(
+                    data=f"between on {self.attribute} needs the lower value first"
+                )
+            return (
+                f"{expression_attribute_name} BETWEEN {expression_attribute_vars[0]} "
+                f"AND {expression_attribute_vars[1]}"
+            )
+        if self.operator == "in":
+            return f"{expression_attribute_name} IN ({', '.join(expression_attribute_vars)})"
+        return (
+            f"{expression_attribute_name} {self.comparison_operators[self.operator]} "
+            f"{expression_attribute_vars[0]}"
+        )
@@ -1,47 +1,299 @@
-from botocore.exceptions import ParamValidationError
-from typing import Dict, List, Union
-import boto3
-import os
+from functools import cached_property
+from typing import TYPE_CHECKING, Dict, Iterator, List, Tuple, Union
+import queue
+import threading
+import time
 from dynamagic.modules.exceptions import (
     DynamoDbWrongKeyError,
     ValidationIncorrectAttributeError,
     DynamoDbInvalidTableError,
     DynamoDbWrongKeyFormatError,
+    DynamoDbInvalidQueryError,
+    DynamoDbInvalidScanError,
+    DynamoDbTransactionCanceledError,
+    DynamoDbTransactionConflictError,
+    DynamoDbIdempotencyMismatchError,
 )
+from dynamagic.modules.client_registry import client_registry
+from dynamagic.modules.capacity import CapacityTracker
+from dynamagic.modules.metrics import MetricsRecorder, null_metrics
+from dynamagic.modules.retry import RetryPolicy, calculate_backoff
+
+if TYPE_CHECKING:
+    from boto3.session import Session
+    from botocore.config import Config
 
 
 class DynamodbApi:
-    def __init__(self, dynamodb_table: str) -> None:
-        self.client = boto3.client("dynamodb",
-        region_name=os.environ.get("AWS_DEFAULT_REGION") if os.environ.get("AWS_DEFAULT_REGION") else "eu-west-2")
+    capacity_operations = frozenset(
+        {
+            "put_item",
+            "update_item",
+            "delete_item",
+            "get_item",
+            "batch_write_item",
+            "batch_get_item",
+            "scan",
+            "query",
+            "transact_write_items",
+        }
+    )
+
+    def __init__(
+        self,
+        dynamodb_table: str,
+        client: object = None,
+        region_name: str = None,
+        endpoint_url: str = None,
+        client_config: "Config" = None,
+        session: "Session" = None,
+        retry_policy: RetryPolicy = None,
+        metrics: MetricsRecorder = None,
+        capacity_tracker: CapacityTracker = None,
+    ) -> None:
+        if client is not None:
+            self.client = client
+        self.region_name = region_name
+        self.endpoint_url = endpoint_url
+        self.client_config = client_config
+        self.session = session
         self.dynamodb_table = dynamodb_table
+        self.retry_policy = (
+            retry_policy
+            if retry_policy is not None
+            else client_registry.get_retry_policy(
+                dynamodb_table=dynamodb_table,
+                region_name=region_name,
+                endpoint_url=endpoint_url,
+                session=session,
+            )
+        )
+        self.metrics = metrics if metrics is not None else null_metrics
+        self.capacity_tracker = capacity_tracker
+
+    @cached_property
+    def client(self) -> object:
+        """The boto3 client, taken from the client registry the first time an operation needs it"""
+        return client_registry.get_client(
+            region_name=self.region_name,
+            endpoint_url=self.endpoint_url,
+            config=self.client_config,
+            session=self.session,
+        )
+
+    @cached_property
+    def param_validation_error(self) -> type:
+        """botocore's ParamValidationError, looked up once boto3 has already been imported by the client"""
+        from botocore.exceptions import ParamValidationError
+
+        return ParamValidationError
+
+    @staticmethod
+    def add_projection(
+        arguments: Dict[str, object],
+        projection_expression: str = None,
+        projection_attribute_names: Dict[str, str] = None,
+    ) -> Dict[str, object]:
+        """Read only the projected attributes, the names join any ExpressionAttributeNames already in the arguments"""
+        if projection_expression:
+            arguments["ProjectionExpression"] = projection_expression
+            arguments["ExpressionAttributeNames"] = {
+                **arguments.get("ExpressionAttributeNames", {}),
+                **projection_attribute_names,
+            }
+        return arguments
+
+    @staticmethod
+    def add_filter(
+        arguments: Dict[str, object],
+        filter_expression: str = None,
+        filter_attribute_names: Dict[str, str] = None,
+        filter_attribute_values: Dict[str, Dict[str, str]] = None,
+    ) -> Dict[str, object]:
+        """Only return the items matching the filter, the names and values join any already in the arguments"""
+        if filter_expression:
+            arguments["FilterExpression"] = filter_expression
+            arguments["ExpressionAttributeNames"] = {
+                **arguments.get("ExpressionAttributeNames", {}),
+                **filter_attribute_names,
+            }
+            if filter_attribute_values:
+                arguments["ExpressionAttributeValues"] = {
+                    **arguments.get("ExpressionAttributeValues", {}),
+                    **filter_attribute_values,
+                }
+        return arguments
 
+    def call(self, operation_name: str, **arguments: object) -> dict:
+        """Make a client call through the retry policy, every request to the table goes through here
+
+        Args:
+            operation_name (str): Name of the client method such as put_item
+            arguments (object): The arguments of the call
+
+        Returns:
+            dict: The response of the call
+        """
+        if not self.metrics.enabled and self.capacity_tracker is None:
+            return self.retry_policy.call(
+                getattr(self.client, operation_name), **arguments
+            )
+        metric_name = f"dynamodb.{operation_name}"
+        if operation_name in self.capacity_operations:
+            arguments.setdefault(
+                "ReturnConsumedCapacity",
+                self.capacity_tracker.mode if self.capacity_tracker else "TOTAL",
+            )
+        with self.metrics.timer(metric_name):
+            response: dict = self.retry_policy.call(
+                getattr(self.client, operation_name),
+                on_retry=lambda throttled: self.metrics.record_retry(
+                    metric_name, throttled
+                ),
+                **arguments,
+            )
+        consumed_capacity = response.get("ConsumedCapacity")
+        if consumed_capacity:
+            if self.capacity_tracker is not None:
+                self.capacity_tracker.record(
+                    operation=operation_name,
+                    consumed_capacity=consumed_capacity,
+                    index_name=arguments.get("IndexName"),
+                )
+            if isinstance(consumed_capacity, dict):
+                consumed_capacity = [consumed_capacity]
+            self.metrics.record_capacity(
+                metric_name,
+                sum(
+                    table_capacity.get("CapacityUnits", 0.0)
+                    for table_capacity in consumed_capacity
+                ),
+            )
+        return response
 
     def add_item(
-        self, dynamodb_item: Dict[str, Dict[str, str]]
+        self,
+        dynamodb_item: Dict[str, Dict[str, str]],
+        **condition_arguments: Union[str, Dict[str, str]],
     ) -> Union[bool, Exception]:
         try:
-            self.client.put_item(TableName=self.dynamodb_table, Item=dynamodb_item)
+            self.call(
+                "put_item",
+                TableName=self.dynamodb_table,
+                Item=dynamodb_item,
+                **condition_arguments,
+            )
             return True
         except self.client.exceptions.ClientError as error:
             raise DynamoDbWrongKeyError from error
-        except ParamValidationError as error:
+        except self.param_validation_error as error:
             raise DynamoDbWrongKeyFormatError from error
 
+    calculate_backoff = staticmethod(calculate_backoff)
+
+    def batch_write(
+        self,
+        write_requests: List[Dict[str, Dict[str, Dict[str, Dict[str, str]]]]],
+        max_retries: int = 8,
+    ) -> Union[List[Dict[str, Dict[str, Dict[str, Dict[str, str]]]]], Exception]:
+        """Send up to 25 put or delete requests in a single batch_write_item call, retrying UnprocessedItems
+
+        Args:
+            write_requests (List[Dict[str, Dict[str, Dict[str, Dict[str, str]]]]]): PutRequest or DeleteRequest entries
+            max_retries (int, optional): Times to resend unprocessed items with backoff. Defaults to 8.
+
+        Returns:
+            Union[List[Dict[str, Dict[str, Dict[str, Dict[str, str]]]]], Exception]: The requests that were still
+            unprocessed after every retry, an empty list when all of them were written
+        """
+        pending_requests = write_requests
+        attempt = 0
+        while pending_requests:
+            try:
+                response: dict = self.call(
+                    "batch_write_item",
+                    RequestItems={self.dynamodb_table: pending_requests},
+                )
+            except self.client.exceptions.ResourceNotFoundException as error:
+                raise DynamoDbInvalidTableError from error
+            except self.client.exceptions.ClientError as error:
+                raise DynamoDbWrongKeyError from error
+            except self.param_validation_error as error:
+                raise DynamoDbWrongKeyFormatError from error
+            pending_requests = response.get("UnprocessedItems", {}).get(
+                self.dynamodb_table, []
+            )
+            if not pending_requests or attempt >= max_retries:
+                break
+            time.sleep(self.calculate_backoff(attempt))
+            attempt += 1
+        return pending_requests
+
+    def batch_get(
+        self,
+        keys: List[Dict[str, Dict[str, str]]],
+        max_retries: int = 8,
+        projection_expression: str = None,
+        projection_attribute_names: Dict[str, str] = None,
+    ) -> Union[
+        Tuple[List[Dict[str, Dict[str, str]]], List[Dict[str, Dict[str, str]]]],
+        Exception,
+    ]:
+        """Fetch up to 100 items in a single batch_get_item call, retrying UnprocessedKeys
+
+        Args:
+            keys (List[Dict[str, Dict[str, str]]]): Unique keys in the dynamodb format
+            max_retries (int, optional): Times to resend unprocessed keys with backoff. Defaults to 8.
+            projection_expression (str, optional): Only read these attributes, which should include the key
+            projection_attribute_names (Dict[str, str], optional): The placeholders used in projection_expression
+
+        Returns:
+            Union[Tuple[List[Dict[str, Dict[str, str]]], List[Dict[str, Dict[str, str]]]], Exception]: The items
+            that were found and the keys that were still unprocessed after every retry
+        """
+        fetched_items: List[Dict[str, Dict[str, str]]] = list()
+        pending_keys = keys
+        attempt = 0
+        while pending_keys:
+            try:
+                response: dict = self.call(
+                    "batch_get_item",
+                    RequestItems={
+                        self.dynamodb_table: self.add_projection(
+                            {"Keys": pending_keys},
+                            projection_expression=projection_expression,
+                            projection_attribute_names=projection_attribute_names,
+                        )
+                    },
+                )
+            except self.client.exceptions.ResourceNotFoundException as error:
+                raise DynamoDbInvalidTableError from error
+            except self.client.exceptions.ClientError as error:
+                raise DynamoDbWrongKeyError from error
+            except self.param_validation_error as error:
+                raise DynamoDbWrongKeyFormatError from error
+            fetched_items.extend(response["Responses"].get(self.dynamodb_table, []))
+            pending_keys = (
+                response.get("UnprocessedKeys", {})
+                .get(self.dynamodb_table, {})
+                .get("Keys", [])
+            )
+            if not pending_keys or attempt >= max_retries:
+                break
+            time.sleep(self.calculate_backoff(attempt))
+            attempt += 1
+        return fetched_items, pending_keys
+
     @staticmethod
     def remove_duplicated_attributes(
         new_attributes: Dict[str, str], old_attributes: Dict[str, str]
     ) -> Union[Dict[str, str], Exception]:
         try:
-            duplicate_attributes = list()
-            for attribute, value in new_attributes.items():
-                if value == old_attributes[attribute]:
-                    duplicate_attributes.append(attribute)
-
-            for duplicate_attribute in duplicate_attributes:
-                new_attributes.pop(duplicate_attribute)
-
-            return new_attributes
+            return {
+                attribute: value
+                for attribute, value in new_attributes.items()
+                if value != old_attributes[attribute]
+            }
         except KeyError as error:
             raise ValidationIncorrectAttributeError(data=error) from error
 
@@ -49,22 +301,12 @@ class DynamodbApi:
     def generate_update_expression(
         new_attributes: Dict[str, str],
     expression_mapping: Dict[str, Dict[str, str]]) -> Union[str, Exception]:
-        update_expression = str()
         try:
-            for attribute in new_attributes.keys():
-                if update_expression.startswith("SET"):
-                    pass
-                else:
-                    update_expression = f"SET {expression_mapping[attribute]['expression_attribute_name']} = {expression_mapping[attribute]['expression_attribute_var']}"
-
-                if update_expression.endswith(
-                    expression_mapping[attribute]["expression_attribute_var"]
-                ):
-                    continue
-                else:
-                    update_expression += f", {expression_mapping[attribute]['expression_attribute_name']} = {expression_mapping[attribute]['expression_attribute_var']}"
-
-            return update_expression
+            return "SET " + ", ".join(
+                f"{expression_mapping[attribute]['expression_attribute_name']} = "
+                f"{expression_mapping[attribute]['expression_attribute_var']}"
+                for attribute in new_attributes
+            )
         except KeyError as error:
             raise ValidationIncorrectAttributeError(data=error) from error
 
@@ -113,34 +355,357 @@ class DynamodbApi:
         update_expression: str,
         expression_attribute_names: Dict[str, str],
         expression_attribute_values: Dict[str, Dict[str, str]],
-    ) -> Dict[str, str]:
-        response: dict = self.client.update_item(
-            TableName=self.dynamodb_table,
-            Key=key,
-            UpdateExpression=update_expression,
-            ExpressionAttributeNames=expression_attribute_names,
-            ExpressionAttributeValues=expression_attribute_values,
-            ReturnValues="UPDATED_NEW",
-        )
+        condition_expression: str = None,
+    ) -> Union[Dict[str, str], Exception]:
+        update_arguments = {
+            "TableName": self.dynamodb_table,
+            "Key": key,
+            "UpdateExpression": update_expression,
+            "ExpressionAttributeNames": expression_attribute_names,
+            "ReturnValues": "UPDATED_NEW",
+        }
+        if expression_attribute_values:
+            update_arguments["ExpressionAttributeValues"] = expression_attribute_values
+        if condition_expression:
+            update_arguments["ConditionExpression"] = condition_expression
+        try:
+            response: dict = self.call("update_item", **update_arguments)
+        except self.client.exceptions.ConditionalCheckFailedException as error:
+            raise DynamoDbWrongKeyError from error
         return response
 
+    def transact_write(
+        self,
+        transact_items: List[Dict[str, Dict[str, object]]],
+        client_request_token: str = None,
+    ) -> Union[bool, Exception]:
+        """Write up to 100 puts, updates, deletes and condition checks in one transact_write_items call,
+        either every item is written or none are
+
+        Args:
+            transact_items (List[Dict[str, Dict[str, object]]]): The TransactItems, each with its own TableName
+            client_request_token (str, optional): Makes the call idempotent, repeating it with the same token does not write the items again
+
+        Returns:
+            Union[bool, Exception]: Returns True or raises DynamoDbTransactionCanceledError with the reason for every item
+        """
+        transact_arguments = {"TransactItems": transact_items}
+        if client_request_token is not None:
+            transact_arguments["ClientRequestToken"] = client_request_token
+        try:
+            self.call("transact_write_items", **transact_arguments)
+            return True
+        except self.client.exceptions.TransactionCanceledException as error:
+            raise DynamoDbTransactionCanceledError(
+                data=self.cancellation_reasons(error)
+            ) from error
+        except self.client.exceptions.TransactionInProgressException as error:
+            raise DynamoDbTransactionConflictError from error
+        except self.client.exceptions.IdempotentParameterMismatchException as error:
+            raise DynamoDbIdempotencyMismatchError from error
+        except self.param_validation_error as error:
+            raise DynamoDbWrongKeyFormatError from error
+
+    @staticmethod
+    def cancellation_reasons(error: Exception) -> List[str]:
+        """The cancellation reason code of each item of a cancelled transaction in the order they were sent,
+        read from the list at the end of the message when the response has no CancellationReasons
+
+        Args:
+            error (Exception): The TransactionCanceledException
+
+        Returns:
+            List[str]: A code such as None, ConditionalCheckFailed or TransactionConflict for every item
+        """
+        cancellation_reasons = error.response.get("CancellationReasons")
+        if cancellation_reasons is not None:
+            return [
+                cancellation_reason.get("Code", "None")
+                for cancellation_reason in cancellation_reasons
+            ]
+        message: str = error.response.get("Error", {}).get("Message", "")
+        if not message.endswith("]") or "[" not in message:
+            return list()
+        return [
+            reason_code.strip()
+            for reason_code in message[message.rindex("[") + 1 : -1].split(",")
+        ]
+
     def get_item(
-        self, key: Dict[str, Dict[str, str]]
+        self,
+        key: Dict[str, Dict[str, str]],
+        consistent_read: bool = False,
+        projection_expression: str = None,
+        projection_attribute_names: Dict[str, str] = None,
     ) -> Union[Dict[str, str], Exception]:
+        get_arguments = self.add_projection(
+            {"TableName": self.dynamodb_table, "Key": key},
+            projection_expression=projection_expression,
+            projection_attribute_names=projection_attribute_names,
+        )
+        if consistent_read:
+            get_arguments["ConsistentRead"] = True
         try:
-            return self.client.get_item(TableName=self.dynamodb_table, Key=key)["Item"]
+            return self.call("get_item", **get_arguments)["Item"]
         except KeyError as error:
             raise DynamoDbWrongKeyError from error
 
-    def get_items(self) -> Union[List[Dict[str, str]], Exception]:
+    @staticmethod
+    def calculate_item_size(dynamodb_item: Dict[str, Dict[str, str]]) -> int:
+        """Approximate the size in bytes of an item in the dynamodb format
+
+        Args:
+            dynamodb_item (Dict[str, Dict[str, str]]): Item as returned by the client
+
+        Returns:
+            int: Sum of the utf-8 length of every attribute name and value
+        """
+        item_size = 0
+        for attribute, value in dynamodb_item.items():
+            item_size += len(attribute.encode("utf-8"))
+            for data in value.values():
+                if isinstance(data, bytes):
+                    item_size += len(data)
+                else:
+                    item_size += len(str(data).encode("utf-8"))
+        return item_size
+
+    def scan_pages(
+        self,
+        page_size: int = None,
+        max_pages: int = None,
+        exclusive_start_key: Dict[str, Dict[str, str]] = None,
+        segment: int = None,
+        total_segments: int = None,
+        projection_expression: str = None,
+        projection_attribute_names: Dict[str, str] = None,
+        filter_expression: str = None,
+        filter_attribute_names: Dict[str, str] = None,
+        filter_attribute_values: Dict[str, Dict[str, str]] = None,
+    ) -> Iterator[List[Dict[str, Dict[str, str]]]]:
+        """Scan the table one page at a time, following LastEvaluatedKey until the table is exhausted
+
+        Args:
+            page_size (int, optional): Maximum number of items evaluated per request. Defaults to the 1 MB service limit.
+            max_pages (int, optional): Stop after this many pages. Defaults to reading the whole table.
+            exclusive_start_key (Dict[str, Dict[str, str]], optional): Resume a scan from a previous LastEvaluatedKey
+            segment (int, optional): Only scan this segment of the table, requires total_segments
+            total_segments (int, optional): The number of segments the table is split into
+            projection_expression (str, optional): Only read these attributes
+            projection_attribute_names (Dict[str, str], optional): The placeholders used in projection_expression
+            filter_expression (str, optional): Only return the items matching this condition, pages can then be empty
+            filter_attribute_names (Dict[str, str], optional): The name placeholders used in filter_expression
+            filter_attribute_values (Dict[str, Dict[str, str]], optional): The value placeholders used in filter_expression
+
+        Yields:
+            Iterator[List[Dict[str, Dict[str, str]]]]: The items of each page in the dynamodb format
+        """
+        scan_arguments = self.add_filter(
+            self.add_projection(
+                {"TableName": self.dynamodb_table},
+                projection_expression=projection_expression,
+                projection_attribute_names=projection_attribute_names,
+            ),
+            filter_expression=filter_expression,
+            filter_attribute_names=filter_attribute_names,
+            filter_attribute_values=filter_attribute_values,
+        )
+        if page_size:
+            scan_arguments["Limit"] = page_size
+        if exclusive_start_key:
+            scan_arguments["ExclusiveStartKey"] = exclusive_start_key
+        if total_segments:
+            scan_arguments["Segment"] = segment
+            scan_arguments["TotalSegments"] = total_segments
+
+        pages_read = 0
+        while max_pages is None or pages_read < max_pages:
+            try:
+                response: dict = self.call("scan", **scan_arguments)
+            except self.client.exceptions.ResourceNotFoundException as error:
+                raise DynamoDbInvalidTableError from error
+            except self.client.exceptions.ClientError as error:
+                raise DynamoDbInvalidScanError(
+                    data=error.response.get("Error", dict()).get("Message", str(error))
+                ) from error
+            except self.param_validation_error as error:
+                raise DynamoDbWrongKeyFormatError from error
+            pages_read += 1
+            yield response["Items"]
+            if "LastEvaluatedKey" not in response:
+                break
+            scan_arguments["ExclusiveStartKey"] = response["LastEvaluatedKey"]
+
+    def query_pages(
+        self,
+        key_condition_expression: str,
+        expression_attribute_names: Dict[str, str],
+        expression_attribute_values: Dict[str, Dict[str, str]],
+        index_name: str = None,
+        page_size: int = None,
+        max_pages: int = None,
+        scan_forward: bool = True,
+        exclusive_start_key: Dict[str, Dict[str, str]] = None,
+        projection_expression: str = None,
+        projection_attribute_names: Dict[str, str] = None,
+    ) -> Iterator[List[Dict[str, Dict[str, str]]]]:
+        """Query the table or one of its indexes one page at a time, following LastEvaluatedKey
+
+        Args:
+            key_condition_expression (str): Condition on the partition key and optionally the sort key
+            expression_attribute_names (Dict[str, str]): Placeholders for the attribute names in the condition
+            expression_attribute_values (Dict[str, Dict[str, str]]): Placeholders for the values in the dynamodb format
+            index_name (str, optional): Query a global or local secondary index instead of the table
+            page_size (int, optional): Maximum number of items evaluated per request
+            max_pages (int, optional): Stop after this many pages. Defaults to reading every match.
+            scan_forward (bool, optional): Order by the sort key ascending. Defaults to True.
+            exclusive_start_key (Dict[str, Dict[str, str]], optional): Resume a query from a previous LastEvaluatedKey
+            projection_expression (str, optional): Only read these attributes
+            projection_attribute_names (Dict[str, str], optional): The placeholders used in projection_expression
+
+        Yields:
+            Iterator[List[Dict[str, Dict[str, str]]]]: The items of each page in the dynamodb format
+        """
+        query_arguments = self.add_projection(
+            {
+                "TableName": self.dynamodb_table,
+                "KeyConditionExpression": key_condition_expression,
+                "ExpressionAttributeNames": expression_attribute_names,
+                "ExpressionAttributeValues": expression_attribute_values,
+                "ScanIndexForward": scan_forward,
+            },
+            projection_expression=projection_expression,
+            projection_attribute_names=projection_attribute_names,
+        )
+        if index_name:
+            query_arguments["IndexName"] = index_name
+        if page_size:
+            query_arguments["Limit"] = page_size
+        if exclusive_start_key:
+            query_arguments["ExclusiveStartKey"] = exclusive_start_key
+
+        pages_read = 0
+        while max_pages is None or pages_read < max_pages:
+            try:
+                response: dict = self.call("query", **query_arguments)
+            except self.client.exceptions.ResourceNotFoundException as error:
+                raise DynamoDbInvalidTableError from error
+            except self.client.exceptions.ClientError as error:
+                raise DynamoDbInvalidQueryError from error
+            except self.param_validation_error as error:
+                raise DynamoDbWrongKeyFormatError from error
+            pages_read += 1
+            yield response["Items"]
+            if "LastEvaluatedKey" not in response:
+                break
+            query_arguments["ExclusiveStartKey"] = response["LastEvaluatedKey"]
+
+    def parallel_scan_pages(
+        self,
+        total_segments: int,
+        max_workers: int = None,
+        ordered: bool = False,
+        page_size: int = None,
+        max_pages: int = None,
+        projection_expression: str = None,
+        projection_attribute_names: Dict[str, str] = None,
+        filter_expression: str = None,
+        filter_attribute_names: Dict[str, str] = None,
+        filter_attribute_values: Dict[str, Dict[str, str]] = None,
+    ) -> Iterator[List[Dict[str, Dict[str, str]]]]:
+        """Scan every segment of the table on a thread pool and merge the pages into one iterator
+
+        Each segment paginates on its own and hands its pages over through a bounded queue so memory
+        stays flat however big the table is.
+
+        Args:
+            total_segments (int): The number of segments to split the table into
+            max_workers (int, optional): Threads used to scan the segments. Defaults to one per segment.
+            ordered (bool, optional): Yield the segments one after another in segment order instead of
+            as soon as any page arrives. Defaults to False.
+            page_size (int, optional): Maximum number of items evaluated per request
+            max_pages (int, optional): Stop each segment after this many pages
+            projection_expression (str, optional): Only read these attributes
+            projection_attribute_names (Dict[str, str], optional): The placeholders used in projection_expression
+            filter_expression (str, optional): Only return the items matching this condition
+            filter_attribute_names (Dict[str, str], optional): The name placeholders used in filter_expression
+            filter_attribute_values (Dict[str, Dict[str, str]], optional): The value placeholders used in filter_expression
+
+        Yields:
+            Iterator[List[Dict[str, Dict[str, str]]]]: The items of each page in the dynamodb format
+        """
+        stop_scanning = threading.Event()
+        if ordered:
+            page_queues = [queue.Queue(maxsize=2) for _ in range(total_segments)]
+        else:
+            page_queues = [queue.Queue(maxsize=2 * total_segments)] * total_segments
+
+        def hand_over(segment: int, message: tuple) -> None:
+            while not stop_scanning.is_set():
+                try:
+                    page_queues[segment].put(message, timeout=0.1)
+                    return
+                except queue.Full:
+                    continue
+
+        def scan_segment(segment: int) -> None:
+            try:
+                for page in self.scan_pages(
+                    page_size=page_size,
+                    max_pages=max_pages,
+                    segment=segment,
+                    total_segments=total_segments,
+                    projection_expression=projection_expression,
+                    projection_attribute_names=projection_attribute_names,
+                    filter_expression=filter_expression,
+                    filter_attribute_names=filter_attribute_names,
+                    filter_attribute_values=filter_attribute_values,
+                ):
+                    if stop_scanning.is_set():
+                        return
+                    hand_over(segment, ("page", page))
+                hand_over(segment, ("done", None))
+            except Exception as error:
+                hand_over(segment, ("done", error))
+
+        from concurrent.futures import ThreadPoolExecutor
+
+        executor = ThreadPoolExecutor(max_workers=max_workers or total_segments)
         try:
-            return self.client.scan(TableName=self.dynamodb_table)["Items"]
-        except self.client.exceptions.ResourceNotFoundException as error:
-            raise DynamoDbInvalidTableError from error
+            for segment in range(total_segments):
+                executor.submit(scan_segment, segment)
 
-    def remove_item(self, key: str) -> Union[bool, Exception]:
+            reading_queues = page_queues if ordered else page_queues[:1]
+            segments_per_queue = 1 if ordered else total_segments
+            for page_queue in reading_queues:
+                segments_done = 0
+                while segments_done < segments_per_queue:
+                    message_type, message = page_queue.get()
+                    if message_type == "page":
+                        yield message
+                        continue
+                    if message is not None:
+                        raise message
+                    segments_done += 1
+        finally:
+            stop_scanning.set()
+            executor.shutdown(wait=True)
+
+    def get_items(self) -> Union[List[Dict[str, str]], Exception]:
+        return [table_item for page in self.scan_pages() for table_item in page]
+
+    def remove_item(
+        self, key: str, **condition_arguments: Union[str, Dict[str, str]]
+    ) -> Union[bool, Exception]:
         try:
-            self.client.delete_item(TableName=self.dynamodb_table, Key=key)
+            self.call(
+                "delete_item",
+                TableName=self.dynamodb_table,
+                Key=key,
+                **condition_arguments,
+            )
             return True
-        except ParamValidationError as error:
+        except self.client.exceptions.ConditionalCheckFailedException as error:
+            raise DynamoDbWrongKeyError from error
+        except self.param_validation_error as error:
             raise DynamoDbWrongKeyFormatError from error
@@ -1,6 +1,10 @@
+from typing import List
+
+
 class ValidationWrongKeyError(Exception):
-    def __init__(self, data: str) -> None:
+    def __init__(self, data: str, attributes: List[str] = None) -> None:
         self.data = data
+        self.attributes = attributes if attributes is not None else list()
         super().__init__(data)
 
     def __str__(self) -> str:
@@ -8,8 +12,9 @@ class ValidationWrongKeyError(Exception):
 
 
 class ValidationMissingKeyError(Exception):
-    def __init__(self, data: str) -> None:
+    def __init__(self, data: str, attributes: List[str] = None) -> None:
         self.data = data
+        self.attributes = attributes if attributes is not None else list()
         super().__init__(data)
 
     def __str__(self) -> str:
@@ -17,8 +22,9 @@ class ValidationMissingKeyError(Exception):
 
 
 class ValidationIncorrectKeyTypeError(Exception):
-    def __init__(self, data: str) -> None:
+    def __init__(self, data: str, attributes: List[str] = None) -> None:
         self.data = data
+        self.attributes = attributes if attributes is not None else list()
         super().__init__(data)
 
     def __str__(self) -> str:
@@ -77,3 +83,204 @@ class DynamoDbInvalidTableError(Exception):
 class DynamoDbWrongKeyFormatError(Exception):
     def __str__(self) -> str:
         return "The key should be a str not a dict, please change this and try again"
+
+
+class DynamoDbUnprocessedItemError(Exception):
+    def __str__(self) -> str:
+        return (
+            "The item was not processed after retrying, the table may be throttled, "
+            "please try again"
+        )
+
+
+class ValidationWrongEngineError(Exception):
+    def __init__(self, data: str) -> None:
+        self.data = data
+        super().__init__(data)
+
+    def __str__(self) -> str:
+        return (
+            f"The validation engine {self.data} is not supported, please choose either compiled "
+            "or schema and try again"
+        )
+
+
+class ValidationWrongIndexError(Exception):
+    def __init__(self, data: str) -> None:
+        self.data = data
+        super().__init__(data)
+
+    def __str__(self) -> str:
+        return f"The index {self.data} is not part of the Schema.  Please check and try again"
+
+
+class DynamoDbInvalidQueryError(Exception):
+    def __str__(self) -> str:
+        return (
+            "The query is not valid for this table or index, please check the key condition "
+            "and try again"
+        )
+
+
+class DynamoDbInvalidScanError(Exception):
+    def __init__(self, data: str) -> None:
+        self.data = data
+        super().__init__(data)
+
+    def __str__(self) -> str:
+        return (
+            f"The scan is not valid for this table, {self.data}. Please check the filter "
+            "and try again"
+        )
+
+
+class ValidationWrongOperationError(Exception):
+    def __init__(self, data: str) -> None:
+        self.data = data
+        super().__init__(data)
+
+    def __str__(self) -> str:
+        return (
+            f"The operation {self.data} is not supported, please choose either create_item, "
+            "update_item, fetch_item or delete_item and try again"
+        )
+
+
+class DynamoDbThrottlingError(Exception):
+    def __str__(self) -> str:
+        return (
+            "The table is throttling requests and the retries have run out, "
+            "please try again later"
+        )
+
+
+class ValidationWrongCapacityModeError(Exception):
+    def __init__(self, data: str) -> None:
+        self.data = data
+        super().__init__(data)
+
+    def __str__(self) -> str:
+        return (
+            f"The consumed capacity mode {self.data} is not supported, please choose either TOTAL "
+            "or INDEXES and try again"
+        )
+
+
+class DynamoDbCapacityTrackingDisabledError(Exception):
+    def __str__(self) -> str:
+        return (
+            "Consumed capacity is not being tracked for this client, please provide a "
+            "capacity_tracker and try again"
+        )
+
+
+class ValidationWrongUpdateActionError(Exception):
+    def __init__(self, data: str) -> None:
+        self.data = data
+        super().__init__(data)
+
+    def __str__(self) -> str:
+        return (
+            f"The attribute {self.data} cannot be updated this way, an attribute can only be in one of SET, "
+            "REMOVE or ADD, key attributes cannot be changed, ADD only works on numbers and sets and "
+            "if_not_exists only on attributes being set, please check and try again"
+        )
+
+
+class DynamoDbVersionConflictError(Exception):
+    def __init__(self, data: object) -> None:
+        self.data = data
+        super().__init__(data)
+
+    def __str__(self) -> str:
+        return (
+            f"The item was changed by another writer or no longer exists, it is no longer at version {self.data}. "
+            "Please fetch the item and try again"
+        )
+
+
+class ValidationMissingVersionError(Exception):
+    def __init__(self, data: str) -> None:
+        self.data = data
+        super().__init__(data)
+
+    def __str__(self) -> str:
+        return (
+            f"The table has a version attribute so {self.data} needs the version of the item, "
+            "fetch the item and pass its version or use modify_item and try again"
+        )
+
+
+class DynamoDbItemExistsError(Exception):
+    def __init__(self, data: object) -> None:
+        self.data = data
+        super().__init__(data)
+
+    def __str__(self) -> str:
+        return (
+            f"An item with the key {self.data} already exists, pass the version you fetched "
+            "to replace it and try again"
+        )
+
+
+class ValidationTooManyTransactionItemsError(Exception):
+    def __init__(self, data: int) -> None:
+        self.data = data
+        super().__init__(data)
+
+    def __str__(self) -> str:
+        return (
+            f"A transaction can write at most 100 items and this one has {self.data}, "
+            "please split it and try again"
+        )
+
+
+class ValidationDuplicateTransactionItemError(Exception):
+    def __init__(self, data: object) -> None:
+        self.data = data
+        super().__init__(data)
+
+    def __str__(self) -> str:
+        return (
+            f"The item {self.data} is already part of the transaction, an item can only be written once "
+            "per transaction. Please check and try again"
+        )
+
+
+class DynamoDbTransactionCanceledError(Exception):
+    def __init__(self, data: List[str]) -> None:
+        self.data = data
+        super().__init__(data)
+
+    def __str__(self) -> str:
+        return (
+            "The transaction was cancelled and no items were written, cancellation reasons: "
+            f"{', '.join(self.data)}. Please check the items and try again"
+        )
+
+
+class DynamoDbTransactionConflictError(Exception):
+    def __str__(self) -> str:
+        return (
+            "Another transaction was writing the item at the same time and no items were written, "
+            "please try again"
+        )
+
+
+class DynamoDbIdempotencyMismatchError(Exception):
+    def __str__(self) -> str:
+        return (
+            "The client request token was already used for a different transaction, "
+            "please use a new token and try again"
+        )
+
+
+class ValidationInvalidFilterError(Exception):
+    def __init__(self, data: str) -> None:
+        self.data = data
+        super().__init__(data)
+
+    def __str__(self) -> str:
+        return (
+            f"The filter is not valid, {self.data}. Please check and try again"
+        )
@@ -0,0 +1,117 @@
+from collections import OrderedDict
+from copy import deepcopy
+from typing import Callable, Dict, Hashable, Optional, Tuple
+import threading
+import time
+
+
+class ItemCache:
+    """Thread safe in-process cache of readable items with LRU eviction and a TTL per entry. Items are
+    deep copied in and out so changing a nested map, list or set of a fetched item never changes the cache.
+
+    Every invalidation bumps a generation counter and records it against the invalidated key, a fetch
+    that started before an invalidation of the same key is not stored so a slow read can never put back
+    an item that was just written. Writes to other keys do not stop a fetch from being cached. Only the
+    most recent invalidations are remembered, a fetch older than the ones forgotten is not stored."""
+
+    def __init__(
+        self,
+        max_size: int = 1024,
+        ttl: float = 60.0,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self.max_size = max_size
+        self.ttl = ttl
+        self.clock = clock
+        self.items: "OrderedDict[Hashable, Tuple[float, Dict[str, str]]]" = OrderedDict()
+        self.lock = threading.Lock()
+        self.generation = 0
+        self.invalidated_at: "OrderedDict[Hashable, int]" = OrderedDict()
+        self.oldest_generation = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.expirations = 0
+        self.invalidations = 0
+
+    def get(self, key: Hashable) -> Optional[Dict[str, str]]:
+        """Get a deep copy of the cached item or None when it is missing or has expired"""
+        with self.lock:
+            cached_entry = self.items.get(key)
+            if cached_entry is None:
+                self.misses += 1
+                return None
+            expires_at, item = cached_entry
+            if expires_at <= self.clock():
+                del self.items[key]
+                self.expirations += 1
+                self.misses += 1
+                return None
+            self.items.move_to_end(key)
+            self.hits += 1
+            return deepcopy(item)
+
+    def put(
+        self,
+        key: Hashable,
+        item: Dict[str, str],
+        generation: int = None,
+        ttl: float = None,
+    ) -> bool:
+        """Store a deep copy of the item, evicting the least recently used entries when full
+
+        Args:
+            key (Hashable): Key values of the item
+            item (Dict[str, str]): Readable item
+            generation (int, optional): Value of the generation when the fetch started, the item is
+            not stored if the key was invalidated since
+            ttl (float, optional): Seconds the item is valid for. Defaults to the cache ttl.
+
+        Returns:
+            bool: True if the item was stored
+        """
+        with self.lock:
+            if generation is not None and (
+                generation < self.oldest_generation
+                or generation < self.invalidated_at.get(key, 0)
+            ):
+                return False
+            self.items[key] = (
+                self.clock() + (self.ttl if ttl is None else ttl),
+                deepcopy(item),
+            )
+            self.items.move_to_end(key)
+            while len(self.items) > self.max_size:
+                self.items.popitem(last=False)
+                self.evictions += 1
+            return True
+
+    def invalidate(self, key: Hashable) -> None:
+        with self.lock:
+            self.generation += 1
+            self.invalidated_at[key] = self.generation
+            self.invalidated_at.move_to_end(key)
+            while len(self.invalidated_at) > self.max_size:
+                _, forgotten_generation = self.invalidated_at.popitem(last=False)
+                self.oldest_generation = max(self.oldest_generation, forgotten_generation)
+            if self.items.pop(key, None) is not None:
+                self.invalidations += 1
+
+    def clear(self) -> None:
+        with self.lock:
+            self.generation += 1
+            self.oldest_generation = self.generation
+            self.invalidated_at.clear()
+            self.items.clear()
+
+    def stats(self) -> Dict[str, int]:
+        """Counters for sizing the cache"""
+        with self.lock:
+            return {
+                "size": len(self.items),
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "expirations": self.expirations,
+                "invalidations": self.invalidations,
+            }
@@ -0,0 +1,357 @@
+from decimal import Decimal
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Iterable,
+    List,
+    Optional,
+    Tuple,
+    Union,
+    get_args,
+    get_origin,
+)
+import math
+
+number_types = (int, float, Decimal)
+scalar_set_types = {
+    str: "SS",
+    int: "NS",
+    float: "NS",
+    Decimal: "NS",
+    bytes: "BS",
+}
+scalar_types = {
+    str: "S",
+    bool: "BOOL",
+    int: "N",
+    float: "N",
+    Decimal: "N",
+    bytes: "B",
+    bytearray: "B",
+    dict: "M",
+    list: "L",
+    tuple: "L",
+}
+
+
+def encode_number(value: Union[int, float, Decimal]) -> str:
+    """DynamoDB numbers are sent as strings, NaN and infinity cannot be stored"""
+    if isinstance(value, float) and not math.isfinite(value):
+        raise ValueError(f"{value!r} cannot be stored in DynamoDB")
+    if isinstance(value, Decimal) and not value.is_finite():
+        raise ValueError(f"{value!r} cannot be stored in DynamoDB")
+    return str(value)
+
+
+def decode_number(value: str) -> Union[int, Decimal]:
+    """Numbers without a schema type come back as int when whole, otherwise as Decimal"""
+    try:
+        return int(value)
+    except ValueError:
+        return Decimal(value)
+
+
+def encode_set(value: Union[set, frozenset]) -> Dict[str, list]:
+    if not value:
+        raise ValueError("DynamoDB cannot store an empty set")
+    if all(isinstance(member, str) for member in value):
+        return {"SS": list(value)}
+    if all(
+        isinstance(member, number_types) and not isinstance(member, bool)
+        for member in value
+    ):
+        return {"NS": [encode_number(member) for member in value]}
+    if all(isinstance(member, (bytes, bytearray)) for member in value):
+        return {"BS": [bytes(member) for member in value]}
+    raise TypeError(f"{value!r} mixes types, DynamoDB sets hold strings, numbers or binary")
+
+
+value_encoders: Dict[type, Callable[[Any], Dict[str, Any]]] = {
+    str: lambda value: {"S": value},
+    bool: lambda value: {"BOOL": value},
+    int: lambda value: {"N": str(value)},
+    float: lambda value: {"N": encode_number(value)},
+    Decimal: lambda value: {"N": encode_number(value)},
+    bytes: lambda value: {"B": value},
+    bytearray: lambda value: {"B": bytes(value)},
+    type(None): lambda value: {"NULL": True},
+    dict: lambda value: {
+        "M": {attribute: encode_value(member) for attribute, member in value.items()}
+    },
+    list: lambda value: {"L": [encode_value(member) for member in value]},
+    tuple: lambda value: {"L": [encode_value(member) for member in value]},
+    set: encode_set,
+    frozenset: encode_set,
+}
+
+
+def encode_value(value: Any) -> Dict[str, Any]:
+    """Marshal any python value into the DynamoDB format, nested maps and lists included
+
+    Args:
+        value (Any): str, bool, int, float, Decimal, bytes, None, dict, list, tuple or set
+
+    Returns:
+        Dict[str, Any]: The value wrapped in its DynamoDB type such as {"N": "32"}
+    """
+    value_encoder = value_encoders.get(type(value))
+    if value_encoder is None:
+        for value_type, type_encoder in value_encoders.items():
+            if value_type is not type(None) and isinstance(value, value_type):
+                value_encoder = type_encoder
+                break
+        else:
+            raise TypeError(f"{type(value).__name__} cannot be stored in DynamoDB")
+    return value_encoder(value)
+
+
+value_decoders: Dict[str, Callable[[Any], Any]] = {
+    "S": lambda value: value,
+    "N": decode_number,
+    "B": lambda value: value,
+    "BOOL": lambda value: value,
+    "NULL": lambda value: None,
+    "M": lambda value: {
+        attribute: decode_value(member) for attribute, member in value.items()
+    },
+    "L": lambda value: [decode_value(member) for member in value],
+    "SS": set,
+    "NS": lambda value: {decode_number(member) for member in value},
+    "BS": set,
+}
+
+
+def decode_value(dynamodb_value: Dict[str, Any]) -> Any:
+    """Unmarshal a value in the DynamoDB format, nested maps and lists included"""
+    for dynamodb_type, value in dynamodb_value.items():
+        return value_decoders[dynamodb_type](value)
+
+
+def canonical_value(dynamodb_value: Dict[str, Any]) -> Any:
+    """A form of a DynamoDB value that compares equal however the set members are ordered
+    and however a number is written, such as "100" and "100.0" """
+    for dynamodb_type, value in dynamodb_value.items():
+        if dynamodb_type == "N":
+            return ("N", Decimal(value))
+        if dynamodb_type == "NS":
+            return ("NS", frozenset(Decimal(member) for member in value))
+        if dynamodb_type in ("SS", "BS"):
+            return (dynamodb_type, frozenset(value))
+        if dynamodb_type == "M":
+            return (
+                "M",
+                {attribute: canonical_value(member) for attribute, member in value.items()},
+            )
+        if dynamodb_type == "L":
+            return ("L", [canonical_value(member) for member in value])
+        return (dynamodb_type, value)
+
+
+def set_member_type(data_type: Any) -> Optional[type]:
+    """The member type of a List[int], Set[str] or similar that is stored as a DynamoDB set"""
+    if get_origin(data_type) in (list, set, frozenset):
+        member_types = get_args(data_type)
+        if member_types and member_types[0] in scalar_set_types:
+            return member_types[0]
+    return None
+
+
+def dynamodb_type(data_type: Any) -> Optional[str]:
+    """The DynamoDB type tag for a schema type, None when it is worked out from each value
+
+    Typed lists and sets of strings, numbers or binary such as List[int] or Set[str] are stored
+    as DynamoDB sets, a plain list or tuple as a list, dict as a map and Any is stored as it comes.
+    """
+    member_type = set_member_type(data_type)
+    if member_type is not None:
+        return scalar_set_types[member_type]
+    container_type = get_origin(data_type)
+    if container_type in (list, tuple):
+        return "L"
+    if container_type is dict:
+        return "M"
+    return scalar_types.get(data_type)
+
+
+def compile_encoder(data_type: Any) -> Callable[[Any], Dict[str, Any]]:
+    """Build the function that marshals values of a schema type, scalar types skip the per value dispatch
+
+    Args:
+        data_type (Any): Type from the table schema
+
+    Returns:
+        Callable[[Any], Dict[str, Any]]: Marshals a value or raises TypeError or ValueError
+    """
+    type_tag = dynamodb_type(data_type)
+    if type_tag in ("SS", "NS", "BS"):
+        encode_member = encode_number if type_tag == "NS" else (lambda member: member)
+
+        def encode_members(value: Any) -> Dict[str, list]:
+            if isinstance(value, (str, bytes)):
+                raise TypeError(f"{value!r} is not a collection")
+            members = [encode_member(member) for member in value]
+            if not members:
+                raise ValueError("DynamoDB cannot store an empty set")
+            if len(set(map(Decimal, members) if type_tag == "NS" else members)) != len(
+                members
+            ):
+                raise ValueError(
+                    f"{value!r} holds the same value twice, which a DynamoDB set cannot store"
+                )
+            return {type_tag: members}
+
+        return encode_members
+    if type_tag == "S":
+        return lambda value: {"S": value}
+    if type_tag == "N":
+        if data_type is int:
+            return lambda value: {"N": str(value)}
+        return lambda value: {"N": encode_number(value)}
+    if type_tag == "BOOL":
+        return lambda value: {"BOOL": value}
+    if type_tag == "B":
+        return lambda value: {"B": bytes(value)}
+    return encode_value
+
+
+def compile_number_decoder(number_type: type) -> Callable[[str], Any]:
+    """Convert a DynamoDB number string to the schema number type, a stored number the type cannot
+    hold, such as 1.5 for an int, comes back as it is stored rather than failing the read"""
+
+    def decode_schema_number(value: str) -> Any:
+        try:
+            return number_type(value)
+        except ValueError:
+            return decode_number(value)
+
+    return decode_schema_number
+
+
+def compile_decoder(data_type: Any) -> Callable[[Dict[str, Any]], Any]:
+    """Build the function that unmarshals values of a schema type back into that type, values stored
+    with a different DynamoDB type than the schema expects, such as NULL, or a number such as 1.5 that
+    an int cannot hold, are decoded as they come
+
+    Args:
+        data_type (Any): Type from the table schema
+
+    Returns:
+        Callable[[Dict[str, Any]], Any]: Unmarshals a value in the DynamoDB format
+    """
+    type_tag = dynamodb_type(data_type)
+    member_type = set_member_type(data_type)
+    if member_type is not None:
+        container_type = get_origin(data_type)
+        decode_member = (
+            compile_number_decoder(member_type)
+            if type_tag == "NS"
+            else (lambda member: member)
+        )
+
+        def decode_members(dynamodb_value: Dict[str, Any]) -> Any:
+            members = dynamodb_value.get(type_tag)
+            if members is None:
+                return decode_value(dynamodb_value)
+            return container_type(decode_member(member) for member in members)
+
+        return decode_members
+    if type_tag == "N":
+        decode_schema_number = compile_number_decoder(data_type)
+
+        def decode_typed_number(dynamodb_value: Dict[str, Any]) -> Any:
+            value = dynamodb_value.get("N")
+            if value is None:
+                return decode_value(dynamodb_value)
+            return decode_schema_number(value)
+
+        return decode_typed_number
+    if type_tag in ("S", "BOOL", "B"):
+
+        def decode_scalar(dynamodb_value: Dict[str, Any]) -> Any:
+            value = dynamodb_value.get(type_tag)
+            if value is None:
+                return decode_value(dynamodb_value)
+            return value
+
+        return decode_scalar
+    return decode_value
+
+
+class ItemCodec:
+    """Converts whole items between the readable and the DynamoDB format for one schema
+
+    Everything that depends on the schema is worked out once: a flat table of attribute to type tag,
+    the compiled encoder and decoder of every attribute and the attributes whose values are stored as
+    they are, strings, booleans and binary, which are wrapped and unwrapped inline without a call."""
+
+    inline_tags = {"S": str, "BOOL": bool, "B": bytes}
+
+    def __init__(self, attribute_types: Dict[str, Any]) -> None:
+        self.type_tags: Dict[str, Optional[str]] = {
+            attribute: dynamodb_type(data_type)
+            for attribute, data_type in attribute_types.items()
+        }
+        self.encoders: Dict[str, Callable[[Any], Dict[str, Any]]] = {
+            attribute: compile_encoder(data_type)
+            for attribute, data_type in attribute_types.items()
+        }
+        self.decoders: Dict[str, Callable[[Dict[str, Any]], Any]] = {
+            attribute: compile_decoder(data_type)
+            for attribute, data_type in attribute_types.items()
+        }
+        self.inline_types: Dict[str, Tuple[str, type]] = {
+            attribute: (type_tag, self.inline_tags[type_tag])
+            for attribute, type_tag in self.type_tags.items()
+            if type_tag in self.inline_tags
+        }
+
+    def subset(self, attributes: Iterable[str]) -> "ItemCodec":
+        """A codec for only some of the attributes, such as a projection, sharing the compiled converters"""
+        attributes = set(attributes)
+        codec = ItemCodec.__new__(ItemCodec)
+        for table_name in ("type_tags", "encoders", "decoders", "inline_types"):
+            setattr(
+                codec,
+                table_name,
+                {
+                    attribute: value
+                    for attribute, value in getattr(self, table_name).items()
+                    if attribute in attributes
+                },
+            )
+        return codec
+
+    def encode_item(self, item: Dict[str, Any]) -> Dict[str, Dict[str, Any]]:
+        """Marshal an item, raises KeyError for attributes that are not in the schema and TypeError
+        or ValueError for values DynamoDB cannot store"""
+        inline_types = self.inline_types
+        encoders = self.encoders
+        dynamodb_item = dict()
+        for attribute, value in item.items():
+            inline_type = inline_types.get(attribute)
+            if inline_type is not None and type(value) is inline_type[1]:
+                dynamodb_item[attribute] = {inline_type[0]: value}
+            else:
+                dynamodb_item[attribute] = encoders[attribute](value)
+        return dynamodb_item
+
+    def decode_item(self, dynamodb_item: Dict[str, Dict[str, Any]]) -> Dict[str, Any]:
+        """Unmarshal an item, attributes that are not in the schema are decoded from the type DynamoDB returned"""
+        inline_types = self.inline_types
+        decoders = self.decoders
+        item = dict()
+        for attribute, value in dynamodb_item.items():
+            inline_type = inline_types.get(attribute)
+            if inline_type is not None and inline_type[0] in value:
+                item[attribute] = value[inline_type[0]]
+            else:
+                item[attribute] = decoders.get(attribute, decode_value)(value)
+        return item
+
+    def decode_items(
+        self, dynamodb_items: Iterable[Dict[str, Dict[str, Any]]]
+    ) -> List[Dict[str, Any]]:
+        """Unmarshal a page of items, such as the Items of a scan or query response"""
+        decode_item = self.decode_item
+        return [decode_item(dynamodb_item) for dynamodb_item in dynamodb_items]
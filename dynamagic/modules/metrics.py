@@ -0,0 +1,302 @@
+from contextlib import nullcontext
+from functools import wraps
+from typing import IO, Any, Callable, Dict, List, Union
+import json
+import logging
+import math
+import sys
+import threading
+import time
+
+
+class LatencyHistogram:
+    """Log scale histogram of latencies, every bucket is growth_factor wider than the last so
+    percentiles are accurate to within a few percent while memory stays bounded"""
+
+    def __init__(self, growth_factor: float = 1.05) -> None:
+        self.log_growth_factor = math.log(growth_factor)
+        self.growth_factor = growth_factor
+        self.buckets: Dict[int, int] = dict()
+        self.count = 0
+        self.total = 0.0
+        self.minimum = math.inf
+        self.maximum = 0.0
+
+    def record(self, milliseconds: float) -> None:
+        bucket = (
+            math.floor(math.log(milliseconds) / self.log_growth_factor)
+            if milliseconds > 0
+            else -1000
+        )
+        self.buckets[bucket] = self.buckets.get(bucket, 0) + 1
+        self.count += 1
+        self.total += milliseconds
+        self.minimum = min(self.minimum, milliseconds)
+        self.maximum = max(self.maximum, milliseconds)
+
+    def percentile(self, percent: float) -> float:
+        """The upper bound of the bucket holding the percentile, capped to the largest latency seen"""
+        if not self.count:
+            return 0.0
+        rank = math.ceil(self.count * percent / 100)
+        seen = 0
+        for bucket in sorted(self.buckets):
+            seen += self.buckets[bucket]
+            if seen >= rank:
+                return min(self.maximum, self.growth_factor ** (bucket + 1))
+        return self.maximum
+
+    def summary(self) -> Dict[str, float]:
+        return {
+            "count": self.count,
+            "mean_ms": self.total / self.count if self.count else 0.0,
+            "min_ms": self.minimum if self.count else 0.0,
+            "p50_ms": self.percentile(50),
+            "p90_ms": self.percentile(90),
+            "p99_ms": self.percentile(99),
+            "max_ms": self.maximum,
+        }
+
+
+class InMemorySink:
+    """Keeps every flushed snapshot, useful in tests and notebooks"""
+
+    def __init__(self) -> None:
+        self.snapshots: List[Dict[str, dict]] = list()
+
+    def emit(self, snapshot: Dict[str, dict]) -> None:
+        self.snapshots.append(snapshot)
+
+
+class LoggingSink:
+    """Writes each snapshot as one JSON log record"""
+
+    def __init__(self, logger: logging.Logger = None, level: int = logging.INFO) -> None:
+        self.logger = logger if logger is not None else logging.getLogger("dynamagic.metrics")
+        self.level = level
+
+    def emit(self, snapshot: Dict[str, dict]) -> None:
+        self.logger.log(self.level, "dynamagic metrics %s", json.dumps(snapshot, sort_keys=True))
+
+
+class EmfSink:
+    """Writes CloudWatch embedded metric format JSON lines, one per operation, which lambda
+    turns into CloudWatch metrics straight from stdout"""
+
+    def __init__(
+        self,
+        namespace: str = "dynamagic",
+        dimensions: Dict[str, str] = None,
+        stream: IO[str] = None,
+        clock: Callable[[], float] = time.time,
+    ) -> None:
+        self.namespace = namespace
+        self.dimensions = dict(dimensions) if dimensions else dict()
+        self.stream = stream
+        self.clock = clock
+
+    def metric_lines(self, snapshot: Dict[str, dict]) -> List[Dict[str, Any]]:
+        operations = sorted(
+            set(snapshot["latency"])
+            | set(snapshot["errors"])
+            | set(snapshot["capacity"])
+            | set(snapshot["retries"])
+        )
+        timestamp = int(self.clock() * 1000)
+        metric_lines = list()
+        for operation in operations:
+            latency = snapshot["latency"].get(operation)
+            metrics: Dict[str, Union[int, float]] = dict()
+            units: Dict[str, str] = dict()
+            if latency is not None:
+                metrics.update(
+                    {
+                        "Count": latency["count"],
+                        "LatencyP50": latency["p50_ms"],
+                        "LatencyP99": latency["p99_ms"],
+                        "LatencyMax": latency["max_ms"],
+                    }
+                )
+                units.update(
+                    {
+                        "Count": "Count",
+                        "LatencyP50": "Milliseconds",
+                        "LatencyP99": "Milliseconds",
+                        "LatencyMax": "Milliseconds",
+                    }
+                )
+            if operation in snapshot["errors"]:
+                metrics["Errors"] = sum(snapshot["errors"][operation].values())
+                units["Errors"] = "Count"
+            if operation in snapshot["capacity"]:
+                metrics["ConsumedCapacity"] = snapshot["capacity"][operation]
+                units["ConsumedCapacity"] = "Count"
+            if operation in snapshot["retries"]:
+                metrics["Retries"] = snapshot["retries"][operation]
+                metrics["Throttles"] = snapshot["throttles"].get(operation, 0)
+                units.update({"Retries": "Count", "Throttles": "Count"})
+            metric_lines.append(
+                {
+                    "_aws": {
+                        "Timestamp": timestamp,
+                        "CloudWatchMetrics": [
+                            {
+                                "Namespace": self.namespace,
+                                "Dimensions": [[*self.dimensions, "Operation"]],
+                                "Metrics": [
+                                    {"Name": name, "Unit": units[name]}
+                                    for name in metrics
+                                ],
+                            }
+                        ],
+                    },
+                    **self.dimensions,
+                    "Operation": operation,
+                    **metrics,
+                }
+            )
+        return metric_lines
+
+    def emit(self, snapshot: Dict[str, dict]) -> None:
+        stream = self.stream if self.stream is not None else sys.stdout
+        for metric_line in self.metric_lines(snapshot):
+            stream.write(json.dumps(metric_line) + "\n")
+        stream.flush()
+
+
+class OperationTimer:
+    def __init__(self, recorder: "MetricsRecorder", name: str) -> None:
+        self.recorder = recorder
+        self.name = name
+        self.started_at = 0.0
+
+    def __enter__(self) -> "OperationTimer":
+        self.started_at = self.recorder.clock()
+        return self
+
+    def __exit__(self, exception_type: type, error: BaseException, traceback: object) -> bool:
+        self.recorder.record_latency(
+            self.name, (self.recorder.clock() - self.started_at) * 1000
+        )
+        if error is not None:
+            self.recorder.record_error(self.name, error)
+        return False
+
+
+class MetricsRecorder:
+    """Collects latency histograms, errors by exception class, consumed capacity and retries for
+    each operation, named such as update_item, update_item.validation or dynamodb.update_item.
+
+    flush sends a snapshot to the sink and starts again from zero."""
+
+    enabled = True
+
+    def __init__(
+        self, sink: object = None, clock: Callable[[], float] = time.perf_counter
+    ) -> None:
+        self.sink = sink if sink is not None else InMemorySink()
+        self.clock = clock
+        self.lock = threading.Lock()
+        self.reset()
+
+    def reset(self) -> None:
+        with self.lock:
+            self.latencies: Dict[str, LatencyHistogram] = dict()
+            self.errors: Dict[str, Dict[str, int]] = dict()
+            self.capacity: Dict[str, float] = dict()
+            self.retries: Dict[str, int] = dict()
+            self.throttles: Dict[str, int] = dict()
+
+    def timer(self, operation: str, phase: str = None) -> OperationTimer:
+        """Context manager recording the latency of the block and the class of any error it raises"""
+        return OperationTimer(self, f"{operation}.{phase}" if phase else operation)
+
+    def record_latency(self, name: str, milliseconds: float) -> None:
+        with self.lock:
+            histogram = self.latencies.get(name)
+            if histogram is None:
+                histogram = self.latencies[name] = LatencyHistogram()
+            histogram.record(milliseconds)
+
+    def record_error(self, name: str, error: BaseException) -> None:
+        with self.lock:
+            errors = self.errors.setdefault(name, dict())
+            error_class = type(error).__name__
+            errors[error_class] = errors.get(error_class, 0) + 1
+
+    def record_capacity(self, name: str, capacity_units: float) -> None:
+        with self.lock:
+            self.capacity[name] = self.capacity.get(name, 0.0) + capacity_units
+
+    def record_retry(self, name: str, throttled: bool) -> None:
+        with self.lock:
+            self.retries[name] = self.retries.get(name, 0) + 1
+            if throttled:
+                self.throttles[name] = self.throttles.get(name, 0) + 1
+
+    def snapshot(self) -> Dict[str, dict]:
+        with self.lock:
+            return {
+                "latency": {
+                    name: histogram.summary()
+                    for name, histogram in self.latencies.items()
+                },
+                "errors": {name: dict(errors) for name, errors in self.errors.items()},
+                "capacity": dict(self.capacity),
+                "retries": dict(self.retries),
+                "throttles": dict(self.throttles),
+            }
+
+    def flush(self) -> Dict[str, dict]:
+        """Send the snapshot to the sink and reset every metric"""
+        snapshot = self.snapshot()
+        self.reset()
+        self.sink.emit(snapshot)
+        return snapshot
+
+
+class NullMetricsRecorder:
+    """Recorder used when metrics are turned off, every method does nothing"""
+
+    enabled = False
+
+    def timer(self, operation: str, phase: str = None) -> nullcontext:
+        return null_timer
+
+    def record_latency(self, name: str, milliseconds: float) -> None:
+        pass
+
+    def record_error(self, name: str, error: BaseException) -> None:
+        pass
+
+    def record_capacity(self, name: str, capacity_units: float) -> None:
+        pass
+
+    def record_retry(self, name: str, throttled: bool) -> None:
+        pass
+
+    def snapshot(self) -> Dict[str, dict]:
+        return {"latency": {}, "errors": {}, "capacity": {}, "retries": {}, "throttles": {}}
+
+    def flush(self) -> Dict[str, dict]:
+        return self.snapshot()
+
+
+null_timer = nullcontext()
+null_metrics = NullMetricsRecorder()
+
+
+def timed(operation: str) -> Callable[[Callable[..., Any]], Callable[..., Any]]:
+    """Decorate a client method so its latency is recorded under the operation name when metrics are on"""
+
+    def decorate(method: Callable[..., Any]) -> Callable[..., Any]:
+        @wraps(method)
+        def timed_method(self, *args: Any, **kwargs: Any) -> Any:
+            if not self.metrics.enabled:
+                return method(self, *args, **kwargs)
+            with self.metrics.timer(operation):
+                return method(self, *args, **kwargs)
+
+        return timed_method
+
+    return decorate
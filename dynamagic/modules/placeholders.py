@@ -0,0 +1,109 @@
+from typing import Dict, Iterable, Iterator, Tuple
+
+placeholder_cache: Dict[Tuple[str, ...], Dict[str, Dict[str, str]]] = dict()
+
+
+class PlaceholderAllocator:
+    """Assigns every attribute a unique #NAME and :name placeholder pair in a single pass.
+
+    Placeholders are built from the lower case ascii letters and digits of the attribute name, trying
+    its first letter, its first two letters, its second letter, its first three letters and so on, so
+    address becomes #A and :a and age becomes #AG and :ag. When every candidate is taken a counter is
+    added to the name. Tokens never contain an underscore, which leaves placeholders such as :a_0
+    free for conditions that need more than one value per attribute."""
+
+    def __init__(self, used_tokens: Iterable[str] = ()) -> None:
+        self.used_tokens = set(used_tokens)
+        self.fallback_counters: Dict[str, int] = dict()
+
+    @staticmethod
+    def base_token(attribute: str) -> str:
+        base_token = "".join(
+            character
+            for character in attribute.lower()
+            if character.isascii() and character.isalnum()
+        )
+        return base_token or "attribute"
+
+    @staticmethod
+    def candidate_tokens(base_token: str) -> Iterator[str]:
+        for index in range(len(base_token)):
+            yield base_token[index]
+            yield base_token[: index + 2]
+
+    def allocate(self, attribute: str) -> str:
+        """The first free token for the attribute, which is then marked as used"""
+        base_token = self.base_token(attribute)
+        used_tokens = self.used_tokens
+        for token in self.candidate_tokens(base_token):
+            if token not in used_tokens:
+                break
+        else:
+            counter = self.fallback_counters.get(base_token, 0)
+            token = base_token
+            while token in used_tokens:
+                counter += 1
+                token = f"{base_token}{counter}"
+            self.fallback_counters[base_token] = counter
+        used_tokens.add(token)
+        return token
+
+    def release(self, token: str) -> None:
+        self.used_tokens.discard(token)
+
+    @staticmethod
+    def placeholders(token: str) -> Dict[str, str]:
+        return {
+            "expression_attribute_name": f"#{token.upper()}",
+            "expression_attribute_var": f":{token}",
+        }
+
+
+def expression_token(expression_placeholders: Dict[str, str]) -> str:
+    return expression_placeholders["expression_attribute_var"][1:]
+
+
+def allocate_placeholders(
+    attributes: Iterable[str],
+    expression_mapping: Dict[str, Dict[str, str]] = None,
+) -> Dict[str, Dict[str, str]]:
+    """Placeholders for every attribute, unique among themselves and the placeholders already in the
+    expression_mapping. Reallocating an attribute that is in the mapping frees its old placeholder
+    once its new one is chosen.
+
+    Args:
+        attributes (Iterable[str]): Attribute names in schema order
+        expression_mapping (Dict[str, Dict[str, str]], optional): Placeholders already in use
+
+    Returns:
+        Dict[str, Dict[str, str]]: The expression_attribute_name and expression_attribute_var of each attribute
+    """
+    if not expression_mapping:
+        attributes = tuple(attributes)
+        cached_mapping = placeholder_cache.get(attributes)
+        if cached_mapping is None:
+            placeholder_allocator = PlaceholderAllocator()
+            cached_mapping = placeholder_cache.setdefault(
+                attributes,
+                {
+                    attribute: placeholder_allocator.placeholders(
+                        placeholder_allocator.allocate(attribute)
+                    )
+                    for attribute in attributes
+                },
+            )
+        return {
+            attribute: dict(expression_placeholders)
+            for attribute, expression_placeholders in cached_mapping.items()
+        }
+
+    placeholder_allocator = PlaceholderAllocator(
+        used_tokens=map(expression_token, expression_mapping.values())
+    )
+    new_mapping = dict()
+    for attribute in attributes:
+        token = placeholder_allocator.allocate(attribute)
+        if attribute in expression_mapping:
+            placeholder_allocator.release(expression_token(expression_mapping[attribute]))
+        new_mapping[attribute] = placeholder_allocator.placeholders(token)
+    return new_mapping
@@ -0,0 +1,27 @@
+from typing import Any, Dict, Tuple
+from dynamagic.modules.marshalling import ItemCodec
+
+
+class Projection:
+    """The ProjectionExpression and ExpressionAttributeNames that read only some attributes of an item,
+    with a codec that only converts those attributes"""
+
+    def __init__(
+        self,
+        attributes: Tuple[str, ...],
+        expression_mapping: Dict[str, Dict[str, str]],
+        codec: ItemCodec,
+    ) -> None:
+        self.attributes = attributes
+        self.expression_attribute_names: Dict[str, str] = {
+            expression_mapping[attribute]["expression_attribute_name"]: attribute
+            for attribute in attributes
+        }
+        self.projection_expression = ", ".join(self.expression_attribute_names)
+        self.codec = codec.subset(attributes)
+
+    def project(self, item: Dict[str, Any]) -> Dict[str, Any]:
+        """Only the projected attributes of an item that was read in full, such as one from the item cache"""
+        return {
+            attribute: item[attribute] for attribute in self.attributes if attribute in item
+        }
@@ -0,0 +1,65 @@
+from typing import Callable
+import threading
+import time
+
+
+class TokenBucket:
+    """Thread safe token bucket, rate tokens are added every second up to capacity and
+    acquire blocks until enough tokens are available"""
+
+    def __init__(
+        self,
+        rate: float,
+        capacity: float = None,
+        clock: Callable[[], float] = time.monotonic,
+        sleep: Callable[[float], None] = None,
+    ) -> None:
+        self.rate = rate
+        self.capacity = capacity if capacity is not None else max(rate, 1.0)
+        self.clock = clock
+        self.sleep = sleep
+        self.tokens = self.capacity
+        self.updated_at = clock()
+        self.lock = threading.Lock()
+
+    def refill(self) -> None:
+        now = self.clock()
+        self.tokens = min(
+            self.capacity, self.tokens + (now - self.updated_at) * self.rate
+        )
+        self.updated_at = now
+
+    def try_acquire(self, tokens: float = 1.0) -> bool:
+        """Take the tokens if they are available without waiting"""
+        with self.lock:
+            self.refill()
+            if self.tokens >= tokens:
+                self.tokens -= tokens
+                return True
+            return False
+
+    def acquire(self, tokens: float = 1.0) -> float:
+        """Take the tokens, waiting for the bucket to refill when it is empty
+
+        Args:
+            tokens (float, optional): Tokens needed. Defaults to 1.0.
+
+        Returns:
+            float: Seconds spent waiting
+        """
+        waited = 0.0
+        while True:
+            with self.lock:
+                self.refill()
+                if self.tokens >= tokens:
+                    self.tokens -= tokens
+                    return waited
+                delay = (tokens - self.tokens) / self.rate
+            (self.sleep if self.sleep is not None else time.sleep)(delay)
+            waited += delay
+
+    def set_rate(self, rate: float) -> None:
+        """Change the refill rate, tokens already earned at the old rate are kept"""
+        with self.lock:
+            self.refill()
+            self.rate = rate
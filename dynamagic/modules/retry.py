@@ -0,0 +1,229 @@
+from typing import Any, Callable, Dict
+import random
+import threading
+import time
+from dynamagic.modules.exceptions import DynamoDbThrottlingError
+from dynamagic.modules.rate_limiter import TokenBucket
+
+
+def calculate_backoff(
+    attempt: int, base_delay: float = 0.05, max_delay: float = 5.0
+) -> float:
+    """Exponential backoff with full jitter for the given retry attempt
+
+    Args:
+        attempt (int): The retry attempt starting from 0
+        base_delay (float, optional): Delay in seconds for the first retry. Defaults to 0.05.
+        max_delay (float, optional): Upper bound of the delay in seconds. Defaults to 5.0.
+
+    Returns:
+        float: Seconds to sleep before retrying
+    """
+    return random.uniform(0, min(max_delay, base_delay * 2 ** attempt))
+
+
+class RetryBudget:
+    """Shared allowance of retries, every retry withdraws tokens and every success puts one back
+    so a table that keeps failing stops being retried instead of being hit even harder"""
+
+    def __init__(
+        self, capacity: int = 500, retry_cost: int = 5, throttle_cost: int = 10
+    ) -> None:
+        self.capacity = capacity
+        self.retry_cost = retry_cost
+        self.throttle_cost = throttle_cost
+        self.tokens = capacity
+        self.lock = threading.Lock()
+
+    def withdraw(self, throttled: bool = False) -> bool:
+        """Take the cost of one retry, False when the budget is exhausted"""
+        cost = self.throttle_cost if throttled else self.retry_cost
+        with self.lock:
+            if self.tokens < cost:
+                return False
+            self.tokens -= cost
+            return True
+
+    def deposit(self, tokens: int = 1) -> None:
+        with self.lock:
+            self.tokens = min(self.capacity, self.tokens + tokens)
+
+
+class AdaptiveRateLimiter:
+    """Client side rate limit that only switches on once the table throttles us. The rate is cut
+    to a fraction of the measured send rate on every throttle and creeps back up on every success"""
+
+    def __init__(
+        self,
+        decrease_factor: float = 0.7,
+        increase_step: float = 1.0,
+        min_rate: float = 1.0,
+        max_rate: float = 10000.0,
+        clock: Callable[[], float] = time.monotonic,
+        sleep: Callable[[float], None] = None,
+    ) -> None:
+        self.decrease_factor = decrease_factor
+        self.increase_step = increase_step
+        self.min_rate = min_rate
+        self.max_rate = max_rate
+        self.clock = clock
+        self.sleep = sleep
+        self.token_bucket = None
+        self.measured_rate = 0.0
+        self.current_second = int(clock())
+        self.requests_this_second = 0
+        self.lock = threading.Lock()
+
+    @property
+    def rate(self) -> float:
+        """Current limit in requests per second, None while no throttling has been seen"""
+        return self.token_bucket.rate if self.token_bucket is not None else None
+
+    def record_request(self) -> None:
+        with self.lock:
+            second = int(self.clock())
+            if second != self.current_second:
+                self.measured_rate = (
+                    0.8 * self.requests_this_second / (second - self.current_second)
+                    + 0.2 * self.measured_rate
+                )
+                self.current_second = second
+                self.requests_this_second = 0
+            self.requests_this_second += 1
+
+    def acquire(self) -> None:
+        self.record_request()
+        if self.token_bucket is not None:
+            self.token_bucket.acquire()
+
+    def on_throttle(self) -> None:
+        with self.lock:
+            current_rate = (
+                self.token_bucket.rate
+                if self.token_bucket is not None
+                else max(self.measured_rate, self.requests_this_second)
+            )
+            rate = min(self.max_rate, max(self.min_rate, current_rate * self.decrease_factor))
+            if self.token_bucket is None:
+                self.token_bucket = TokenBucket(rate=rate, clock=self.clock, sleep=self.sleep)
+            else:
+                self.token_bucket.set_rate(rate)
+
+    def on_success(self) -> None:
+        if self.token_bucket is None:
+            return
+        with self.lock:
+            self.token_bucket.set_rate(
+                min(self.max_rate, self.token_bucket.rate + self.increase_step)
+            )
+
+
+class RetryPolicy:
+    """Retries throttled and transient DynamoDB errors with exponential backoff and full jitter,
+    within a retry budget and behind an adaptive client side rate limit"""
+
+    throttling_error_codes = frozenset(
+        {
+            "ProvisionedThroughputExceededException",
+            "ThrottlingException",
+            "RequestLimitExceeded",
+        }
+    )
+    transient_error_codes = frozenset({"InternalServerError", "ServiceUnavailable"})
+
+    def __init__(
+        self,
+        max_attempts: int = 5,
+        base_delay: float = 0.05,
+        max_delay: float = 5.0,
+        retry_budget: RetryBudget = None,
+        rate_limiter: AdaptiveRateLimiter = None,
+    ) -> None:
+        self.max_attempts = max_attempts
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+        self.retry_budget = retry_budget if retry_budget is not None else RetryBudget()
+        self.rate_limiter = (
+            rate_limiter if rate_limiter is not None else AdaptiveRateLimiter()
+        )
+        self.lock = threading.Lock()
+        self.attempts = 0
+        self.retries = 0
+        self.throttles = 0
+        self.budget_exhausted = 0
+
+    @staticmethod
+    def error_code(error: Exception) -> str:
+        return getattr(error, "response", {}).get("Error", {}).get("Code", "")
+
+    def count(self, counter: str) -> None:
+        with self.lock:
+            setattr(self, counter, getattr(self, counter) + 1)
+
+    def call(
+        self,
+        operation: Callable[..., Any],
+        on_retry: Callable[[bool], None] = None,
+        **arguments: Any,
+    ) -> Any:
+        """Call a client operation, retrying throttling and transient errors
+
+        Args:
+            operation (Callable[..., Any]): A boto3 client method such as client.put_item
+            on_retry (Callable[[bool], None], optional): Called before every retry with whether the call was throttled
+            arguments (Any): The arguments of the call
+
+        Raises:
+            DynamoDbThrottlingError: The call was still throttled after every attempt or the retry budget ran out
+
+        Returns:
+            Any: The response of the call, any other error is raised unchanged
+        """
+        attempt = 0
+        while True:
+            self.rate_limiter.acquire()
+            self.count("attempts")
+            try:
+                response = operation(**arguments)
+            except Exception as error:
+                error_code = self.error_code(error)
+                throttled = error_code in self.throttling_error_codes
+                if not throttled and error_code not in self.transient_error_codes:
+                    raise
+                if throttled:
+                    self.count("throttles")
+                    self.rate_limiter.on_throttle()
+                attempt += 1
+                if attempt >= self.max_attempts:
+                    if throttled:
+                        raise DynamoDbThrottlingError from error
+                    raise
+                if not self.retry_budget.withdraw(throttled=throttled):
+                    self.count("budget_exhausted")
+                    if throttled:
+                        raise DynamoDbThrottlingError from error
+                    raise
+                self.count("retries")
+                if on_retry is not None:
+                    on_retry(throttled)
+                time.sleep(
+                    calculate_backoff(
+                        attempt - 1, base_delay=self.base_delay, max_delay=self.max_delay
+                    )
+                )
+                continue
+            self.retry_budget.deposit()
+            self.rate_limiter.on_success()
+            return response
+
+    def stats(self) -> Dict[str, float]:
+        """Counters for tuning the policy"""
+        with self.lock:
+            return {
+                "attempts": self.attempts,
+                "retries": self.retries,
+                "throttles": self.throttles,
+                "budget_exhausted": self.budget_exhausted,
+                "retry_budget": self.retry_budget.tokens,
+                "rate_limit": self.rate_limiter.rate,
+            }
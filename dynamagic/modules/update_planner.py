@@ -0,0 +1,174 @@
+from typing import Any, Dict, FrozenSet, Iterable, List, Optional, Tuple
+from dynamagic.modules.exceptions import (
+    ValidationIncorrectAttributeError,
+    ValidationNoNewAttributesError,
+    ValidationWrongUpdateActionError,
+)
+
+
+class UpdatePlan:
+    """A ready UpdateExpression and ExpressionAttributeNames for one combination of attributes,
+    only the values are bound on each update"""
+
+    def __init__(
+        self,
+        update_expression: str,
+        expression_attribute_names: Dict[str, str],
+        value_placeholders: Dict[str, str],
+        confirmed_attributes: FrozenSet[str],
+    ) -> None:
+        self.update_expression = update_expression
+        self.expression_attribute_names = expression_attribute_names
+        self.value_placeholders = value_placeholders
+        self.confirmed_attributes = confirmed_attributes
+
+    def bind(self, dynamodb_values: Dict[str, Dict[str, Any]]) -> Dict[str, Dict[str, Any]]:
+        """Build the ExpressionAttributeValues from the SET and ADD values in the dynamodb format"""
+        value_placeholders = self.value_placeholders
+        return {
+            value_placeholders[attribute]: value
+            for attribute, value in dynamodb_values.items()
+        }
+
+
+class UpdateExpressionPlanner:
+    """Plans update expressions with SET, REMOVE and ADD clauses and SET if_not_exists, memoised by
+    the attributes used in each clause so repeated updates of the same shape skip building the strings.
+
+    Attributes are always written in the order of the schema so the same attributes give the same
+    expression whatever order they were passed in."""
+
+    addable_types = frozenset({"N", "NS", "SS", "BS", None})
+
+    def __init__(
+        self,
+        expression_mapping: Dict[str, Dict[str, str]],
+        type_tags: Dict[str, Optional[str]],
+        key_attributes: Iterable[str],
+    ) -> None:
+        self.expression_mapping = expression_mapping
+        self.type_tags = type_tags
+        self.key_attributes = frozenset(key_attributes)
+        self.attribute_positions = {
+            attribute: position for position, attribute in enumerate(expression_mapping)
+        }
+        self.plans: Dict[Tuple[FrozenSet[str], ...], UpdatePlan] = dict()
+
+    def plan(
+        self,
+        set_attributes: Iterable[str],
+        remove_attributes: Iterable[str] = (),
+        add_attributes: Iterable[str] = (),
+        if_not_exists_attributes: Iterable[str] = (),
+    ) -> UpdatePlan:
+        """The plan for an update, built the first time these attributes are updated together
+
+        Args:
+            set_attributes (Iterable[str]): Attributes given a new value with SET
+            remove_attributes (Iterable[str], optional): Attributes deleted from the item with REMOVE
+            add_attributes (Iterable[str], optional): Numbers to increment or sets to add members to with ADD
+            if_not_exists_attributes (Iterable[str], optional): SET attributes only written when the item
+            does not have them yet
+
+        Returns:
+            UpdatePlan: The expression, the attribute names and the placeholder of each value
+        """
+        plan_key = (
+            frozenset(set_attributes),
+            frozenset(remove_attributes),
+            frozenset(add_attributes),
+            frozenset(if_not_exists_attributes),
+        )
+        update_plan = self.plans.get(plan_key)
+        if update_plan is None:
+            update_plan = self.plans.setdefault(plan_key, self.build_plan(*plan_key))
+        return update_plan
+
+    def ordered(self, attributes: FrozenSet[str]) -> List[str]:
+        try:
+            return sorted(attributes, key=self.attribute_positions.__getitem__)
+        except KeyError as error:
+            raise ValidationIncorrectAttributeError(data=error.args[0]) from error
+
+    def check_actions(
+        self,
+        set_attributes: FrozenSet[str],
+        remove_attributes: FrozenSet[str],
+        add_attributes: FrozenSet[str],
+        if_not_exists_attributes: FrozenSet[str],
+    ) -> None:
+        """Raise for updates DynamoDB would reject: an attribute in more than one clause, changes to
+        the key, ADD on anything but numbers and sets or if_not_exists on an attribute that is not SET"""
+        wrong_attributes = (
+            (set_attributes & remove_attributes)
+            | (set_attributes & add_attributes)
+            | (remove_attributes & add_attributes)
+            | ((set_attributes | remove_attributes | add_attributes) & self.key_attributes)
+            | (if_not_exists_attributes - set_attributes)
+            | {
+                attribute
+                for attribute in add_attributes
+                if self.type_tags.get(attribute) not in self.addable_types
+            }
+        )
+        if wrong_attributes:
+            raise ValidationWrongUpdateActionError(data=self.ordered(wrong_attributes)[0])
+
+    def build_plan(
+        self,
+        set_attributes: FrozenSet[str],
+        remove_attributes: FrozenSet[str],
+        add_attributes: FrozenSet[str],
+        if_not_exists_attributes: FrozenSet[str],
+    ) -> UpdatePlan:
+        ordered_set = self.ordered(set_attributes)
+        ordered_remove = self.ordered(remove_attributes)
+        ordered_add = self.ordered(add_attributes)
+        if not (ordered_set or ordered_remove or ordered_add):
+            raise ValidationNoNewAttributesError
+        self.check_actions(
+            set_attributes, remove_attributes, add_attributes, if_not_exists_attributes
+        )
+        expression_mapping = self.expression_mapping
+        set_actions = list()
+        for attribute in ordered_set:
+            attribute_name = expression_mapping[attribute]["expression_attribute_name"]
+            attribute_var = expression_mapping[attribute]["expression_attribute_var"]
+            if attribute in if_not_exists_attributes:
+                set_actions.append(
+                    f"{attribute_name} = if_not_exists({attribute_name}, {attribute_var})"
+                )
+            else:
+                set_actions.append(f"{attribute_name} = {attribute_var}")
+        clauses = list()
+        if set_actions:
+            clauses.append(f"SET {', '.join(set_actions)}")
+        if ordered_remove:
+            clauses.append(
+                "REMOVE "
+                + ", ".join(
+                    expression_mapping[attribute]["expression_attribute_name"]
+                    for attribute in ordered_remove
+                )
+            )
+        if ordered_add:
+            clauses.append(
+                "ADD "
+                + ", ".join(
+                    f"{expression_mapping[attribute]['expression_attribute_name']} "
+                    f"{expression_mapping[attribute]['expression_attribute_var']}"
+                    for attribute in ordered_add
+                )
+            )
+        return UpdatePlan(
+            update_expression=" ".join(clauses),
+            expression_attribute_names={
+                expression_mapping[attribute]["expression_attribute_name"]: attribute
+                for attribute in (*ordered_set, *ordered_remove, *ordered_add)
+            },
+            value_placeholders={
+                attribute: expression_mapping[attribute]["expression_attribute_var"]
+                for attribute in (*ordered_set, *ordered_add)
+            },
+            confirmed_attributes=set_attributes - if_not_exists_attributes,
+        )
@@ -1,27 +1,21 @@
-from typing import Dict, List, Union
-
-try:
-    from schema import (
-        Schema,
-        And,
-        SchemaError,
-        SchemaMissingKeyError,
-        SchemaWrongKeyError,
-        Use,
-        Optional,
-    )
-except ModuleNotFoundError:
-    pass
-    # from dynamagic.modules.schema import (
-    #     Schema,
-    #     And,
-    #     SchemaError,
-    #     SchemaMissingKeyError,
-    #     SchemaWrongKeyError,
-    #     Use,
-    #     Optional,
-    # )
+from types import ModuleType
+from typing import TYPE_CHECKING, Any, Dict, Iterable, List, Tuple, Union
+from dynamagic.modules.compiled_schema import CompiledSchema
+from dynamagic.modules.marshalling import (
+    ItemCodec,
+    canonical_value,
+    encode_value,
+    set_member_type,
+)
+from dynamagic.modules.placeholders import (
+    PlaceholderAllocator,
+    allocate_placeholders,
+    expression_token,
+)
+from dynamagic.modules.projection import Projection
+from dynamagic.modules.update_planner import UpdateExpressionPlanner
 from dynamagic.modules.exceptions import (
+    ValidationWrongEngineError,
     ValidationFailedAttributesUpdateError,
     ValidationIncorrectAttributesError,
     ValidationNoNewAttributesError,
@@ -29,31 +23,52 @@ from dynamagic.modules.exceptions import (
     ValidationWrongKeyError,
     ValidationMissingKeyError,
     ValidationIncorrectKeyTypeError,
+    ValidationIncorrectAttributeError,
+    ValidationWrongIndexError,
 )
 
+if TYPE_CHECKING:
+    from schema import Schema
+
+
+def import_schema() -> ModuleType:
+    """Import the schema package only when the schema engine is used, falling back to a copy
+    vendored as dynamagic/modules/schema.py for lambda deployments"""
+    try:
+        import schema
+    except ModuleNotFoundError:
+        from dynamagic.modules import schema
+    return schema
+
 
 class Validation:
-    def __init__(self, table_schema: Union[Dict[str, type], Dict[str, str]]) -> None:
+    validation_engines = ("compiled", "schema")
+
+    def __init__(
+        self,
+        table_schema: Union[Dict[str, type], Dict[str, str]],
+        engine: str = "compiled",
+    ) -> None:
+        if engine not in self.validation_engines:
+            raise ValidationWrongEngineError(data=engine)
+        self.engine = engine
         self.schema_template = table_schema
         self.key_template = dict()
+        self.partition_key = None
+        self.sort_key = None
+        self.index_templates = dict()
+        self.version_attribute = None
         self.new_item_schema = None
         self.update_item_schema = None
         self.dynamodb_key_schema = None
         self.dynamodb_format_mapper = None
         self.expression_mapping = dict()
-        self.format_types = {
-            str: "S",
-            int: "N",
-            float: "N",
-            bytes: "B",
-            list: "SS",
-            List[int]: "NS",
-            List[float]: "NS",
-            List[bytes]: "BS",
-            dict: "M",
-            list: "L",
-        }
+        self.codec = None
+        self.update_planner = None
+        self.projections = dict()
         self.format_schema()
+        self.format_indexes()
+        self.format_version_attribute()
         self.generate_item_schema()
         self.generate_key_schema()
         self.generate_update_item_schema()
@@ -65,76 +80,216 @@ class Validation:
             self.schema_template[
                 self.schema_template["key_name"]
             ] = self.schema_template["key_type"]
+            self.partition_key = self.schema_template.pop("key_name")
             self.key_template = {
-                self.schema_template.pop("key_name"): self.schema_template.pop(
-                    "key_type"
-                )
+                self.partition_key: self.schema_template.pop("key_type")
             }
+            if "sort_key_name" in self.schema_template:
+                self.schema_template[
+                    self.schema_template["sort_key_name"]
+                ] = self.schema_template["sort_key_type"]
+                self.sort_key = self.schema_template.pop("sort_key_name")
+                self.key_template[self.sort_key] = self.schema_template.pop(
+                    "sort_key_type"
+                )
         except KeyError as error:
             raise ValidationWrongKeyError(error) from error
 
+    def format_indexes(self) -> None:
+        """Pull the global and local secondary indexes out of the schema, each index is declared as
+        {"index name": {"key_name": attribute, "sort_key_name": attribute}} with the sort key optional"""
+        for index_name, index_keys in self.schema_template.pop("indexes", dict()).items():
+            index_template = {
+                "partition_key": index_keys.get("key_name", self.partition_key),
+                "sort_key": index_keys.get("sort_key_name"),
+            }
+            for attribute in index_template.values():
+                if attribute is not None and attribute not in self.schema_template:
+                    raise ValidationIncorrectAttributeError(data=attribute)
+            self.index_templates[index_name] = index_template
+
+    def format_version_attribute(self) -> None:
+        """Pull out the attribute that holds the version of each item for optimistic locking,
+        declared as {"version_attribute": attribute} with the attribute itself in the schema as an int"""
+        version_attribute = self.schema_template.pop("version_attribute", None)
+        if version_attribute is None:
+            return
+        if version_attribute not in self.schema_template:
+            raise ValidationIncorrectAttributeError(data=version_attribute)
+        self.version_attribute = version_attribute
+
+    def key_attributes(self, index_name: str = None) -> Union[Tuple[str, str], Exception]:
+        """The partition key and sort key, None when there isn't one, for the table or one of its indexes"""
+        if index_name is None:
+            return self.partition_key, self.sort_key
+        try:
+            index_template = self.index_templates[index_name]
+        except KeyError as error:
+            raise ValidationWrongIndexError(data=index_name) from error
+        return index_template["partition_key"], index_template["sort_key"]
+
+    def validate_attribute_value(
+        self, attribute: str, value: Any
+    ) -> Union[Any, Exception]:
+        """Convert a single value to the type of the attribute in the schema"""
+        try:
+            data_type = self.schema_template[attribute]
+        except KeyError as error:
+            raise ValidationIncorrectAttributeError(data=attribute) from error
+        try:
+            return CompiledSchema.compile_coercer(data_type)(value)
+        except (TypeError, ValueError) as error:
+            raise ValidationIncorrectKeyTypeError(
+                data=repr(attribute), attributes=[attribute]
+            ) from error
+
+    def encode_condition_value(
+        self, attribute: str, value: Any, member: bool = False
+    ) -> Union[Dict[str, Any], Exception]:
+        """Convert a value an attribute is compared with in a condition to the DynamoDB format
+
+        Args:
+            attribute (str): The attribute in the schema the value is compared with
+            value (Any): The readable value
+            member (bool, optional): The value is looked for inside the attribute, a member of a set or list or part of a string. Defaults to False.
+
+        Returns:
+            Union[Dict[str, Any], Exception]: The value in the DynamoDB format or raises an exception when it does not fit the attribute
+        """
+        if member and self.codec.type_tags.get(attribute) not in ("S", "B"):
+            if attribute not in self.schema_template:
+                raise ValidationIncorrectAttributeError(data=attribute)
+            member_type = set_member_type(self.schema_template[attribute])
+            try:
+                return encode_value(
+                    CompiledSchema.compile_coercer(member_type)(value)
+                    if member_type is not None
+                    else value
+                )
+            except (TypeError, ValueError) as error:
+                raise ValidationIncorrectKeyTypeError(
+                    data=repr(attribute), attributes=[attribute]
+                ) from error
+        return self.validate_item_to_db_format(
+            dynamodb_item={
+                attribute: self.validate_attribute_value(attribute=attribute, value=value)
+            }
+        )[attribute]
+
     def generate_item_schema(self) -> None:
-        self.new_item_schema = Schema(
+        if self.engine == "compiled":
+            self.new_item_schema = CompiledSchema(
+                attribute_types=self.schema_template,
+                required_attributes=[
+                    attribute
+                    for attribute in self.schema_template
+                    if attribute != self.version_attribute
+                ],
+            )
+            return
+        schema = import_schema()
+        self.new_item_schema = schema.Schema(
             {
-                attribute: And(Use(data_type))
+                schema.Optional(attribute)
+                if attribute == self.version_attribute
+                else attribute: schema.And(schema.Use(data_type))
                 for attribute, data_type in self.schema_template.items()
             }
         )
 
     def generate_key_schema(self) -> None:
-        self.dynamodb_key_schema = Schema(
+        if self.engine == "compiled":
+            self.dynamodb_key_schema = CompiledSchema(
+                attribute_types=self.key_template,
+                required_attributes=self.key_template.keys(),
+            )
+            return
+        schema = import_schema()
+        self.dynamodb_key_schema = schema.Schema(
             {
-                attribute: And(Use(data_type))
+                attribute: schema.And(schema.Use(data_type))
                 for attribute, data_type in self.key_template.items()
             }
         )
 
     def generate_update_item_schema(self) -> None:
-        self.update_item_schema = Schema(
+        if self.engine == "compiled":
+            self.update_item_schema = CompiledSchema(
+                attribute_types=self.schema_template,
+                required_attributes=self.key_template.keys(),
+            )
+            return
+        schema = import_schema()
+        self.update_item_schema = schema.Schema(
             {
-                Optional(attribute)
+                schema.Optional(attribute)
                 if attribute not in self.key_template
-                else attribute: And(Use(data_type))
+                else attribute: schema.And(schema.Use(data_type))
                 for attribute, data_type in self.schema_template.items()
             }
         )
 
     def generate_format_mapper(self) -> None:
+        """Build the codec for the schema once, the dynamodb_type is None for attributes such as Any
+        whose type is worked out from each value"""
+        self.codec = ItemCodec(attribute_types=self.schema_template)
         self.dynamodb_format_mapper = {
-            attribute: {"dynamodb_type": self.format_types[data_type]}
-            for attribute, data_type in self.schema_template.items()
+            attribute: {"dynamodb_type": type_tag}
+            for attribute, type_tag in self.codec.type_tags.items()
         }
 
     def expression_selection(self, attribute: str) -> Dict[str, str]:
-        new_expression = dict()
-        attribute_names = list(self.expression_mapping.keys())
-        attribute_vars = [
-            self.expression_mapping[expression_attribute]["expression_attribute_var"]
-            for expression_attribute in attribute_names
-        ]
-        for index in range(0, len(attribute)):
-            if f":{attribute[index]}".lower() not in attribute_vars:
-                new_expression = {
-                    "expression_attribute_name": f"#{attribute[index]}".upper(),
-                    "expression_attribute_var": f":{attribute[index]}".lower(),
-                }
-                break
-            elif f":{attribute[:index + 2]}".lower() not in attribute_vars:
-                new_expression = {
-                    "expression_attribute_name": f"#{attribute[:index + 2]}".upper(),
-                    "expression_attribute_var": f":{attribute[:index + 2]}".lower(),
-                }
-                break
-
-        return new_expression
+        """Placeholders for the attribute that are not used by any attribute in the expression mapping"""
+        placeholder_allocator = PlaceholderAllocator(
+            used_tokens=map(expression_token, self.expression_mapping.values())
+        )
+        return placeholder_allocator.placeholders(
+            placeholder_allocator.allocate(attribute)
+        )
 
     def generate_expression_mapper(self) -> None:
-        for attribute in self.schema_template.keys():
-            self.expression_mapping[attribute] = self.expression_selection(
-                attribute=attribute
+        """Give every attribute its placeholders in one pass, schemas seen before in the process reuse
+        the placeholders that were allocated for them"""
+        self.expression_mapping.update(
+            allocate_placeholders(
+                attributes=self.schema_template.keys(),
+                expression_mapping=self.expression_mapping,
+            )
+        )
+        self.update_planner = UpdateExpressionPlanner(
+            expression_mapping=self.expression_mapping,
+            type_tags=self.codec.type_tags,
+            key_attributes=self.key_template,
+        )
+
+    def projection(self, attributes: Iterable[str]) -> Union[Projection, Exception]:
+        """The projection that reads only the attributes given, built once for each list of attributes
+
+        Args:
+            attributes (Iterable[str]): Names of the attributes in the schema to read
+
+        Returns:
+            Union[Projection, Exception]: Returns the projection or raises an exception for attributes that are not in the schema
+        """
+        attributes = tuple(dict.fromkeys(attributes))
+        projection: Projection = self.projections.get(attributes)
+        if projection is None:
+            for attribute in attributes:
+                if attribute not in self.expression_mapping:
+                    raise ValidationIncorrectAttributeError(data=attribute)
+            projection = self.projections.setdefault(
+                attributes,
+                Projection(
+                    attributes=attributes,
+                    expression_mapping=self.expression_mapping,
+                    codec=self.codec,
+                ),
             )
+        return projection
 
-    def validation_schema(self, validation_type: str) -> Union[Schema, Exception]:
+    def validation_schema(
+        self, validation_type: str
+    ) -> Union["Schema", CompiledSchema, Exception]:
         if validation_type == "new_item":
             return self.new_item_schema
         if validation_type == "update_item":
@@ -146,32 +301,66 @@ class Validation:
 
     @staticmethod
     def validate_item_data_entegrity(
-        dynamodb_schema: Schema, unvalidated_item: Dict[str, str]
+        dynamodb_schema: Union["Schema", CompiledSchema],
+        unvalidated_item: Dict[str, str],
     ) -> Union[Dict[str, str], Exception]:
+        if isinstance(dynamodb_schema, CompiledSchema):
+            return dynamodb_schema.validate(unvalidated_item)
+        schema = import_schema()
         try:
             return dynamodb_schema.validate(unvalidated_item)
-        except SchemaWrongKeyError as error:
+        except schema.SchemaWrongKeyError as error:
             raise ValidationWrongKeyError(data=str(error).split()[2]) from error
-        except SchemaMissingKeyError as error:
+        except schema.SchemaMissingKeyError as error:
             raise ValidationMissingKeyError(data=str(error).split()[2]) from error
-        except SchemaError as error:
+        except schema.SchemaError as error:
             raise ValidationIncorrectKeyTypeError(data=str(error).split()[1]) from error
 
     def validate_item_to_db_format(
-        self, dynamodb_item: Dict[str, str]
-    ) -> Dict[str, Dict[str, str]]:
-        return {
-            attribute: {self.dynamodb_format_mapper[attribute]["dynamodb_type"]: value}
-            for attribute, value in dynamodb_item.items()
-        }
+        self, dynamodb_item: Dict[str, Any]
+    ) -> Union[Dict[str, Dict[str, Any]], Exception]:
+        """Marshal a validated item into the DynamoDB format, nested maps, lists and sets included
+
+        Args:
+            dynamodb_item (Dict[str, Any]): Item with values of the schema types
+
+        Returns:
+            Union[Dict[str, Dict[str, Any]], Exception]: The item in the DynamoDB format or raises an exception
+            for attributes that are not in the schema or values DynamoDB cannot store
+        """
+        try:
+            return self.codec.encode_item(dynamodb_item)
+        except KeyError as error:
+            raise ValidationIncorrectAttributeError(data=error.args[0]) from error
+        except (TypeError, ValueError) as error:
+            attribute = next(
+                attribute
+                for attribute, value in dynamodb_item.items()
+                if not self.can_encode(attribute, value)
+            )
+            raise ValidationIncorrectKeyTypeError(
+                data=repr(attribute), attributes=[attribute]
+            ) from error
+
+    def can_encode(self, attribute: str, value: Any) -> bool:
+        try:
+            self.codec.encoders[attribute](value)
+        except (TypeError, ValueError):
+            return False
+        return True
 
     def validate_item_to_readable_format(
-        self, dynamodb_item: Dict[str, Dict[str, str]]
-    ) -> Dict[str, str]:
-        return {
-            attribute: value[self.dynamodb_format_mapper[attribute]["dynamodb_type"]]
-            for attribute, value in dynamodb_item.items()
-        }
+        self, dynamodb_item: Dict[str, Dict[str, Any]]
+    ) -> Dict[str, Any]:
+        """Unmarshal an item in the DynamoDB format, attributes that are not in the schema are decoded
+        from the type DynamoDB returned"""
+        return self.codec.decode_item(dynamodb_item)
+
+    def validate_items_to_readable_format(
+        self, dynamodb_items: Iterable[Dict[str, Dict[str, Any]]]
+    ) -> List[Dict[str, Any]]:
+        """Unmarshal a list of items in the DynamoDB format such as a page from a scan or query"""
+        return self.codec.decode_items(dynamodb_items)
 
     def validate_new_attributes_exist(
         self, item_attributes: Dict[str, str]
@@ -196,9 +385,15 @@ class Validation:
             Union[bool, Exception]: Returns True if the response data is correct or raises Exception if failed
         """
         try:
-            if response["Attributes"] == validated_new_attributes:
-                return True
-            if response["Attributes"] != validated_new_attributes:
-                raise ValidationIncorrectAttributesError
+            updated_attributes = response["Attributes"]
         except KeyError as error:
             raise ValidationFailedAttributesUpdateError from error
+        if updated_attributes == validated_new_attributes:
+            return True
+        if all(
+            attribute in updated_attributes
+            and canonical_value(updated_attributes[attribute]) == canonical_value(value)
+            for attribute, value in validated_new_attributes.items()
+        ):
+            return True
+        raise ValidationIncorrectAttributesError
@@ -0,0 +1,112 @@
+from typing import Any, Dict, Hashable, List, Tuple, Union
+from dynamagic.dynamodb_client import DynamodbClient
+from dynamagic.modules.exceptions import ValidationWrongOperationError
+from dynamagic.modules.rate_limiter import TokenBucket
+
+
+class OperationExecutor:
+    """Run many DynamodbClient operations at once from synchronous code.
+
+    Operations on the same key run one after the other in the order given, operations on
+    different keys run concurrently on a thread pool sharing the client's boto3 client."""
+
+    operation_arguments = {
+        "create_item": "dynamodb_item",
+        "update_item": "dynamodb_attributes",
+        "fetch_item": "key",
+        "delete_item": "key",
+    }
+
+    def __init__(
+        self,
+        dynamodb_client: DynamodbClient,
+        max_workers: int = 10,
+        rate_limiter: TokenBucket = None,
+    ) -> None:
+        self.dynamodb_client = dynamodb_client
+        self.max_workers = max_workers
+        self.rate_limiter = rate_limiter
+        self.executor = None
+
+    def __enter__(self) -> "OperationExecutor":
+        return self
+
+    def __exit__(self, *exception_details: Any) -> None:
+        self.close()
+
+    def close(self) -> None:
+        """Shut down the thread pool, the executor can still be used and will start a new one"""
+        if self.executor is not None:
+            self.executor.shutdown(wait=True)
+            self.executor = None
+
+    def lane_key(self, position: int, operation: Dict[str, Any]) -> Hashable:
+        """Operations with the same validated key values share a lane, so {"id": 1} and {"id": "1"} run in order,
+        anything without a valid key gets its own"""
+        payload = operation.get("payload")
+        if not isinstance(payload, dict):
+            return ("position", position)
+        try:
+            validated_key: Dict[str, Any] = self.dynamodb_client.validate_data(
+                validation_type="read_item",
+                unvalidated_data={
+                    key_name: payload[key_name]
+                    for key_name in self.dynamodb_client.validation.key_template
+                    if key_name in payload
+                },
+            )
+        except self.dynamodb_client.client_exceptions:
+            return ("position", position)
+        return ("key", self.dynamodb_client.key_values(validated_key))
+
+    def run_operation(self, operation: Dict[str, Any]) -> Dict[str, Union[int, Any]]:
+        operation_name = operation.get("operation")
+        if operation_name not in self.operation_arguments:
+            return {
+                "statusCode": 400,
+                "body": str(ValidationWrongOperationError(operation_name)),
+            }
+        if self.rate_limiter is not None:
+            self.rate_limiter.acquire()
+        return getattr(self.dynamodb_client, operation_name)(
+            **{self.operation_arguments[operation_name]: operation.get("payload")}
+        )
+
+    def run_lane(
+        self,
+        lane: List[Tuple[int, Dict[str, Any]]],
+        results: List[Dict[str, Union[int, Any]]],
+    ) -> None:
+        for position, operation in lane:
+            results[position] = self.run_operation(operation)
+
+    def run(
+        self, operations: List[Dict[str, Any]]
+    ) -> List[Dict[str, Union[int, Any]]]:
+        """Run the operations and wait for all of them to finish
+
+        Args:
+            operations (List[Dict[str, Any]]): Operations such as
+            {"operation": "update_item", "payload": {"CustomerId": "1", "car": "Volvo"}}
+
+        Returns:
+            List[Dict[str, Union[int, Any]]]: The response of each operation in the order they were given
+        """
+        if self.executor is None:
+            from concurrent.futures import ThreadPoolExecutor
+
+            self.executor = ThreadPoolExecutor(max_workers=self.max_workers)
+        self.dynamodb_client.warm()
+        lanes: Dict[Hashable, List[Tuple[int, Dict[str, Any]]]] = dict()
+        for position, operation in enumerate(operations):
+            lanes.setdefault(self.lane_key(position, operation), list()).append(
+                (position, operation)
+            )
+        results: List[Dict[str, Union[int, Any]]] = [None] * len(operations)
+        futures = [
+            self.executor.submit(self.run_lane, lane, results)
+            for lane in lanes.values()
+        ]
+        for future in futures:
+            future.result()
+        return results
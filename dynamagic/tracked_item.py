@@ -0,0 +1,120 @@
+from collections.abc import MutableMapping
+from typing import TYPE_CHECKING, Any, Dict, Iterator, Set, Union
+from dynamagic.modules.exceptions import ValidationWrongUpdateActionError
+
+if TYPE_CHECKING:
+    from dynamagic.dynamodb_client import DynamodbClient
+
+
+class TrackedItem(MutableMapping):
+    """An item fetched with fetch_item(tracked=True) that records which attributes are changed or deleted
+    in memory, so save() sends an update with only those attributes and without reading the item again.
+
+    When the schema has a version_attribute the save only succeeds while the item is still at the version
+    that was fetched and the version is increased by one. Changes made inside a value, such as adding to
+    a set in place, are not seen, assign the value again or call mark_modified."""
+
+    def __init__(self, dynamodb_client: "DynamodbClient", item: Dict[str, Any]) -> None:
+        self.dynamodb_client = dynamodb_client
+        self.item = dict(item)
+        self.modified_attributes: Set[str] = set()
+        self.removed_attributes: Set[str] = set()
+
+    def __getitem__(self, attribute: str) -> Any:
+        return self.item[attribute]
+
+    def __setitem__(self, attribute: str, value: Any) -> None:
+        if attribute in self.dynamodb_client.validation.key_template:
+            raise ValidationWrongUpdateActionError(data=attribute)
+        if attribute in self.item and self.item[attribute] == value:
+            return
+        self.item[attribute] = value
+        self.modified_attributes.add(attribute)
+        self.removed_attributes.discard(attribute)
+
+    def __delitem__(self, attribute: str) -> None:
+        if attribute in self.dynamodb_client.validation.key_template:
+            raise ValidationWrongUpdateActionError(data=attribute)
+        del self.item[attribute]
+        self.modified_attributes.discard(attribute)
+        self.removed_attributes.add(attribute)
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self.item)
+
+    def __len__(self) -> int:
+        return len(self.item)
+
+    def __repr__(self) -> str:
+        return f"TrackedItem({self.item!r})"
+
+    @property
+    def is_modified(self) -> bool:
+        return bool(self.modified_attributes or self.removed_attributes)
+
+    def mark_modified(self, attribute: str) -> None:
+        """Save the attribute on the next save(), for values that were changed in place"""
+        if attribute not in self.item:
+            raise KeyError(attribute)
+        self.modified_attributes.add(attribute)
+
+    def to_dict(self) -> Dict[str, Any]:
+        return dict(self.item)
+
+    def update_arguments(self) -> Dict[str, Any]:
+        """The update_item arguments for the changes, None when there is nothing to save"""
+        validation = self.dynamodb_client.validation
+        version_attribute = validation.version_attribute
+        expected_version: int = None
+        if version_attribute is not None:
+            self.modified_attributes.discard(version_attribute)
+            self.removed_attributes.discard(version_attribute)
+            expected_version = self.item.get(version_attribute) or 0
+        if not self.is_modified:
+            return None
+        return {
+            "dynamodb_attributes": {
+                **{key_name: self.item[key_name] for key_name in validation.key_template},
+                **{attribute: self.item[attribute] for attribute in self.modified_attributes},
+            },
+            "remove_attributes": tuple(self.removed_attributes),
+            "expected_version": expected_version,
+        }
+
+    def saved(self, expected_version: int) -> None:
+        self.modified_attributes.clear()
+        self.removed_attributes.clear()
+        if expected_version is not None:
+            self.item[self.dynamodb_client.validation.version_attribute] = (
+                expected_version + 1
+            )
+
+    def save(self) -> Dict[str, Union[int, str]]:
+        """Update the changed and deleted attributes of the item, nothing is sent when there are none
+
+        Returns:
+            Dict[str, Union[int, str]]: Returns a status code and a body telling you if it passed or failed
+        """
+        update_arguments = self.update_arguments()
+        if update_arguments is None:
+            return {
+                "statusCode": 200,
+                "body": "Item with the key provided has no changes to save",
+            }
+        response = self.dynamodb_client.update_item(**update_arguments)
+        if response["statusCode"] == 200:
+            self.saved(expected_version=update_arguments["expected_version"])
+        return response
+
+    def push(self) -> Union[bool, Exception]:
+        """Like save but raises the exception that stopped the update, such as DynamoDbVersionConflictError
+
+        Returns:
+            Union[bool, Exception]: Returns True when the changes were saved and False when there were none
+        """
+        update_arguments = self.update_arguments()
+        if update_arguments is None:
+            return False
+        self.dynamodb_client.apply_update(**update_arguments)
+        self.saved(expected_version=update_arguments["expected_version"])
+        return True
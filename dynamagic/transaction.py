@@ -0,0 +1,312 @@
+from typing import TYPE_CHECKING, Any, Dict, Iterable, List, Tuple, Union
+import dynamagic.modules.exceptions as dynamodb_exceptions
+from dynamagic.modules.metrics import MetricsRecorder, timed
+
+if TYPE_CHECKING:
+    from dynamagic.dynamodb_client import DynamodbClient
+
+
+class TransactionBuilder:
+    """Collects puts, updates, deletes and condition checks and writes them in a single
+    transact_write_items call, so either every item is written or none are. Each item is validated
+    with the schema of its client when it is added, pass the DynamodbClient of another table to
+    write items on more than one table.
+
+    With a client_request_token committing is idempotent, committing the same items with the same
+    token again within ten minutes succeeds without writing them a second time."""
+
+    max_items = 100
+
+    def __init__(
+        self, dynamodb_client: "DynamodbClient", client_request_token: str = None
+    ) -> None:
+        self.dynamodb_client = dynamodb_client
+        self.client_request_token = client_request_token
+        self.transact_items: List[Dict[str, Dict[str, Any]]] = list()
+        self.transaction_items: List[
+            Tuple["DynamodbClient", str, Tuple[str, ...], int]
+        ] = list()
+
+    def __len__(self) -> int:
+        return len(self.transact_items)
+
+    @property
+    def metrics(self) -> MetricsRecorder:
+        return self.dynamodb_client.metrics
+
+    def add(
+        self,
+        dynamodb_client: "DynamodbClient",
+        operation: str,
+        key_values: Tuple[str, ...],
+        expected_version: int,
+        transact_item: Dict[str, Dict[str, Any]],
+    ) -> "TransactionBuilder":
+        if len(self.transact_items) >= self.max_items:
+            raise dynamodb_exceptions.ValidationTooManyTransactionItemsError(
+                data=len(self.transact_items) + 1
+            )
+        for transaction_client, _, transaction_key_values, _ in self.transaction_items:
+            if (
+                transaction_client.dynamodb_table == dynamodb_client.dynamodb_table
+                and transaction_key_values == key_values
+            ):
+                raise dynamodb_exceptions.ValidationDuplicateTransactionItemError(
+                    data=dynamodb_client.readable_key(key_values)
+                )
+        self.transact_items.append(transact_item)
+        self.transaction_items.append(
+            (dynamodb_client, operation, key_values, expected_version)
+        )
+        return self
+
+    def create_item(
+        self, dynamodb_item: Dict[str, Any], dynamodb_client: "DynamodbClient" = None
+    ) -> "TransactionBuilder":
+        """Put a new item, conditioned on its version, or on the item not existing yet, when the schema has a version_attribute
+
+        Args:
+            dynamodb_item (Dict[str, Any]): Attributes for the item including its key
+            dynamodb_client (DynamodbClient, optional): Client of the table the item is on. Defaults to the client of the transaction.
+        """
+        dynamodb_client = dynamodb_client or self.dynamodb_client
+        validated_item: Dict[str, Any] = dynamodb_client.validate_data(
+            validation_type="new_item", unvalidated_data=dynamodb_item
+        )
+        expected_version, condition_arguments = dynamodb_client.prepare_versioned_put(
+            validated_item=validated_item
+        )
+        return self.add(
+            dynamodb_client=dynamodb_client,
+            operation="create_item",
+            key_values=dynamodb_client.key_values(validated_item),
+            expected_version=expected_version,
+            transact_item={
+                "Put": {
+                    "TableName": dynamodb_client.dynamodb_table,
+                    "Item": dynamodb_client.validation.validate_item_to_db_format(
+                        validated_item
+                    ),
+                    **condition_arguments,
+                }
+            },
+        )
+
+    def update_item(
+        self,
+        dynamodb_attributes: Dict[str, Any],
+        remove_attributes: Iterable[str] = (),
+        add_attributes: Dict[str, Any] = None,
+        if_not_exists: Iterable[str] = (),
+        expected_version: int = None,
+        dynamodb_client: "DynamodbClient" = None,
+    ) -> "TransactionBuilder":
+        """Update an existing item, takes the same arguments as DynamodbClient.update_item apart from diff_existing
+
+        Args:
+            dynamodb_attributes (Dict[str, Any]): Provide your key along with the attribute names you want to update
+            remove_attributes (Iterable[str], optional): Attributes to remove from the item
+            add_attributes (Dict[str, Any], optional): Amounts to add to number attributes or members to add to set attributes
+            if_not_exists (Iterable[str], optional): Attributes of dynamodb_attributes that are only set when the item does not have them yet
+            expected_version (int, optional): Only update while the item is at this version, needs a version_attribute in the schema
+            dynamodb_client (DynamodbClient, optional): Client of the table the item is on. Defaults to the client of the transaction.
+        """
+        dynamodb_client = dynamodb_client or self.dynamodb_client
+        (
+            key,
+            key_values,
+            validated_attributes,
+            expected_version,
+        ) = dynamodb_client.validate_update(
+            dynamodb_attributes=dynamodb_attributes, expected_version=expected_version
+        )
+        (
+            update_expression,
+            expression_attribute_names,
+            expression_attribute_values,
+            condition_expression,
+            _,
+        ) = dynamodb_client.plan_update(
+            validated_attributes=validated_attributes,
+            remove_attributes=remove_attributes,
+            add_attributes=add_attributes,
+            if_not_exists=if_not_exists,
+            expected_version=expected_version,
+        )
+        update: Dict[str, Any] = {
+            "TableName": dynamodb_client.dynamodb_table,
+            "Key": key,
+            "UpdateExpression": update_expression,
+            "ConditionExpression": condition_expression,
+            "ExpressionAttributeNames": expression_attribute_names,
+        }
+        if expression_attribute_values:
+            update["ExpressionAttributeValues"] = expression_attribute_values
+        return self.add(
+            dynamodb_client=dynamodb_client,
+            operation="update_item",
+            key_values=key_values,
+            expected_version=expected_version,
+            transact_item={"Update": update},
+        )
+
+    def delete_item(
+        self,
+        key: Dict[str, Any],
+        expected_version: int = None,
+        dynamodb_client: "DynamodbClient" = None,
+    ) -> "TransactionBuilder":
+        """Delete an item, only while it is at expected_version when one is given
+
+        Args:
+            key (Dict[str, Any]): The key for the item in the database
+            expected_version (int, optional): Only delete while the item is at this version, required when the schema has a version_attribute
+            dynamodb_client (DynamodbClient, optional): Client of the table the item is on. Defaults to the client of the transaction.
+        """
+        dynamodb_client = dynamodb_client or self.dynamodb_client
+        validated_key: Dict[str, Any] = dynamodb_client.validate_data(
+            validation_type="delete_item", unvalidated_data=key
+        )
+        if (
+            dynamodb_client.validation.version_attribute is not None
+            and expected_version is None
+        ):
+            raise dynamodb_exceptions.ValidationMissingVersionError(data="delete_item")
+        condition_arguments: Dict[str, Union[str, Dict[str, str]]] = dict()
+        if expected_version is not None:
+            condition_arguments = dynamodb_client.generate_version_condition_arguments(
+                expected_version=expected_version
+            )
+        return self.add(
+            dynamodb_client=dynamodb_client,
+            operation="delete_item",
+            key_values=dynamodb_client.key_values(validated_key),
+            expected_version=expected_version,
+            transact_item={
+                "Delete": {
+                    "TableName": dynamodb_client.dynamodb_table,
+                    "Key": dynamodb_client.validation.validate_item_to_db_format(
+                        dynamodb_item=validated_key
+                    ),
+                    **condition_arguments,
+                }
+            },
+        )
+
+    def condition_check(
+        self,
+        key: Dict[str, Any],
+        expected_version: int = None,
+        dynamodb_client: "DynamodbClient" = None,
+    ) -> "TransactionBuilder":
+        """Only write the transaction while an item that is not written exists, or is at expected_version
+
+        Args:
+            key (Dict[str, Any]): The key for the item in the database
+            expected_version (int, optional): The version the item must be at, needs a version_attribute in the schema
+            dynamodb_client (DynamodbClient, optional): Client of the table the item is on. Defaults to the client of the transaction.
+        """
+        dynamodb_client = dynamodb_client or self.dynamodb_client
+        validated_key: Dict[str, Any] = dynamodb_client.validate_data(
+            validation_type="read_item", unvalidated_data=key
+        )
+        if expected_version is None:
+            (
+                condition_expression,
+                expression_attribute_names,
+            ) = dynamodb_client.generate_key_exists_condition()
+            condition_arguments: Dict[str, Union[str, Dict[str, str]]] = {
+                "ConditionExpression": condition_expression,
+                "ExpressionAttributeNames": expression_attribute_names,
+            }
+        else:
+            condition_arguments = dynamodb_client.generate_version_condition_arguments(
+                expected_version=expected_version
+            )
+        return self.add(
+            dynamodb_client=dynamodb_client,
+            operation="condition_check",
+            key_values=dynamodb_client.key_values(validated_key),
+            expected_version=expected_version,
+            transact_item={
+                "ConditionCheck": {
+                    "TableName": dynamodb_client.dynamodb_table,
+                    "Key": dynamodb_client.validation.validate_item_to_db_format(
+                        dynamodb_item=validated_key
+                    ),
+                    **condition_arguments,
+                }
+            },
+        )
+
+    def item_results(self, reason_codes: List[str]) -> List[Dict[str, Union[int, str]]]:
+        """Turn the cancellation reason of every item into a status code and the error for that item
+
+        Args:
+            reason_codes (List[str]): The cancellation reason code of each item in the order they were added
+
+        Returns:
+            List[Dict[str, Union[int, str]]]: Returns a status code and body for every item in the order they were added
+        """
+        item_results: List[Dict[str, Union[int, str]]] = list()
+        for index, (dynamodb_client, operation, key_values, expected_version) in enumerate(
+            self.transaction_items
+        ):
+            reason_code: str = reason_codes[index] if index < len(reason_codes) else "None"
+            if reason_code in ("None", ""):
+                item_results.append(
+                    {
+                        "statusCode": 400,
+                        "body": "The item was not written because another item in the transaction failed",
+                    }
+                )
+                continue
+            if reason_code == "ConditionalCheckFailed" and expected_version is not None:
+                error = dynamodb_exceptions.DynamoDbVersionConflictError(
+                    data=expected_version
+                )
+            elif reason_code == "ConditionalCheckFailed" and operation == "create_item":
+                error = dynamodb_exceptions.DynamoDbItemExistsError(
+                    data=dynamodb_client.readable_key(key_values)
+                )
+            elif reason_code == "ConditionalCheckFailed":
+                error = dynamodb_exceptions.DynamoDbWrongKeyError()
+            elif reason_code == "TransactionConflict":
+                error = dynamodb_exceptions.DynamoDbTransactionConflictError()
+            elif reason_code in ("ThrottlingError", "ProvisionedThroughputExceeded"):
+                error = dynamodb_exceptions.DynamoDbThrottlingError()
+            else:
+                error = dynamodb_exceptions.DynamoDbTransactionCanceledError(
+                    data=[reason_code]
+                )
+            item_results.append({"statusCode": 400, "body": str(error)})
+        return item_results
+
+    @timed("commit_transaction")
+    def commit(self) -> Dict[str, Union[int, str, List[Dict[str, Union[int, str]]]]]:
+        """Write every item of the transaction in one transact_write_items call
+
+        Returns:
+            Dict[str, Union[int, str, List[Dict[str, Union[int, str]]]]]: Returns a status code and a body telling you
+            if it passed, a list with the status code and error of every item when the transaction was cancelled, or the error
+        """
+        if not self.transact_items:
+            return {"statusCode": 200, "body": "Transaction has no items to write"}
+        try:
+            self.dynamodb_client.transact_write(
+                transact_items=self.transact_items,
+                client_request_token=self.client_request_token,
+            )
+        except dynamodb_exceptions.DynamoDbTransactionCanceledError as error:
+            self.metrics.record_error("commit_transaction", error)
+            return {"statusCode": 400, "body": self.item_results(error.data)}
+        except self.dynamodb_client.client_exceptions as error:
+            self.metrics.record_error("commit_transaction", error)
+            return {"statusCode": 400, "body": str(error)}
+        finally:
+            for dynamodb_client, _, key_values, _ in self.transaction_items:
+                dynamodb_client.invalidate_cached_item(key_values=key_values)
+        return {
+            "statusCode": 200,
+            "body": f"Transaction with {len(self.transact_items)} items has been written successfully",
+        }
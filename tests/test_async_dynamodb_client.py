@@ -0,0 +1,189 @@
+import asyncio
+import boto3
+from moto import mock_dynamodb2
+from dynamagic.async_dynamodb_client import AsyncDynamodbClient
+from dynamagic.dynamodb_client import DynamodbClient
+from dynamagic.modules.client_registry import client_registry
+from dynamagic.tracked_item import TrackedItem
+import unittest
+
+
+class TestAsyncDynamoDBClient(unittest.TestCase):
+    def setUp(self):
+        client_registry.clear()
+
+    @staticmethod
+    def generate_schema_template():
+        return {
+            "key_name": "CustomerId",
+            "key_type": str,
+            "name": str,
+            "address": str,
+            "age": str,
+            "car": str,
+        }
+
+    @staticmethod
+    @mock_dynamodb2
+    def create_table():
+        client = boto3.client("dynamodb", region_name="eu-west-2")
+        client.create_table(
+            TableName="test_table",
+            ProvisionedThroughput={"ReadCapacityUnits": 140, "WriteCapacityUnits": 140},
+            AttributeDefinitions=[
+                {"AttributeName": "CustomerId", "AttributeType": "S"}
+            ],
+            KeySchema=[{"AttributeName": "CustomerId", "KeyType": "HASH"}],
+            BillingMode="PROVISIONED",
+        )
+        client.get_waiter("table_exists").wait(
+            TableName="test_table", WaiterConfig={"Delay": 2, "MaxAttempts": 5}
+        )
+
+    @staticmethod
+    def generate_item(customer_id: str):
+        return {
+            "CustomerId": customer_id,
+            "name": f"Customer {customer_id}",
+            "address": "1 Test Street",
+            "age": "30",
+            "car": "Tesla",
+        }
+
+    def test_shares_validation_with_sync_client(self):
+        dynamodb_client = DynamodbClient(
+            dynamodb_table="test_table", table_schema=self.generate_schema_template()
+        )
+        async_client = AsyncDynamodbClient(dynamodb_client=dynamodb_client)
+        self.assertIs(async_client.validation, dynamodb_client.validation)
+
+    @mock_dynamodb2
+    def test_crud_operations(self):
+        self.create_table()
+
+        async def run_operations():
+            async with AsyncDynamodbClient(
+                dynamodb_table="test_table",
+                table_schema=self.generate_schema_template(),
+            ) as async_client:
+                created = await async_client.create_item(
+                    dynamodb_item=self.generate_item("1")
+                )
+                updated = await async_client.update_item(
+                    dynamodb_attributes={"CustomerId": "1", "car": "Volvo"}
+                )
+                fetched = await async_client.fetch_item(key={"CustomerId": "1"})
+                scanned = await async_client.fetch_items()
+                deleted = await async_client.delete_item(key={"CustomerId": "1"})
+                missing = await async_client.fetch_item(key={"CustomerId": "1"})
+                return created, updated, fetched, scanned, deleted, missing
+
+        created, updated, fetched, scanned, deleted, missing = asyncio.run(
+            run_operations()
+        )
+        self.assertEqual(
+            created, {"statusCode": 200, "body": "Created new item with key: 1"}
+        )
+        self.assertEqual(updated["statusCode"], 200)
+        self.assertEqual(fetched["statusCode"], 200)
+        self.assertEqual(fetched["body"]["car"], "Volvo")
+        self.assertEqual(scanned["statusCode"], 200)
+        self.assertEqual(len(scanned["body"]), 1)
+        self.assertEqual(
+            deleted, {"statusCode": 200, "body": "Item with key: 1 has been deleted"}
+        )
+        self.assertEqual(missing["statusCode"], 400)
+
+    @mock_dynamodb2
+    def test_fetch_item_forwards_options(self):
+        self.create_table()
+
+        async def fetch_tracked_item():
+            async with AsyncDynamodbClient(
+                dynamodb_table="test_table",
+                table_schema=self.generate_schema_template(),
+            ) as async_client:
+                await async_client.create_item(dynamodb_item=self.generate_item("1"))
+                return await async_client.fetch_item(
+                    key={"CustomerId": "1"},
+                    tracked=True,
+                    consistent_read=True,
+                    attributes=["car"],
+                )
+
+        fetched = asyncio.run(fetch_tracked_item())
+        self.assertEqual(fetched["statusCode"], 200)
+        self.assertIsInstance(fetched["body"], TrackedItem)
+        self.assertEqual(fetched["body"]["car"], "Tesla")
+
+    @mock_dynamodb2
+    def test_failing_operation_returns_response(self):
+        self.create_table()
+
+        async def create_invalid_item():
+            async with AsyncDynamodbClient(
+                dynamodb_table="test_table",
+                table_schema=self.generate_schema_template(),
+            ) as async_client:
+                return await async_client.create_item(
+                    dynamodb_item={"CustomerId": "1", "name": "Customer 1"}
+                )
+
+        self.assertEqual(asyncio.run(create_invalid_item())["statusCode"], 400)
+
+    @mock_dynamodb2
+    def test_gather_keeps_order(self):
+        self.create_table()
+
+        async def fan_out():
+            async with AsyncDynamodbClient(
+                dynamodb_table="test_table",
+                table_schema=self.generate_schema_template(),
+                max_workers=4,
+            ) as async_client:
+                await async_client.gather(
+                    *(
+                        async_client.create_item(
+                            dynamodb_item=self.generate_item(str(customer_id))
+                        )
+                        for customer_id in range(10)
+                    ),
+                    max_concurrency=3,
+                )
+                return await async_client.gather(
+                    *(
+                        async_client.fetch_item(key={"CustomerId": str(customer_id)})
+                        for customer_id in range(10)
+                    ),
+                    max_concurrency=3,
+                )
+
+        fetched_items = asyncio.run(fan_out())
+        self.assertEqual(
+            [fetched_item["body"]["CustomerId"] for fetched_item in fetched_items],
+            [str(customer_id) for customer_id in range(10)],
+        )
+
+    def test_gather_bounds_concurrency(self):
+        running = 0
+        peak = 0
+
+        async def operation(value):
+            nonlocal running, peak
+            running += 1
+            peak = max(peak, running)
+            await asyncio.sleep(0.01)
+            running -= 1
+            return value
+
+        results = asyncio.run(
+            AsyncDynamodbClient.gather(
+                *(operation(value) for value in range(8)), max_concurrency=2
+            )
+        )
+        self.assertEqual(results, list(range(8)))
+        self.assertEqual(peak, 2)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,70 @@
+import json
+import os
+import tempfile
+from benchmarks import suite
+import unittest
+
+
+class TestBenchmarkSuite(unittest.TestCase):
+    def test_measure(self):
+        result = suite.measure(lambda: [0] * 100, number=50, warmup=1)
+        self.assertEqual(
+            set(result),
+            {
+                "number",
+                "ops_per_sec",
+                "mean_us",
+                "p50_us",
+                "p99_us",
+                "peak_bytes",
+                "retained_bytes_per_call",
+            },
+        )
+        self.assertEqual(result["number"], 50)
+        self.assertTrue(result["p50_us"] <= result["p99_us"])
+        self.assertTrue(result["peak_bytes"] > 0)
+
+    def test_measure_without_reset_peak(self):
+        reset_peak = getattr(suite.tracemalloc, "reset_peak", None)
+        if reset_peak is not None:
+            del suite.tracemalloc.reset_peak
+        try:
+            result = suite.measure(lambda: [0] * 100, number=5, warmup=0)
+        finally:
+            if reset_peak is not None:
+                suite.tracemalloc.reset_peak = reset_peak
+        self.assertTrue(result["peak_bytes"] > 0)
+
+    def test_run_every_case(self):
+        report = suite.run(number=3, crud_number=3)
+        self.assertEqual(report["metadata"]["crud_number"], 3)
+        for case in (
+            "validation.construct.5",
+            "validate_data.update_item.40",
+            "to_db_format.200",
+            "to_readable_format.5",
+            "generate_expressions.40",
+            "crud.create_item",
+            "crud.fetch_item",
+            "crud.fetch_item_cached",
+            "crud.update_item",
+            "crud.fetch_items",
+            "crud.delete_item",
+        ):
+            self.assertIn(case, report["results"])
+
+    def test_main_writes_and_compares_reports(self):
+        with tempfile.TemporaryDirectory() as directory:
+            output = os.path.join(directory, "results.json")
+            suite.main(["--quick", "--cases", "to_db_format", "--output", output])
+            with open(output) as output_file:
+                report = json.load(output_file)
+            self.assertEqual(
+                sorted(report["results"]),
+                ["to_db_format.200", "to_db_format.40", "to_db_format.5"],
+            )
+            self.assertEqual(len(suite.compare(report, report)), 3)
+
+
+if __name__ == "__main__":
+    unittest.main()
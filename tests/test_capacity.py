@@ -0,0 +1,157 @@
+import boto3
+from moto import mock_dynamodb2
+from dynamagic.dynamodb_client import DynamodbClient
+from dynamagic.modules.capacity import CapacityTracker
+from dynamagic.modules.client_registry import client_registry
+from dynamagic.modules.exceptions import ValidationWrongCapacityModeError
+import unittest
+
+
+class TestCapacityTracker(unittest.TestCase):
+    def setUp(self):
+        client_registry.clear()
+
+    @staticmethod
+    def generate_schema_template():
+        return {
+            "key_name": "CustomerId",
+            "key_type": str,
+            "name": str,
+            "address": str,
+            "age": str,
+            "car": str,
+        }
+
+    @staticmethod
+    @mock_dynamodb2
+    def create_table():
+        client = boto3.client("dynamodb", region_name="eu-west-2")
+        client.create_table(
+            TableName="test_table",
+            ProvisionedThroughput={"ReadCapacityUnits": 140, "WriteCapacityUnits": 140},
+            AttributeDefinitions=[
+                {"AttributeName": "CustomerId", "AttributeType": "S"}
+            ],
+            KeySchema=[{"AttributeName": "CustomerId", "KeyType": "HASH"}],
+            BillingMode="PROVISIONED",
+        )
+        client.get_waiter("table_exists").wait(
+            TableName="test_table", WaiterConfig={"Delay": 2, "MaxAttempts": 5}
+        )
+
+    def test_wrong_capacity_mode(self):
+        with self.assertRaises(ValidationWrongCapacityModeError):
+            CapacityTracker(mode="NONE")
+
+    def test_record_total(self):
+        capacity_tracker = CapacityTracker(read_unit_price=1.0, write_unit_price=2.0)
+        capacity_tracker.record(
+            "update_item", {"TableName": "test_table", "CapacityUnits": 1.0}
+        )
+        capacity_tracker.record(
+            "update_item", {"TableName": "test_table", "CapacityUnits": 2.0}
+        )
+        capacity_tracker.record(
+            "query",
+            {"TableName": "test_table", "CapacityUnits": 0.5},
+            index_name="by_car",
+        )
+        capacity_tracker.record(
+            "batch_get_item", [{"TableName": "test_table", "CapacityUnits": 1.5}]
+        )
+        capacity_report = capacity_tracker.report()
+        self.assertEqual(
+            capacity_report["operations"][0],
+            {
+                "operation": "update_item",
+                "table": "test_table",
+                "index": None,
+                "calls": 2,
+                "read_capacity_units": 0.0,
+                "write_capacity_units": 3.0,
+                "estimated_cost": 6.0 / 1000000,
+            },
+        )
+        self.assertEqual(
+            [
+                (row["operation"], row["index"], row["read_capacity_units"])
+                for row in capacity_report["operations"][1:]
+            ],
+            [("batch_get_item", None, 1.5), ("query", "by_car", 0.5)],
+        )
+        self.assertEqual(capacity_report["read_capacity_units"], 2.0)
+        self.assertEqual(capacity_report["write_capacity_units"], 3.0)
+        self.assertAlmostEqual(capacity_report["estimated_cost"], 8.0 / 1000000)
+
+    def test_record_indexes(self):
+        capacity_tracker = CapacityTracker(mode="INDEXES")
+        capacity_tracker.record(
+            "put_item",
+            {
+                "TableName": "test_table",
+                "CapacityUnits": 3.0,
+                "Table": {"CapacityUnits": 1.0},
+                "GlobalSecondaryIndexes": {"by_car": {"CapacityUnits": 1.0}},
+                "LocalSecondaryIndexes": {"by_age": {"CapacityUnits": 1.0}},
+            },
+        )
+        self.assertEqual(
+            sorted(
+                (row["index"] or "", row["write_capacity_units"])
+                for row in capacity_tracker.report()["operations"]
+            ),
+            [("", 1.0), ("by_age", 1.0), ("by_car", 1.0)],
+        )
+        capacity_tracker.reset()
+        self.assertEqual(capacity_tracker.report()["operations"], [])
+
+    @mock_dynamodb2
+    def test_client_tracks_capacity(self):
+        self.create_table()
+        dynamodb_client: DynamodbClient = DynamodbClient(
+            dynamodb_table="test_table",
+            table_schema=self.generate_schema_template(),
+            capacity_tracker=CapacityTracker(),
+        )
+        dynamodb_client.create_item(
+            dynamodb_item={
+                "CustomerId": "1482328791",
+                "name": "James Joseph",
+                "address": "Jeff Bezos Candy land road",
+                "age": "32",
+                "car": "Black Skoda",
+            }
+        )
+        dynamodb_client.fetch_item(key={"CustomerId": "1482328791"})
+        dynamodb_client.fetch_items()
+        capacity_report = dynamodb_client.capacity_report()
+        self.assertEqual(capacity_report["statusCode"], 200)
+        self.assertEqual(
+            {
+                (row["operation"], row["table"], row["calls"])
+                for row in capacity_report["body"]["operations"]
+            },
+            {
+                ("put_item", "test_table", 1),
+                ("get_item", "test_table", 1),
+                ("scan", "test_table", 1),
+            },
+        )
+        self.assertEqual(capacity_report["body"]["write_capacity_units"], 1.0)
+
+    def test_capacity_report_without_tracker(self):
+        dynamodb_client: DynamodbClient = DynamodbClient(
+            dynamodb_table="test_table", table_schema=self.generate_schema_template()
+        )
+        self.assertEqual(
+            dynamodb_client.capacity_report(),
+            {
+                "statusCode": 400,
+                "body": "Consumed capacity is not being tracked for this client, please provide a "
+                "capacity_tracker and try again",
+            },
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
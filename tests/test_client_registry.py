@@ -0,0 +1,180 @@
+from dynamagic.modules.client_registry import ClientRegistry
+from dynamagic.modules.dynamodb_api import DynamodbApi
+from botocore.config import Config
+import boto3
+from unittest import mock
+import unittest
+
+
+class TestClientRegistry(unittest.TestCase):
+    def test_get_client_is_shared(self):
+        client_registry: ClientRegistry = ClientRegistry()
+        self.assertIs(
+            client_registry.get_client(region_name="eu-west-2"),
+            client_registry.get_client(region_name="eu-west-2"),
+        )
+
+    def test_get_client_per_settings(self):
+        client_registry: ClientRegistry = ClientRegistry()
+        default_client = client_registry.get_client(region_name="eu-west-2")
+        self.assertIsNot(
+            default_client, client_registry.get_client(region_name="eu-west-1")
+        )
+        self.assertIsNot(
+            default_client,
+            client_registry.get_client(
+                region_name="eu-west-2", endpoint_url="http://localhost:8000"
+            ),
+        )
+        pooled_client = client_registry.get_client(
+            region_name="eu-west-2",
+            config=ClientRegistry.build_config(max_pool_connections=50),
+        )
+        self.assertIsNot(default_client, pooled_client)
+        self.assertIs(
+            pooled_client,
+            client_registry.get_client(
+                region_name="eu-west-2", config=Config(max_pool_connections=50)
+            ),
+        )
+        self.assertEqual(pooled_client.meta.config.max_pool_connections, 50)
+
+    def test_registry_key_uses_public_config_fields(self):
+        client_registry: ClientRegistry = ClientRegistry()
+        self.assertEqual(
+            client_registry.registry_key(
+                region_name="eu-west-2",
+                config=Config(connect_timeout=2, retries={"mode": "standard", "max_attempts": 3}),
+            ),
+            client_registry.registry_key(
+                region_name="eu-west-2",
+                config=Config(retries={"max_attempts": 3, "mode": "standard"}, connect_timeout=2),
+            ),
+        )
+        self.assertNotEqual(
+            client_registry.registry_key(region_name="eu-west-2", config=Config(read_timeout=5)),
+            client_registry.registry_key(region_name="eu-west-2", config=Config(read_timeout=6)),
+        )
+
+    def test_get_client_per_config_option(self):
+        client_registry: ClientRegistry = ClientRegistry()
+        proxied_client = client_registry.get_client(
+            region_name="eu-west-2",
+            config=Config(proxies={"https": "http://proxy-one:8080"}),
+        )
+        self.assertIsNot(
+            proxied_client,
+            client_registry.get_client(
+                region_name="eu-west-2",
+                config=Config(proxies={"https": "http://proxy-two:8080"}),
+            ),
+        )
+        self.assertIsNot(
+            client_registry.get_client(region_name="eu-west-2", config=Config()),
+            client_registry.get_client(
+                region_name="eu-west-2", config=Config(user_agent_extra="billing")
+            ),
+        )
+
+    def test_get_client_per_credentials(self):
+        client_registry: ClientRegistry = ClientRegistry()
+        first_session = boto3.session.Session(
+            aws_access_key_id="first", aws_secret_access_key="secret", region_name="eu-west-1"
+        )
+        second_session = boto3.session.Session(
+            aws_access_key_id="second", aws_secret_access_key="secret", region_name="eu-west-1"
+        )
+        first_client = client_registry.get_client(session=first_session)
+        self.assertEqual(first_client.meta.region_name, "eu-west-1")
+        self.assertIs(first_client, client_registry.get_client(session=first_session))
+        self.assertIsNot(first_client, client_registry.get_client(session=second_session))
+        self.assertIsNot(first_client, client_registry.get_client(region_name="eu-west-1"))
+        with mock.patch.dict("os.environ", {"AWS_PROFILE": "first"}):
+            first_profile_key = client_registry.registry_key(region_name="eu-west-1")
+        with mock.patch.dict("os.environ", {"AWS_PROFILE": "second"}):
+            self.assertNotEqual(
+                first_profile_key, client_registry.registry_key(region_name="eu-west-1")
+            )
+
+    def test_botocore_retries_are_off(self):
+        client_registry: ClientRegistry = ClientRegistry()
+        self.assertEqual(
+            client_registry.get_client(region_name="eu-west-2").meta.config.retries,
+            {"mode": "standard", "total_max_attempts": 1},
+        )
+        tuned_client = client_registry.get_client(
+            region_name="eu-west-2", config=Config(read_timeout=5)
+        )
+        self.assertEqual(
+            (tuned_client.meta.config.retries, tuned_client.meta.config.read_timeout),
+            ({"mode": "standard", "total_max_attempts": 1}, 5),
+        )
+
+    def test_retry_policy_is_shared_per_table(self):
+        client_registry: ClientRegistry = ClientRegistry()
+        retry_policy = client_registry.get_retry_policy(dynamodb_table="test_table")
+        self.assertIs(
+            retry_policy, client_registry.get_retry_policy(dynamodb_table="test_table")
+        )
+        self.assertIsNot(
+            retry_policy, client_registry.get_retry_policy(dynamodb_table="other_table")
+        )
+        self.assertIsNot(
+            retry_policy,
+            client_registry.get_retry_policy(
+                dynamodb_table="test_table", region_name="us-east-1"
+            ),
+        )
+
+    def test_dynamodb_api_shares_retry_policy(self):
+        self.assertIs(
+            DynamodbApi(dynamodb_table="test_table").retry_policy,
+            DynamodbApi(dynamodb_table="test_table").retry_policy,
+        )
+        self.assertIsNot(
+            DynamodbApi(dynamodb_table="test_table").retry_policy,
+            DynamodbApi(dynamodb_table="other_table").retry_policy,
+        )
+
+    def test_default_region(self):
+        client_registry: ClientRegistry = ClientRegistry()
+        with mock.patch.dict("os.environ", {"AWS_DEFAULT_REGION": "us-east-1"}):
+            self.assertEqual(
+                client_registry.get_client().meta.region_name, "us-east-1"
+            )
+
+    def test_build_config(self):
+        config = ClientRegistry.build_config(
+            max_pool_connections=25, tcp_keepalive=True, connect_timeout=2
+        )
+        self.assertEqual(
+            (config.max_pool_connections, config.tcp_keepalive, config.connect_timeout),
+            (25, True, 2),
+        )
+
+    def test_register_client(self):
+        client_registry: ClientRegistry = ClientRegistry()
+        injected_client = mock.Mock()
+        client_registry.register_client(client=injected_client, region_name="eu-west-2")
+        self.assertIs(client_registry.get_client(region_name="eu-west-2"), injected_client)
+        client_registry.clear()
+        self.assertIsNot(
+            client_registry.get_client(region_name="eu-west-2"), injected_client
+        )
+
+    def test_dynamodb_api_shares_client(self):
+        self.assertIs(
+            DynamodbApi(dynamodb_table="test_table").client,
+            DynamodbApi(dynamodb_table="other_table").client,
+        )
+
+    def test_dynamodb_api_injected_client(self):
+        injected_client = mock.Mock()
+        self.assertIs(
+            DynamodbApi(dynamodb_table="test_table", client=injected_client).client,
+            injected_client,
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
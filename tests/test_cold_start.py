@@ -0,0 +1,49 @@
+import subprocess
+import sys
+import unittest
+
+
+class TestColdStart(unittest.TestCase):
+    @staticmethod
+    def loaded_modules(code: str) -> list:
+        result = subprocess.run(
+            [
+                sys.executable,
+                "-c",
+                f"import sys\n{code}\n"
+                "print(','.join(module for module in ('boto3', 'botocore', 'schema', "
+                "'concurrent.futures') if module in sys.modules))",
+            ],
+            capture_output=True,
+            text=True,
+            check=True,
+        )
+        return [module for module in result.stdout.strip().split(",") if module]
+
+    def test_import_is_lazy(self):
+        self.assertEqual(
+            self.loaded_modules("import dynamagic.dynamodb_client"), []
+        )
+
+    def test_construction_is_lazy(self):
+        self.assertEqual(
+            self.loaded_modules(
+                "from dynamagic.dynamodb_client import DynamodbClient\n"
+                "DynamodbClient(dynamodb_table='test_table', "
+                "table_schema={'key_name': 'CustomerId', 'key_type': str})"
+            ),
+            [],
+        )
+
+    def test_warm_loads_client(self):
+        loaded_modules = self.loaded_modules(
+            "from dynamagic.dynamodb_client import DynamodbClient\n"
+            "DynamodbClient(dynamodb_table='test_table', "
+            "table_schema={'key_name': 'CustomerId', 'key_type': str}).warm()"
+        )
+        self.assertIn("boto3", loaded_modules)
+        self.assertNotIn("schema", loaded_modules)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,114 @@
+from dynamagic.modules.compiled_schema import CompiledSchema
+from dynamagic.modules.exceptions import (
+    ValidationWrongKeyError,
+    ValidationMissingKeyError,
+    ValidationIncorrectKeyTypeError,
+)
+from typing import List, Set
+import unittest
+
+
+class TestCompiledSchema(unittest.TestCase):
+    @staticmethod
+    def generate_attribute_types():
+        return {
+            "name": str,
+            "address": str,
+            "age": int,
+            "car": str,
+            "CustomerId": str,
+        }
+
+    def test_validate_new_item(self):
+        compiled_schema: CompiledSchema = CompiledSchema(
+            attribute_types=self.generate_attribute_types(),
+            required_attributes=self.generate_attribute_types().keys(),
+        )
+        self.assertEqual(
+            compiled_schema.validate(
+                {
+                    "CustomerId": 1482328791,
+                    "name": "James Joseph",
+                    "address": "Jeff Bezos Candy land road",
+                    "age": "32",
+                    "car": "Black Skoda",
+                }
+            ),
+            {
+                "CustomerId": "1482328791",
+                "name": "James Joseph",
+                "address": "Jeff Bezos Candy land road",
+                "age": 32,
+                "car": "Black Skoda",
+            },
+        )
+
+    def test_validate_optional_attributes(self):
+        compiled_schema: CompiledSchema = CompiledSchema(
+            attribute_types=self.generate_attribute_types(),
+            required_attributes=["CustomerId"],
+        )
+        self.assertEqual(
+            compiled_schema.validate({"CustomerId": "1482328791", "car": "Blue BMW"}),
+            {"CustomerId": "1482328791", "car": "Blue BMW"},
+        )
+
+    def test_missing_attributes(self):
+        compiled_schema: CompiledSchema = CompiledSchema(
+            attribute_types=self.generate_attribute_types(),
+            required_attributes=self.generate_attribute_types().keys(),
+        )
+        with self.assertRaises(ValidationMissingKeyError) as error:
+            compiled_schema.validate({"CustomerId": "1482328791", "car": "Blue BMW"})
+        self.assertEqual(error.exception.data, "'name'")
+        self.assertEqual(error.exception.attributes, ["name", "address", "age"])
+
+    def test_unknown_attributes(self):
+        compiled_schema: CompiledSchema = CompiledSchema(
+            attribute_types=self.generate_attribute_types(),
+            required_attributes=["CustomerId"],
+        )
+        with self.assertRaises(ValidationWrongKeyError) as error:
+            compiled_schema.validate(
+                {"CustomerId": "1482328791", "comics": "Batman", "film": "Alien"}
+            )
+        self.assertEqual(
+            str(error.exception),
+            "Key 'comics' is not part of this schema for this data, please try again",
+        )
+        self.assertEqual(error.exception.attributes, ["comics", "film"])
+
+    def test_missing_attributes_reported_before_unknown(self):
+        compiled_schema: CompiledSchema = CompiledSchema(
+            attribute_types=self.generate_attribute_types(),
+            required_attributes=["CustomerId"],
+        )
+        with self.assertRaises(ValidationMissingKeyError):
+            compiled_schema.validate({"Test_key": 4828201})
+
+    def test_incorrect_type(self):
+        compiled_schema: CompiledSchema = CompiledSchema(
+            attribute_types=self.generate_attribute_types(),
+            required_attributes=["CustomerId"],
+        )
+        with self.assertRaises(ValidationIncorrectKeyTypeError) as error:
+            compiled_schema.validate({"CustomerId": "1482328791", "age": "thirty"})
+        self.assertEqual(error.exception.attributes, ["age"])
+        with self.assertRaises(ValidationIncorrectKeyTypeError):
+            compiled_schema.validate(["CustomerId"])
+
+    def test_typed_collections(self):
+        compiled_schema: CompiledSchema = CompiledSchema(
+            attribute_types={"scores": List[int], "tags": Set[str]},
+            required_attributes=[],
+        )
+        self.assertEqual(
+            compiled_schema.validate({"scores": ["1", 2], "tags": ["a", "b", "a"]}),
+            {"scores": [1, 2], "tags": {"a", "b"}},
+        )
+        with self.assertRaises(ValidationIncorrectKeyTypeError):
+            compiled_schema.validate({"scores": "12"})
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,155 @@
+from dynamagic.modules.conditions import FilterCondition, SortKeyCondition
+from dynamagic.modules.exceptions import (
+    ValidationIncorrectAttributeError,
+    ValidationInvalidFilterError,
+)
+from dynamagic.modules.marshalling import encode_value
+import unittest
+
+
+class TestSortKeyCondition(unittest.TestCase):
+    def test_comparisons(self):
+        for sort_key_condition, expression in (
+            (SortKeyCondition.eq("2021-01-01"), "#O = :o"),
+            (SortKeyCondition.lt("2021-01-01"), "#O < :o"),
+            (SortKeyCondition.lte("2021-01-01"), "#O <= :o"),
+            (SortKeyCondition.gt("2021-01-01"), "#O > :o"),
+            (SortKeyCondition.gte("2021-01-01"), "#O >= :o"),
+        ):
+            self.assertEqual(
+                sort_key_condition.render(
+                    expression_attribute_name="#O", expression_attribute_var=":o"
+                ),
+                (expression, {":o": "2021-01-01"}),
+            )
+
+    def test_between(self):
+        self.assertEqual(
+            SortKeyCondition.between("2021-01-01", "2021-12-31").render(
+                expression_attribute_name="#O", expression_attribute_var=":o"
+            ),
+            ("#O BETWEEN :o_0 AND :o_1", {":o_0": "2021-01-01", ":o_1": "2021-12-31"}),
+        )
+
+    def test_begins_with(self):
+        self.assertEqual(
+            SortKeyCondition.begins_with("2021-").render(
+                expression_attribute_name="#O", expression_attribute_var=":o"
+            ),
+            ("begins_with(#O, :o)", {":o": "2021-"}),
+        )
+
+
+
+class TestFilterCondition(unittest.TestCase):
+    expression_mapping = {
+        "car": {"expression_attribute_name": "#C", "expression_attribute_var": ":c"},
+        "age": {"expression_attribute_name": "#A", "expression_attribute_var": ":a"},
+        "tags": {"expression_attribute_name": "#T", "expression_attribute_var": ":t"},
+    }
+    type_tags = {"car": "S", "age": "N", "tags": "SS"}
+
+    def render(self, filter_condition):
+        return filter_condition.render(
+            expression_mapping=self.expression_mapping,
+            type_tags=self.type_tags,
+            encode_value=lambda attribute, value, member: encode_value(value),
+        )
+
+    def test_comparisons(self):
+        for filter_condition, expression in (
+            (FilterCondition.eq("age", 32), "#A = :a_0"),
+            (FilterCondition.ne("age", 32), "#A <> :a_0"),
+            (FilterCondition.lt("age", 32), "#A < :a_0"),
+            (FilterCondition.lte("age", 32), "#A <= :a_0"),
+            (FilterCondition.gt("age", 32), "#A > :a_0"),
+            (FilterCondition.gte("age", 32), "#A >= :a_0"),
+        ):
+            self.assertEqual(
+                self.render(filter_condition),
+                (expression, {"#A": "age"}, {":a_0": {"N": "32"}}),
+            )
+
+    def test_functions(self):
+        for filter_condition, expression in (
+            (FilterCondition.begins_with("car", "Black"), "begins_with(#C, :c_0)"),
+            (FilterCondition.contains("car", "Skoda"), "contains(#C, :c_0)"),
+            (FilterCondition.contains("tags", "vip"), "contains(#T, :t_0)"),
+            (FilterCondition.attribute_exists("car"), "attribute_exists(#C)"),
+            (FilterCondition.attribute_not_exists("car"), "attribute_not_exists(#C)"),
+            (FilterCondition.between("car", "A", "M"), "#C BETWEEN :c_0 AND :c_1"),
+            (FilterCondition.between("age", 9, 10), "#A BETWEEN :a_0 AND :a_1"),
+            (FilterCondition.is_in("car", ["A", "B"]), "#C IN (:c_0, :c_1)"),
+        ):
+            self.assertEqual(self.render(filter_condition)[0], expression)
+
+    def test_contains_is_told_it_looks_inside(self):
+        members = list()
+        FilterCondition.contains("tags", "vip").render(
+            expression_mapping=self.expression_mapping,
+            type_tags=self.type_tags,
+            encode_value=lambda attribute, value, member: members.append(member)
+            or encode_value(value),
+        )
+        self.assertEqual(members, [True])
+
+    def test_combining_conditions(self):
+        filter_condition = (
+            FilterCondition.eq("car", "Black Skoda") & FilterCondition.gt("age", 30)
+            & ~FilterCondition.begins_with("car", "Blue")
+        ) | FilterCondition.is_in("age", [18, 21])
+        self.assertEqual(
+            self.render(filter_condition),
+            (
+                "(#C = :c_0 AND #A > :a_0 AND NOT (begins_with(#C, :c_1))) OR #A IN (:a_1, :a_2)",
+                {"#C": "car", "#A": "age"},
+                {
+                    ":c_0": {"S": "Black Skoda"},
+                    ":a_0": {"N": "30"},
+                    ":c_1": {"S": "Blue"},
+                    ":a_1": {"N": "18"},
+                    ":a_2": {"N": "21"},
+                },
+            ),
+        )
+        self.assertEqual(
+            FilterCondition.and_(FilterCondition.eq("age", 1), FilterCondition.eq("car", "A")),
+            FilterCondition.eq("age", 1) & FilterCondition.eq("car", "A"),
+        )
+
+    def test_invalid_conditions(self):
+        with self.assertRaises(ValidationIncorrectAttributeError):
+            self.render(FilterCondition.eq("colour", "Black"))
+        for filter_condition, reason in (
+            (FilterCondition.is_in("age", []), "in needs between 1 and 100 values and has 0"),
+            (FilterCondition.or_(), "or needs at least one condition"),
+            (
+                FilterCondition.begins_with("age", "3"),
+                "begins_with cannot be used on age as it is stored as N",
+            ),
+            (
+                FilterCondition.contains("age", 3),
+                "contains cannot be used on age as it is stored as N",
+            ),
+            (
+                FilterCondition.gt("tags", "vip"),
+                "gt cannot be used on tags as it is stored as SS",
+            ),
+            (
+                FilterCondition.between("age", 10, 9),
+                "between on age needs the lower value first",
+            ),
+            (
+                FilterCondition.between("car", "M", "A"),
+                "between on car needs the lower value first",
+            ),
+        ):
+            with self.assertRaises(ValidationInvalidFilterError) as error:
+                self.render(filter_condition)
+            self.assertEqual(
+                str(error.exception),
+                f"The filter is not valid, {reason}. Please check and try again",
+            )
+
+if __name__ == "__main__":
+    unittest.main()
@@ -1,17 +1,25 @@
 from dynamagic.modules.dynamodb_api import DynamodbApi
+from dynamagic.modules.client_registry import client_registry
+from dynamagic.modules.retry import AdaptiveRateLimiter, RetryPolicy
 from dynamagic.modules.validation import Validation
 from dynamagic.modules.exceptions import (
     DynamoDbInvalidTableError,
+    DynamoDbThrottlingError,
     DynamoDbWrongKeyError,
     DynamoDbWrongKeyFormatError,
     ValidationIncorrectAttributeError,
 )
 import boto3
+from botocore.exceptions import ClientError
 from moto import mock_dynamodb2
+from unittest import mock
 import unittest
 
 
 class TestDynamodbApi(unittest.TestCase):
+    def setUp(self):
+        client_registry.clear()
+
     @staticmethod
     def generate_schema_template():
         return {
@@ -75,6 +83,158 @@ class TestDynamodbApi(unittest.TestCase):
                 }
             )
 
+    @mock_dynamodb2
+    def test_throttled_calls_are_retried(self):
+        self.create_table()
+        dynamodb_api: DynamodbApi = DynamodbApi(
+            dynamodb_table="test_table",
+            retry_policy=RetryPolicy(rate_limiter=AdaptiveRateLimiter(min_rate=1000.0)),
+        )
+        throttling_error = ClientError(
+            {"Error": {"Code": "ProvisionedThroughputExceededException", "Message": "Slow down"}},
+            "PutItem",
+        )
+        with mock.patch.object(
+            dynamodb_api.client,
+            "put_item",
+            side_effect=[throttling_error, throttling_error, {}],
+        ) as put_item, mock.patch("time.sleep"):
+            self.assertTrue(
+                dynamodb_api.add_item(dynamodb_item={"CustomerId": {"S": "1482328791"}})
+            )
+        self.assertEqual(put_item.call_count, 3)
+        self.assertEqual(dynamodb_api.retry_policy.stats()["throttles"], 2)
+
+        with mock.patch.object(
+            dynamodb_api.client, "get_item", side_effect=throttling_error
+        ), mock.patch("time.sleep"), self.assertRaises(DynamoDbThrottlingError):
+            dynamodb_api.get_item(key={"CustomerId": {"S": "1482328791"}})
+
+    def test_calculate_backoff(self):
+        for attempt in range(10):
+            self.assertTrue(
+                0 <= DynamodbApi.calculate_backoff(attempt=attempt) <= min(5.0, 0.05 * 2 ** attempt)
+            )
+
+    @mock_dynamodb2
+    def test_batch_write(self):
+        self.create_table()
+        dynamodb_api: DynamodbApi = DynamodbApi(
+            dynamodb_table="test_table"
+        )
+        self.assertEqual(
+            dynamodb_api.batch_write(
+                write_requests=[
+                    {"PutRequest": {"Item": {"CustomerId": {"S": "1482328791"}}}},
+                    {"PutRequest": {"Item": {"CustomerId": {"S": "1482328721"}}}},
+                ]
+            ),
+            [],
+        )
+        self.assertEqual(len(dynamodb_api.get_items()), 2)
+
+    def test_batch_write_retries_unprocessed_items(self):
+        dynamodb_api: DynamodbApi = DynamodbApi(
+            dynamodb_table="test_table"
+        )
+        unprocessed_request = {
+            "PutRequest": {"Item": {"CustomerId": {"S": "1482328721"}}}
+        }
+        with mock.patch.object(
+            dynamodb_api.client,
+            "batch_write_item",
+            side_effect=[
+                {"UnprocessedItems": {"test_table": [unprocessed_request]}},
+                {"UnprocessedItems": {}},
+            ],
+        ) as batch_write_item, mock.patch("time.sleep"):
+            self.assertEqual(
+                dynamodb_api.batch_write(
+                    write_requests=[
+                        {"PutRequest": {"Item": {"CustomerId": {"S": "1482328791"}}}},
+                        unprocessed_request,
+                    ]
+                ),
+                [],
+            )
+        self.assertEqual(
+            batch_write_item.call_args.kwargs["RequestItems"],
+            {"test_table": [unprocessed_request]},
+        )
+
+    def test_batch_write_gives_up_after_retries(self):
+        dynamodb_api: DynamodbApi = DynamodbApi(
+            dynamodb_table="test_table"
+        )
+        unprocessed_request = {
+            "PutRequest": {"Item": {"CustomerId": {"S": "1482328721"}}}
+        }
+        with mock.patch.object(
+            dynamodb_api.client,
+            "batch_write_item",
+            return_value={"UnprocessedItems": {"test_table": [unprocessed_request]}},
+        ) as batch_write_item, mock.patch("time.sleep"):
+            self.assertEqual(
+                dynamodb_api.batch_write(
+                    write_requests=[unprocessed_request], max_retries=2
+                ),
+                [unprocessed_request],
+            )
+        self.assertEqual(batch_write_item.call_count, 3)
+
+    @mock_dynamodb2
+    def test_batch_get(self):
+        self.create_table()
+        dynamodb_api: DynamodbApi = DynamodbApi(
+            dynamodb_table="test_table"
+        )
+        dynamodb_api.add_item(dynamodb_item={"CustomerId": {"S": "1482328791"}})
+        self.assertEqual(
+            dynamodb_api.batch_get(
+                keys=[
+                    {"CustomerId": {"S": "1482328791"}},
+                    {"CustomerId": {"S": "1482328721"}},
+                ]
+            ),
+            ([{"CustomerId": {"S": "1482328791"}}], []),
+        )
+
+    def test_batch_get_retries_unprocessed_keys(self):
+        dynamodb_api: DynamodbApi = DynamodbApi(
+            dynamodb_table="test_table"
+        )
+        with mock.patch.object(
+            dynamodb_api.client,
+            "batch_get_item",
+            side_effect=[
+                {
+                    "Responses": {"test_table": [{"CustomerId": {"S": "1482328791"}}]},
+                    "UnprocessedKeys": {
+                        "test_table": {"Keys": [{"CustomerId": {"S": "1482328721"}}]}
+                    },
+                },
+                {
+                    "Responses": {"test_table": [{"CustomerId": {"S": "1482328721"}}]},
+                    "UnprocessedKeys": {},
+                },
+            ],
+        ), mock.patch("time.sleep"):
+            self.assertEqual(
+                dynamodb_api.batch_get(
+                    keys=[
+                        {"CustomerId": {"S": "1482328791"}},
+                        {"CustomerId": {"S": "1482328721"}},
+                    ]
+                ),
+                (
+                    [
+                        {"CustomerId": {"S": "1482328791"}},
+                        {"CustomerId": {"S": "1482328721"}},
+                    ],
+                    [],
+                ),
+            )
+
     def test_remove_duplicate_attributes(self):
         dynamodb_api: DynamodbApi = DynamodbApi(
             dynamodb_table="test_table"
@@ -335,6 +495,102 @@ class TestDynamodbApi(unittest.TestCase):
             ],
         )
 
+    @mock_dynamodb2
+    def test_scan_pages(self):
+        dynamodb_api: DynamodbApi = DynamodbApi(
+            dynamodb_table="test_table"
+        )
+        self.create_table()
+        client = boto3.client("dynamodb", region_name="eu-west-2")
+        for customer_id in ("1482328791", "1482328721", "1482328722"):
+            client.put_item(
+                TableName="test_table",
+                Item={"CustomerId": {"S": customer_id}, "name": {"S": "James Joseph"}},
+            )
+        pages = list(dynamodb_api.scan_pages(page_size=2))
+        self.assertGreaterEqual(len(pages), 2)
+        self.assertEqual(
+            sorted(item["CustomerId"]["S"] for page in pages for item in page),
+            ["1482328721", "1482328722", "1482328791"],
+        )
+
+    @mock_dynamodb2
+    def test_scan_pages_max_pages(self):
+        dynamodb_api: DynamodbApi = DynamodbApi(
+            dynamodb_table="test_table"
+        )
+        self.create_table()
+        client = boto3.client("dynamodb", region_name="eu-west-2")
+        for customer_id in ("1482328791", "1482328721", "1482328722"):
+            client.put_item(
+                TableName="test_table",
+                Item={"CustomerId": {"S": customer_id}, "name": {"S": "James Joseph"}},
+            )
+        self.assertEqual(
+            [len(page) for page in dynamodb_api.scan_pages(page_size=1, max_pages=2)],
+            [1, 1],
+        )
+
+    @staticmethod
+    def segmented_scan(**scan_arguments):
+        segment = scan_arguments["Segment"]
+        if "ExclusiveStartKey" not in scan_arguments:
+            return {
+                "Items": [{"CustomerId": {"S": f"{segment}-0"}}],
+                "LastEvaluatedKey": {"CustomerId": {"S": f"{segment}-0"}},
+            }
+        return {"Items": [{"CustomerId": {"S": f"{segment}-1"}}]}
+
+    def test_parallel_scan_pages_ordered(self):
+        dynamodb_api: DynamodbApi = DynamodbApi(
+            dynamodb_table="test_table"
+        )
+        with mock.patch.object(
+            dynamodb_api.client, "scan", side_effect=self.segmented_scan
+        ):
+            self.assertEqual(
+                [
+                    page[0]["CustomerId"]["S"]
+                    for page in dynamodb_api.parallel_scan_pages(
+                        total_segments=3, ordered=True
+                    )
+                ],
+                ["0-0", "0-1", "1-0", "1-1", "2-0", "2-1"],
+            )
+
+    def test_parallel_scan_pages_unordered(self):
+        dynamodb_api: DynamodbApi = DynamodbApi(
+            dynamodb_table="test_table"
+        )
+        with mock.patch.object(
+            dynamodb_api.client, "scan", side_effect=self.segmented_scan
+        ):
+            self.assertEqual(
+                sorted(
+                    page[0]["CustomerId"]["S"]
+                    for page in dynamodb_api.parallel_scan_pages(
+                        total_segments=3, max_workers=2
+                    )
+                ),
+                ["0-0", "0-1", "1-0", "1-1", "2-0", "2-1"],
+            )
+
+    @mock_dynamodb2
+    def test_failing_to_parallel_scan_pages(self):
+        dynamodb_api: DynamodbApi = DynamodbApi(
+            dynamodb_table="test_table"
+        )
+        with self.assertRaises(DynamoDbInvalidTableError):
+            list(dynamodb_api.parallel_scan_pages(total_segments=2))
+
+    def test_calculate_item_size(self):
+        self.assertEqual(
+            DynamodbApi.calculate_item_size(
+                dynamodb_item={"CustomerId": {"S": "1482328791"}, "age": {"N": "32"}}
+            ),
+            25,
+        )
+
     @mock_dynamodb2
     def test_failing_to_get_items(self):
         dynamodb_api: DynamodbApi = DynamodbApi(
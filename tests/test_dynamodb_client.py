@@ -1,7 +1,19 @@
+from decimal import Decimal
 import boto3
+from typing import Set
+from botocore.exceptions import ClientError
 from moto import mock_dynamodb2
+from unittest import mock
 from dynamagic.dynamodb_client import DynamodbClient
-from dynamagic.modules.exceptions import ValidationFailedAttributesUpdateError
+from dynamagic.modules.client_registry import client_registry
+from dynamagic.modules.item_cache import ItemCache
+from dynamagic.modules.conditions import FilterCondition, SortKeyCondition
+from dynamagic.modules.retry import AdaptiveRateLimiter, RetryPolicy
+from dynamagic.modules.exceptions import (
+    DynamoDbInvalidScanError,
+    ValidationFailedAttributesUpdateError,
+    ValidationWrongEngineError,
+)
 import unittest
 
 schema_template = {
@@ -15,6 +27,9 @@ schema_template = {
 
 
 class TestDynamoDBClient(unittest.TestCase):
+    def setUp(self):
+        client_registry.clear()
+
     @staticmethod
     def generate_schema_template():
         return {
@@ -43,6 +58,229 @@ class TestDynamoDBClient(unittest.TestCase):
             TableName="test_table", WaiterConfig={"Delay": 2, "MaxAttempts": 5}
         )
 
+    def test_lazy_construction(self):
+        dynamodb_client: DynamodbClient = DynamodbClient(
+            dynamodb_table="test_table", table_schema=self.generate_schema_template()
+        )
+        self.assertNotIn("validation", vars(dynamodb_client))
+        self.assertNotIn("client", vars(dynamodb_client))
+        dynamodb_client.warm()
+        self.assertIn("validation", vars(dynamodb_client))
+        self.assertIn("client", vars(dynamodb_client))
+
+    @mock_dynamodb2
+    def test_warm_connect(self):
+        dynamodb_client: DynamodbClient = DynamodbClient(
+            dynamodb_table="test_table", table_schema=self.generate_schema_template()
+        )
+        self.create_table()
+        with mock.patch.object(
+            dynamodb_client.client,
+            "describe_table",
+            wraps=dynamodb_client.client.describe_table,
+        ) as describe_table:
+            dynamodb_client.warm(connect=True)
+        describe_table.assert_called_once_with(TableName="test_table")
+
+    @mock_dynamodb2
+    def test_throttled_operation_returns_response(self):
+        self.create_table()
+        dynamodb_client: DynamodbClient = DynamodbClient(
+            dynamodb_table="test_table",
+            table_schema=self.generate_schema_template(),
+            retry_policy=RetryPolicy(
+                max_attempts=2, rate_limiter=AdaptiveRateLimiter(min_rate=1000.0)
+            ),
+        )
+        with mock.patch.object(
+            dynamodb_client.client,
+            "get_item",
+            side_effect=ClientError(
+                {"Error": {"Code": "ThrottlingException", "Message": "Rate exceeded"}},
+                "GetItem",
+            ),
+        ), mock.patch("time.sleep"):
+            self.assertEqual(
+                dynamodb_client.fetch_item(key={"CustomerId": "1482328791"}),
+                {
+                    "statusCode": 400,
+                    "body": "The table is throttling requests and the retries have run out, "
+                    "please try again later",
+                },
+            )
+
+    def test_wrong_validation_engine(self):
+        with self.assertRaises(ValidationWrongEngineError):
+            DynamodbClient(
+                dynamodb_table="test_table",
+                table_schema=self.generate_schema_template(),
+                validation_engine="fast",
+            )
+
+    @staticmethod
+    def generate_orders_schema_template():
+        return {
+            "key_name": "CustomerId",
+            "key_type": str,
+            "sort_key_name": "OrderDate",
+            "sort_key_type": str,
+            "indexes": {"by_car": {"key_name": "car", "sort_key_name": "OrderDate"}},
+            "car": str,
+            "total": str,
+        }
+
+    @staticmethod
+    @mock_dynamodb2
+    def create_orders_table():
+        client = boto3.client("dynamodb", region_name="eu-west-2")
+        client.create_table(
+            TableName="orders_table",
+            AttributeDefinitions=[
+                {"AttributeName": "CustomerId", "AttributeType": "S"},
+                {"AttributeName": "OrderDate", "AttributeType": "S"},
+                {"AttributeName": "car", "AttributeType": "S"},
+            ],
+            KeySchema=[
+                {"AttributeName": "CustomerId", "KeyType": "HASH"},
+                {"AttributeName": "OrderDate", "KeyType": "RANGE"},
+            ],
+            GlobalSecondaryIndexes=[
+                {
+                    "IndexName": "by_car",
+                    "KeySchema": [
+                        {"AttributeName": "car", "KeyType": "HASH"},
+                        {"AttributeName": "OrderDate", "KeyType": "RANGE"},
+                    ],
+                    "Projection": {"ProjectionType": "ALL"},
+                }
+            ],
+            BillingMode="PAY_PER_REQUEST",
+        )
+
+    def create_orders(self, dynamodb_client: DynamodbClient) -> None:
+        dynamodb_client.create_items(
+            dynamodb_items=[
+                {"CustomerId": "1482328791", "OrderDate": "2021-01-04", "car": "Black Skoda", "total": "3"},
+                {"CustomerId": "1482328791", "OrderDate": "2021-02-11", "car": "Blue BMW", "total": "5"},
+                {"CustomerId": "1482328791", "OrderDate": "2022-03-20", "car": "Black Skoda", "total": "7"},
+                {"CustomerId": "1482322421", "OrderDate": "2021-05-01", "car": "Black Skoda", "total": "9"},
+            ]
+        )
+
+    @mock_dynamodb2
+    def test_query_items(self):
+        dynamodb_client: DynamodbClient = DynamodbClient(
+            dynamodb_table="orders_table",
+            table_schema=self.generate_orders_schema_template(),
+        )
+        self.create_orders_table()
+        self.create_orders(dynamodb_client)
+        self.assertEqual(
+            [
+                order["OrderDate"]
+                for order in dynamodb_client.query_items(
+                    partition_key_value="1482328791"
+                )["body"]
+            ],
+            ["2021-01-04", "2021-02-11", "2022-03-20"],
+        )
+        self.assertEqual(
+            dynamodb_client.query_items(
+                partition_key_value="1482328791",
+                sort_key_condition=SortKeyCondition.begins_with("2021-"),
+                scan_forward=False,
+            ),
+            {
+                "statusCode": 200,
+                "body": [
+                    {"CustomerId": "1482328791", "OrderDate": "2021-02-11", "car": "Blue BMW", "total": "5"},
+                    {"CustomerId": "1482328791", "OrderDate": "2021-01-04", "car": "Black Skoda", "total": "3"},
+                ],
+            },
+        )
+        self.assertEqual(
+            len(
+                dynamodb_client.query_items(
+                    partition_key_value="1482328791",
+                    sort_key_condition=SortKeyCondition.between("2021-01-01", "2021-12-31"),
+                    page_size=1,
+                )["body"]
+            ),
+            2,
+        )
+        self.assertEqual(
+            dynamodb_client.query_items(
+                partition_key_value="1482328791",
+                sort_key_condition=SortKeyCondition.begins_with("2021-"),
+                attributes=["OrderDate", "total"],
+            )["body"],
+            [
+                {"OrderDate": "2021-01-04", "total": "3"},
+                {"OrderDate": "2021-02-11", "total": "5"},
+            ],
+        )
+
+    @mock_dynamodb2
+    def test_query_items_on_index(self):
+        dynamodb_client: DynamodbClient = DynamodbClient(
+            dynamodb_table="orders_table",
+            table_schema=self.generate_orders_schema_template(),
+        )
+        self.create_orders_table()
+        self.create_orders(dynamodb_client)
+        self.assertEqual(
+            [
+                (order["CustomerId"], order["OrderDate"])
+                for order in dynamodb_client.query_items(
+                    partition_key_value="Black Skoda",
+                    sort_key_condition=SortKeyCondition.gte("2021-03-01"),
+                    index_name="by_car",
+                )["body"]
+            ],
+            [("1482322421", "2021-05-01"), ("1482328791", "2022-03-20")],
+        )
+
+    def test_failing_to_query_items(self):
+        dynamodb_client: DynamodbClient = DynamodbClient(
+            dynamodb_table="orders_table",
+            table_schema=self.generate_orders_schema_template(),
+        )
+        self.assertEqual(
+            dynamodb_client.query_items(partition_key_value="1482328791", index_name="by_age"),
+            {
+                "statusCode": 400,
+                "body": "The index by_age is not part of the Schema.  Please check and try again",
+            },
+        )
+
+    @mock_dynamodb2
+    def test_composite_key_operations(self):
+        dynamodb_client: DynamodbClient = DynamodbClient(
+            dynamodb_table="orders_table",
+            table_schema=self.generate_orders_schema_template(),
+        )
+        self.create_orders_table()
+        self.assertEqual(
+            dynamodb_client.create_item(
+                dynamodb_item={"CustomerId": "1482328791", "OrderDate": "2021-01-04", "car": "Black Skoda", "total": "3"}
+            ),
+            {"statusCode": 200, "body": "Created new item with key: ('1482328791', '2021-01-04')"},
+        )
+        self.assertEqual(
+            dynamodb_client.update_item(
+                dynamodb_attributes={"CustomerId": "1482328791", "OrderDate": "2021-01-04", "car": "Blue BMW"}
+            )["statusCode"],
+            200,
+        )
+        self.assertEqual(
+            dynamodb_client.fetch_item(key={"CustomerId": "1482328791", "OrderDate": "2021-01-04"})["body"]["car"],
+            "Blue BMW",
+        )
+        self.assertEqual(
+            dynamodb_client.delete_item(key={"CustomerId": "1482328791", "OrderDate": "2021-01-04"}),
+            {"statusCode": 200, "body": "Item with key: ('1482328791', '2021-01-04') has been deleted"},
+        )
+
     def test_validate_data(self):
         dynamodb_client: DynamodbClient = DynamodbClient(
             dynamodb_table="test_table", table_schema=self.generate_schema_template()
@@ -74,6 +312,53 @@ class TestDynamoDBClient(unittest.TestCase):
             {"statusCode": 200, "body": "Created new item with key: 1482328791"},
         )
 
+    @mock_dynamodb2
+    def test_document_round_trip(self):
+        dynamodb_client: DynamodbClient = DynamodbClient(
+            dynamodb_table="test_table",
+            table_schema={
+                "key_name": "CustomerId",
+                "key_type": str,
+                "age": int,
+                "tags": Set[str],
+                "address": dict,
+                "history": list,
+            },
+        )
+        self.create_table()
+        dynamodb_client.create_item(
+            dynamodb_item={
+                "CustomerId": "1482328791",
+                "age": 32,
+                "tags": {"new"},
+                "address": {"street": "Candy land road", "number": 5},
+                "history": [{"car": "Black Skoda"}],
+            }
+        )
+        self.assertEqual(
+            dynamodb_client.update_item(
+                dynamodb_attributes={
+                    "CustomerId": "1482328791",
+                    "age": 33,
+                    "tags": ["new", "used"],
+                }
+            )["statusCode"],
+            200,
+        )
+        self.assertEqual(
+            dynamodb_client.fetch_item(key={"CustomerId": "1482328791"}),
+            {
+                "statusCode": 200,
+                "body": {
+                    "CustomerId": "1482328791",
+                    "age": 33,
+                    "tags": {"new", "used"},
+                    "address": {"street": "Candy land road", "number": 5},
+                    "history": [{"car": "Black Skoda"}],
+                },
+            },
+        )
+
     @mock_dynamodb2
     def test_failing_creating_item(self):
         dynamodb_client: DynamodbClient = DynamodbClient(
@@ -96,109 +381,174 @@ class TestDynamoDBClient(unittest.TestCase):
         )
 
     @mock_dynamodb2
-    def test_delete_existing_attributes(self):
+    def test_create_items(self):
         dynamodb_client: DynamodbClient = DynamodbClient(
             dynamodb_table="test_table", table_schema=self.generate_schema_template()
         )
         self.create_table()
-        dynamodb_client.create_item(
-            dynamodb_item={
-                "CustomerId": "1482328791",
+        dynamodb_items = [
+            {
+                "CustomerId": str(1482328700 + index),
                 "name": "James Joseph",
                 "address": "Jeff Bezos Candy land road",
                 "age": "32",
                 "car": "Black Skoda",
             }
+            for index in range(30)
+        ]
+        dynamodb_items.insert(
+            1,
+            {
+                "CustomerId": "1482328791",
+                "name": "James Joseph",
+                "age": "32",
+                "car": "Black Skoda",
+            },
         )
+        response = dynamodb_client.create_items(dynamodb_items=dynamodb_items)
+        self.assertEqual(response["statusCode"], 207)
+        self.assertEqual(len(response["body"]), 31)
         self.assertEqual(
-            dynamodb_client.delete_existing_attributes(
-                key={"CustomerId": {"S": "1482328791"}},
-                validated_attributes={
-                    "address": "Foreign road",
-                    "age": "42",
-                    "car": "Black Skoda",
+            response["body"][:2],
+            [
+                {"statusCode": 200, "body": "Created new item with key: 1482328700"},
+                {
+                    "statusCode": 400,
+                    "body": "Key 'address' was missing from the schema from this data, please try again",
                 },
-            ),
-            {"address": "Foreign road", "age": "42"},
+            ],
         )
+        self.assertEqual(len(dynamodb_client.fetch_items()["body"]), 30)
 
-    def test_generating_expressions(self):
+    @mock_dynamodb2
+    def test_delete_items(self):
         dynamodb_client: DynamodbClient = DynamodbClient(
             dynamodb_table="test_table", table_schema=self.generate_schema_template()
         )
-        self.assertEqual(
-            dynamodb_client.generate_expressions(
-                confirmed_new_attributes={"address": "Foreign road", "age": "42"}
-            ),
-            (
-                "SET #A = :a, #AG = :ag",
-                {"#A": "address", "#AG": "age"},
+        self.create_table()
+        dynamodb_client.create_items(
+            dynamodb_items=[
                 {
-                    ":a": {"S": "Foreign road"},
-                    ":ag": {"S": "42"},
-                },
+                    "CustomerId": customer_id,
+                    "name": "James Joseph",
+                    "address": "Jeff Bezos Candy land road",
+                    "age": "32",
+                    "car": "Black Skoda",
+                }
+                for customer_id in ("1482328791", "1482322421")
+            ]
+        )
+        self.assertEqual(
+            dynamodb_client.delete_items(
+                keys=[{"CustomerId": "1482328791"}, {"CustomerId": "1482322421"}]
             ),
+            {
+                "statusCode": 200,
+                "body": [
+                    {"statusCode": 200, "body": "Item with key: 1482328791 has been deleted"},
+                    {"statusCode": 200, "body": "Item with key: 1482322421 has been deleted"},
+                ],
+            },
         )
+        self.assertEqual(dynamodb_client.fetch_items()["body"], [])
 
-    def test_confirm_item_updated(self):
-        dynamodb_client: DynamodbClient = DynamodbClient(
-            dynamodb_table="test_table", table_schema=self.generate_schema_template()
-        )
-        self.assertTrue(
-            dynamodb_client.confirm_item_updated(
-                update_response={
-                    "Attributes": {"age": {"S": "32"}, "car": {"S": "Black Skoda"}}
-                },
-                confirmed_new_attributes={"age": "32", "car": "Black Skoda"},
-            )
+    def test_chunk_write_requests(self):
+        write_requests = [(index, (str(index % 20),), {}) for index in range(35)]
+        self.assertEqual(
+            [
+                len(chunk)
+                for chunk in DynamodbClient.chunk_write_requests(
+                    write_requests=write_requests
+                )
+            ],
+            [20, 15],
         )
 
-    def test_confirm_item_raising_exception(self):
+    def test_create_items_reports_unprocessed_items(self):
         dynamodb_client: DynamodbClient = DynamodbClient(
             dynamodb_table="test_table", table_schema=self.generate_schema_template()
         )
-        with self.assertRaises(ValidationFailedAttributesUpdateError):
-            dynamodb_client.confirm_item_updated(
-                update_response={},
-                confirmed_new_attributes={"age": "32", "car": "Black Skoda"},
+        dynamodb_item = {
+            "CustomerId": "1482328791",
+            "name": "James Joseph",
+            "address": "Jeff Bezos Candy land road",
+            "age": "32",
+            "car": "Black Skoda",
+        }
+        with mock.patch.object(
+            dynamodb_client,
+            "batch_write",
+            return_value=[
+                {
+                    "PutRequest": {
+                        "Item": dynamodb_client.validation.validate_item_to_db_format(
+                            dynamodb_item
+                        )
+                    }
+                }
+            ],
+        ):
+            self.assertEqual(
+                dynamodb_client.create_items(dynamodb_items=[dynamodb_item]),
+                {
+                    "statusCode": 400,
+                    "body": [
+                        {
+                            "statusCode": 400,
+                            "body": "The item was not processed after retrying, the table may be throttled, "
+                            "please try again",
+                        }
+                    ],
+                },
             )
 
     @mock_dynamodb2
-    def test_update_item(self):
+    def test_fetch_items_by_keys(self):
         dynamodb_client: DynamodbClient = DynamodbClient(
             dynamodb_table="test_table", table_schema=self.generate_schema_template()
         )
         self.create_table()
-        dynamodb_client.create_item(
-            dynamodb_item={
-                "CustomerId": "1482328791",
+        dynamodb_client.create_items(
+            dynamodb_items=[
+                {
+                    "CustomerId": str(1482328000 + index),
+                    "name": "James Joseph",
+                    "address": "Jeff Bezos Candy land road",
+                    "age": "32",
+                    "car": "Black Skoda",
+                }
+                for index in range(150)
+            ]
+        )
+        keys = [{"CustomerId": str(1482328000 + index)} for index in range(0, 160, 2)]
+        keys.append({"CustomerId": 1482328000})
+        response = dynamodb_client.fetch_items_by_keys(keys=keys, max_workers=2)
+        self.assertEqual(response["statusCode"], 200)
+        self.assertEqual(len(response["body"]["items"]), 75)
+        self.assertEqual(
+            response["body"]["items"]["1482328000"],
+            {
+                "CustomerId": "1482328000",
                 "name": "James Joseph",
                 "address": "Jeff Bezos Candy land road",
                 "age": "32",
                 "car": "Black Skoda",
-            }
+            },
         )
         self.assertEqual(
-            dynamodb_client.update_item(
-                dynamodb_attributes={
-                    "CustomerId": "1482328791",
-                    "age": "45",
-                    "car": "Blue BMW",
-                }
-            ),
-            {
-                "statusCode": 200,
-                "body": "Item with the key provided has been updated successfully",
-            },
+            response["body"]["missing_keys"],
+            [{"CustomerId": str(1482328000 + index)} for index in range(150, 160, 2)],
         )
+        self.assertEqual(response["body"]["unprocessed_keys"], [])
 
-    @mock_dynamodb2
-    def test_failing_update_item(self):
+    def test_failing_to_fetch_items_by_keys(self):
         dynamodb_client: DynamodbClient = DynamodbClient(
             dynamodb_table="test_table", table_schema=self.generate_schema_template()
         )
         self.assertEqual(
-            dynamodb_client.update_item(dynamodb_attributes={"Test_key": 4828201}),
+            dynamodb_client.fetch_items_by_keys(
+                keys=[{"CustomerId": "1482328791"}, {"Test_key": 4820203}]
+            ),
             {
                 "statusCode": 400,
                 "body": "Key 'CustomerId' was missing from the schema from this data, please try again",
@@ -206,7 +556,7 @@ class TestDynamoDBClient(unittest.TestCase):
         )
 
     @mock_dynamodb2
-    def test_fetching_item(self):
+    def test_delete_existing_attributes(self):
         dynamodb_client: DynamodbClient = DynamodbClient(
             dynamodb_table="test_table", table_schema=self.generate_schema_template()
         )
@@ -221,39 +571,412 @@ class TestDynamoDBClient(unittest.TestCase):
             }
         )
         self.assertEqual(
-            dynamodb_client.fetch_item(key={"CustomerId": "1482328791"}),
-            {
-                "statusCode": 200,
-                "body": {
-                    "CustomerId": "1482328791",
-                    "name": "James Joseph",
-                    "address": "Jeff Bezos Candy land road",
-                    "age": "32",
+            dynamodb_client.delete_existing_attributes(
+                key={"CustomerId": {"S": "1482328791"}},
+                validated_attributes={
+                    "address": "Foreign road",
+                    "age": "42",
                     "car": "Black Skoda",
                 },
-            },
+            ),
+            {"address": "Foreign road", "age": "42"},
         )
 
-    def test_failing_to_fetch_item(self):
+    def test_generating_expressions(self):
         dynamodb_client: DynamodbClient = DynamodbClient(
             dynamodb_table="test_table", table_schema=self.generate_schema_template()
         )
         self.assertEqual(
-            dynamodb_client.fetch_item(key={"Test_key": 4820203}),
-            {
-                "statusCode": 400,
-                "body": "Key 'CustomerId' was missing from the schema from this data, please try again",
-            },
-        )
-
-    @mock_dynamodb2
-    def test_fetch_items(self):
-        dynamodb_client: DynamodbClient = DynamodbClient(
-            dynamodb_table="test_table", table_schema=self.generate_schema_template()
-        )
-        self.create_table()
-        dynamodb_client.create_item(
-            dynamodb_item={
+            dynamodb_client.generate_expressions(
+                confirmed_new_attributes={"address": "Foreign road", "age": "42"}
+            ),
+            (
+                "SET #A = :a, #AG = :ag",
+                {"#A": "address", "#AG": "age"},
+                {
+                    ":a": {"S": "Foreign road"},
+                    ":ag": {"S": "42"},
+                },
+            ),
+        )
+
+    @mock_dynamodb2
+    def test_update_item_with_remove_add_and_if_not_exists(self):
+        dynamodb_client: DynamodbClient = DynamodbClient(
+            dynamodb_table="test_table",
+            table_schema={
+                **self.generate_schema_template(),
+                "visits": int,
+                "tags": Set[str],
+            },
+        )
+        self.create_table()
+        dynamodb_client.create_item(
+            dynamodb_item={
+                "CustomerId": "1482328791",
+                "name": "James Joseph",
+                "address": "Jeff Bezos Candy land road",
+                "age": "32",
+                "car": "Black Skoda",
+                "visits": 1,
+                "tags": {"new"},
+            }
+        )
+        self.assertEqual(
+            dynamodb_client.update_item(
+                dynamodb_attributes={
+                    "CustomerId": "1482328791",
+                    "name": "Jim Joseph",
+                    "address": "Foreign road",
+                },
+                remove_attributes=["car"],
+                add_attributes={"visits": "2", "tags": ["used"]},
+                if_not_exists=["name"],
+            ),
+            {
+                "statusCode": 200,
+                "body": "Item with the key provided has been updated successfully",
+            },
+        )
+        self.assertEqual(
+            dynamodb_client.fetch_item(key={"CustomerId": "1482328791"})["body"],
+            {
+                "CustomerId": "1482328791",
+                "name": "James Joseph",
+                "address": "Foreign road",
+                "age": "32",
+                "visits": 3,
+                "tags": {"new", "used"},
+            },
+        )
+
+    @mock_dynamodb2
+    def test_update_item_remove_only(self):
+        dynamodb_client: DynamodbClient = DynamodbClient(
+            dynamodb_table="test_table", table_schema=self.generate_schema_template()
+        )
+        self.create_table()
+        dynamodb_client.create_item(
+            dynamodb_item={
+                "CustomerId": "1482328791",
+                "name": "James Joseph",
+                "address": "Jeff Bezos Candy land road",
+                "age": "32",
+                "car": "Black Skoda",
+            }
+        )
+        self.assertEqual(
+            dynamodb_client.update_item(
+                dynamodb_attributes={"CustomerId": "1482328791"},
+                remove_attributes=["car", "age"],
+            )["statusCode"],
+            200,
+        )
+        self.assertNotIn(
+            "car", dynamodb_client.fetch_item(key={"CustomerId": "1482328791"})["body"]
+        )
+        self.assertEqual(
+            dynamodb_client.update_item(
+                dynamodb_attributes={"CustomerId": "1482328791"},
+                remove_attributes=["CustomerId"],
+            )["statusCode"],
+            400,
+        )
+
+    def test_confirm_item_updated(self):
+        dynamodb_client: DynamodbClient = DynamodbClient(
+            dynamodb_table="test_table", table_schema=self.generate_schema_template()
+        )
+        self.assertTrue(
+            dynamodb_client.confirm_item_updated(
+                update_response={
+                    "Attributes": {"age": {"S": "32"}, "car": {"S": "Black Skoda"}}
+                },
+                confirmed_new_attributes={"age": "32", "car": "Black Skoda"},
+            )
+        )
+
+    def test_confirm_item_raising_exception(self):
+        dynamodb_client: DynamodbClient = DynamodbClient(
+            dynamodb_table="test_table", table_schema=self.generate_schema_template()
+        )
+        with self.assertRaises(ValidationFailedAttributesUpdateError):
+            dynamodb_client.confirm_item_updated(
+                update_response={},
+                confirmed_new_attributes={"age": "32", "car": "Black Skoda"},
+            )
+
+    @mock_dynamodb2
+    def test_update_item(self):
+        dynamodb_client: DynamodbClient = DynamodbClient(
+            dynamodb_table="test_table", table_schema=self.generate_schema_template()
+        )
+        self.create_table()
+        dynamodb_client.create_item(
+            dynamodb_item={
+                "CustomerId": "1482328791",
+                "name": "James Joseph",
+                "address": "Jeff Bezos Candy land road",
+                "age": "32",
+                "car": "Black Skoda",
+            }
+        )
+        self.assertEqual(
+            dynamodb_client.update_item(
+                dynamodb_attributes={
+                    "CustomerId": "1482328791",
+                    "age": "45",
+                    "car": "Blue BMW",
+                }
+            ),
+            {
+                "statusCode": 200,
+                "body": "Item with the key provided has been updated successfully",
+            },
+        )
+
+    @mock_dynamodb2
+    def test_update_item_skips_pre_read(self):
+        dynamodb_client: DynamodbClient = DynamodbClient(
+            dynamodb_table="test_table", table_schema=self.generate_schema_template()
+        )
+        self.create_table()
+        dynamodb_client.create_item(
+            dynamodb_item={
+                "CustomerId": "1482328791",
+                "name": "James Joseph",
+                "address": "Jeff Bezos Candy land road",
+                "age": "32",
+                "car": "Black Skoda",
+            }
+        )
+        with mock.patch.object(dynamodb_client, "get_item") as get_item:
+            self.assertEqual(
+                dynamodb_client.update_item(
+                    dynamodb_attributes={"CustomerId": "1482328791", "age": "45"}
+                ),
+                {
+                    "statusCode": 200,
+                    "body": "Item with the key provided has been updated successfully",
+                },
+            )
+        get_item.assert_not_called()
+        self.assertEqual(
+            dynamodb_client.fetch_item(key={"CustomerId": "1482328791"})["body"]["age"],
+            "45",
+        )
+
+    @mock_dynamodb2
+    def test_update_item_diff_existing(self):
+        dynamodb_client: DynamodbClient = DynamodbClient(
+            dynamodb_table="test_table", table_schema=self.generate_schema_template()
+        )
+        self.create_table()
+        dynamodb_client.create_item(
+            dynamodb_item={
+                "CustomerId": "1482328791",
+                "name": "James Joseph",
+                "address": "Jeff Bezos Candy land road",
+                "age": "32",
+                "car": "Black Skoda",
+            }
+        )
+        self.assertEqual(
+            dynamodb_client.update_item(
+                dynamodb_attributes={
+                    "CustomerId": "1482328791",
+                    "age": "32",
+                    "car": "Blue BMW",
+                },
+                diff_existing=True,
+            ),
+            {
+                "statusCode": 200,
+                "body": "Item with the key provided has been updated successfully",
+            },
+        )
+        self.assertEqual(
+            dynamodb_client.update_item(
+                dynamodb_attributes={"CustomerId": "1482328791", "car": "Blue BMW"},
+                diff_existing=True,
+            ),
+            {
+                "statusCode": 400,
+                "body": "There are no new attributes being added, please check the data and try again",
+            },
+        )
+
+    @mock_dynamodb2
+    def test_update_item_with_mismatched_confirmation(self):
+        dynamodb_client: DynamodbClient = DynamodbClient(
+            dynamodb_table="test_table", table_schema=self.generate_schema_template()
+        )
+        self.create_table()
+        dynamodb_client.create_item(
+            dynamodb_item={
+                "CustomerId": "1482328791",
+                "name": "James Joseph",
+                "address": "Jeff Bezos Candy land road",
+                "age": "32",
+                "car": "Black Skoda",
+            }
+        )
+        with mock.patch.object(
+            dynamodb_client,
+            "push_update",
+            return_value={"Attributes": {"age": {"S": "50"}}},
+        ):
+            self.assertEqual(
+                dynamodb_client.update_item(
+                    dynamodb_attributes={"CustomerId": "1482328791", "age": "45"}
+                ),
+                {
+                    "statusCode": 400,
+                    "body": "One or more attributes did not match when updating, this could be due to wrong data or a slow update.  Please check and try again",
+                },
+            )
+
+    @mock_dynamodb2
+    def test_update_item_that_does_not_exist(self):
+        dynamodb_client: DynamodbClient = DynamodbClient(
+            dynamodb_table="test_table", table_schema=self.generate_schema_template()
+        )
+        self.create_table()
+        self.assertEqual(
+            dynamodb_client.update_item(
+                dynamodb_attributes={"CustomerId": "1482328791", "age": "45"}
+            ),
+            {
+                "statusCode": 400,
+                "body": "The item you tried to fetch does not exist, please check the key is correct and try again",
+            },
+        )
+        self.assertEqual(dynamodb_client.fetch_items()["body"], [])
+
+    @mock_dynamodb2
+    def test_failing_update_item(self):
+        dynamodb_client: DynamodbClient = DynamodbClient(
+            dynamodb_table="test_table", table_schema=self.generate_schema_template()
+        )
+        self.assertEqual(
+            dynamodb_client.update_item(dynamodb_attributes={"Test_key": 4828201}),
+            {
+                "statusCode": 400,
+                "body": "Key 'CustomerId' was missing from the schema from this data, please try again",
+            },
+        )
+
+    @mock_dynamodb2
+    def test_fetching_item(self):
+        dynamodb_client: DynamodbClient = DynamodbClient(
+            dynamodb_table="test_table", table_schema=self.generate_schema_template()
+        )
+        self.create_table()
+        dynamodb_client.create_item(
+            dynamodb_item={
+                "CustomerId": "1482328791",
+                "name": "James Joseph",
+                "address": "Jeff Bezos Candy land road",
+                "age": "32",
+                "car": "Black Skoda",
+            }
+        )
+        self.assertEqual(
+            dynamodb_client.fetch_item(key={"CustomerId": "1482328791"}),
+            {
+                "statusCode": 200,
+                "body": {
+                    "CustomerId": "1482328791",
+                    "name": "James Joseph",
+                    "address": "Jeff Bezos Candy land road",
+                    "age": "32",
+                    "car": "Black Skoda",
+                },
+            },
+        )
+
+    @mock_dynamodb2
+    def test_fetching_item_from_cache(self):
+        dynamodb_client: DynamodbClient = DynamodbClient(
+            dynamodb_table="test_table",
+            table_schema=self.generate_schema_template(),
+            item_cache=ItemCache(),
+        )
+        self.create_table()
+        dynamodb_client.create_item(
+            dynamodb_item={
+                "CustomerId": "1482328791",
+                "name": "James Joseph",
+                "address": "Jeff Bezos Candy land road",
+                "age": "32",
+                "car": "Black Skoda",
+            }
+        )
+        first_response = dynamodb_client.fetch_item(key={"CustomerId": "1482328791"})
+        with mock.patch.object(dynamodb_client, "get_item") as get_item:
+            self.assertEqual(
+                dynamodb_client.fetch_item(key={"CustomerId": 1482328791}),
+                first_response,
+            )
+        get_item.assert_not_called()
+        self.assertEqual(dynamodb_client.item_cache.stats()["hits"], 1)
+
+    @mock_dynamodb2
+    def test_writes_invalidate_cache(self):
+        dynamodb_client: DynamodbClient = DynamodbClient(
+            dynamodb_table="test_table",
+            table_schema=self.generate_schema_template(),
+            item_cache=ItemCache(),
+        )
+        self.create_table()
+        dynamodb_item = {
+            "CustomerId": "1482328791",
+            "name": "James Joseph",
+            "address": "Jeff Bezos Candy land road",
+            "age": "32",
+            "car": "Black Skoda",
+        }
+        dynamodb_client.create_item(dynamodb_item=dynamodb_item)
+        dynamodb_client.fetch_item(key={"CustomerId": "1482328791"})
+        dynamodb_client.update_item(
+            dynamodb_attributes={"CustomerId": "1482328791", "age": "45"}
+        )
+        self.assertEqual(
+            dynamodb_client.fetch_item(key={"CustomerId": "1482328791"})["body"]["age"],
+            "45",
+        )
+        dynamodb_client.create_items(dynamodb_items=[dict(dynamodb_item, age="50")])
+        self.assertEqual(
+            dynamodb_client.fetch_item(key={"CustomerId": "1482328791"})["body"]["age"],
+            "50",
+        )
+        dynamodb_client.delete_item(key={"CustomerId": "1482328791"})
+        self.assertEqual(
+            dynamodb_client.fetch_item(key={"CustomerId": "1482328791"})["statusCode"],
+            400,
+        )
+        self.assertEqual(dynamodb_client.item_cache.stats()["invalidations"], 3)
+
+    def test_failing_to_fetch_item(self):
+        dynamodb_client: DynamodbClient = DynamodbClient(
+            dynamodb_table="test_table", table_schema=self.generate_schema_template()
+        )
+        self.assertEqual(
+            dynamodb_client.fetch_item(key={"Test_key": 4820203}),
+            {
+                "statusCode": 400,
+                "body": "Key 'CustomerId' was missing from the schema from this data, please try again",
+            },
+        )
+
+    @mock_dynamodb2
+    def test_fetch_items(self):
+        dynamodb_client: DynamodbClient = DynamodbClient(
+            dynamodb_table="test_table", table_schema=self.generate_schema_template()
+        )
+        self.create_table()
+        dynamodb_client.create_item(
+            dynamodb_item={
                 "CustomerId": "1482328791",
                 "name": "James Joseph",
                 "address": "Jeff Bezos Candy land road",
@@ -293,6 +1016,292 @@ class TestDynamoDBClient(unittest.TestCase):
             },
         )
 
+    @mock_dynamodb2
+    def test_stream_items(self):
+        dynamodb_client: DynamodbClient = DynamodbClient(
+            dynamodb_table="test_table", table_schema=self.generate_schema_template()
+        )
+        self.create_table()
+        for customer_id in ("1482328791", "1482322421", "1482322422"):
+            dynamodb_client.create_item(
+                dynamodb_item={
+                    "CustomerId": customer_id,
+                    "name": "James Joseph",
+                    "address": "Jeff Bezos Candy land road",
+                    "age": "32",
+                    "car": "Black Skoda",
+                }
+            )
+        streamed_items = dynamodb_client.stream_items(page_size=1)
+        self.assertEqual(
+            next(streamed_items),
+            {
+                "CustomerId": "1482328791",
+                "name": "James Joseph",
+                "address": "Jeff Bezos Candy land road",
+                "age": "32",
+                "car": "Black Skoda",
+            },
+        )
+        self.assertEqual(len(list(streamed_items)), 2)
+
+    @mock_dynamodb2
+    def test_fetch_items_with_limits(self):
+        dynamodb_client: DynamodbClient = DynamodbClient(
+            dynamodb_table="test_table", table_schema=self.generate_schema_template()
+        )
+        self.create_table()
+        for customer_id in ("1482328791", "1482322421", "1482322422"):
+            dynamodb_client.create_item(
+                dynamodb_item={
+                    "CustomerId": customer_id,
+                    "name": "James Joseph",
+                    "address": "Jeff Bezos Candy land road",
+                    "age": "32",
+                    "car": "Black Skoda",
+                }
+            )
+        self.assertEqual(len(dynamodb_client.fetch_items(max_items=2)["body"]), 2)
+        self.assertEqual(
+            len(dynamodb_client.fetch_items(page_size=1, max_pages=1)["body"]), 1
+        )
+        self.assertEqual(len(dynamodb_client.fetch_items(max_bytes=200)["body"]), 2)
+
+    def test_shared_item_cache_is_scoped_to_table(self):
+        item_cache: ItemCache = ItemCache()
+        customers: DynamodbClient = DynamodbClient(
+            dynamodb_table="customers",
+            table_schema=self.generate_schema_template(),
+            item_cache=item_cache,
+        )
+        archived_customers: DynamodbClient = DynamodbClient(
+            dynamodb_table="archived_customers",
+            table_schema=self.generate_schema_template(),
+            item_cache=item_cache,
+        )
+        item_cache.put(customers.cache_key(("1",)), {"CustomerId": "1", "age": "32"})
+        self.assertIsNone(item_cache.get(archived_customers.cache_key(("1",))))
+        item_cache.put(
+            archived_customers.cache_key(("1",)), {"CustomerId": "1", "age": "50"}
+        )
+        archived_customers.invalidate_cached_item(("1",))
+        self.assertEqual(
+            item_cache.get(customers.cache_key(("1",))), {"CustomerId": "1", "age": "32"}
+        )
+
+    @mock_dynamodb2
+    def test_fetch_with_projection(self):
+        dynamodb_client: DynamodbClient = DynamodbClient(
+            dynamodb_table="test_table",
+            table_schema=self.generate_schema_template(),
+            item_cache=ItemCache(),
+        )
+        self.create_table()
+        for customer_id in ("1482328791", "1482322421"):
+            dynamodb_client.create_item(
+                dynamodb_item={
+                    "CustomerId": customer_id,
+                    "name": "James Joseph",
+                    "address": "Jeff Bezos Candy land road",
+                    "age": "32",
+                    "car": "Black Skoda",
+                }
+            )
+        with mock.patch.object(
+            dynamodb_client.client, "get_item", wraps=dynamodb_client.client.get_item
+        ) as get_item:
+            self.assertEqual(
+                dynamodb_client.fetch_item(
+                    key={"CustomerId": "1482328791"}, attributes=["name", "car"]
+                ),
+                {"statusCode": 200, "body": {"name": "James Joseph", "car": "Black Skoda"}},
+            )
+        self.assertEqual(get_item.call_args.kwargs["ProjectionExpression"], "#N, #C")
+        self.assertEqual(
+            get_item.call_args.kwargs["ExpressionAttributeNames"],
+            {"#N": "name", "#C": "car"},
+        )
+        self.assertIsNone(
+            dynamodb_client.item_cache.get(dynamodb_client.cache_key(("1482328791",)))
+        )
+        dynamodb_client.fetch_item(key={"CustomerId": "1482328791"})
+        with mock.patch.object(dynamodb_client, "get_item") as cached_get_item:
+            self.assertEqual(
+                dynamodb_client.fetch_item(
+                    key={"CustomerId": "1482328791"}, attributes=["age"]
+                )["body"],
+                {"age": "32"},
+            )
+        cached_get_item.assert_not_called()
+        self.assertEqual(
+            dynamodb_client.fetch_items(attributes=["car"])["body"],
+            [{"car": "Black Skoda"}, {"car": "Black Skoda"}],
+        )
+        self.assertEqual(
+            dynamodb_client.fetch_items_by_keys(
+                keys=[{"CustomerId": "1482322421"}], attributes=["age"]
+            )["body"]["items"],
+            {"1482322421": {"CustomerId": "1482322421", "age": "32"}},
+        )
+        self.assertEqual(
+            dynamodb_client.fetch_items(attributes=["colour"]),
+            {
+                "statusCode": 400,
+                "body": "The attribute colour is not part of the Schema.  Please check and try again",
+            },
+        )
+
+    @mock_dynamodb2
+    def test_fetch_item_with_number_the_schema_type_cannot_hold(self):
+        self.create_table()
+        boto3.client("dynamodb", region_name="eu-west-2").put_item(
+            TableName="test_table",
+            Item={"CustomerId": {"S": "1482328791"}, "age": {"N": "1.5"}},
+        )
+        dynamodb_client: DynamodbClient = DynamodbClient(
+            dynamodb_table="test_table",
+            table_schema={"key_name": "CustomerId", "key_type": str, "age": int},
+        )
+        self.assertEqual(
+            dynamodb_client.fetch_item(key={"CustomerId": "1482328791"}),
+            {
+                "statusCode": 200,
+                "body": {"CustomerId": "1482328791", "age": Decimal("1.5")},
+            },
+        )
+
+    @mock_dynamodb2
+    def test_fetch_items_with_filter(self):
+        self.create_table()
+        dynamodb_client: DynamodbClient = DynamodbClient(
+            dynamodb_table="test_table",
+            table_schema={
+                "key_name": "CustomerId",
+                "key_type": str,
+                "name": str,
+                "age": int,
+                "tags": Set[str],
+            },
+        )
+        dynamodb_client.create_items(
+            dynamodb_items=[
+                {"CustomerId": "1482328791", "name": "James Joseph", "age": 32, "tags": {"new"}},
+                {"CustomerId": "1482322421", "name": "John Joseph", "age": 45, "tags": {"vip"}},
+                {"CustomerId": "1482322422", "name": "Jane Smith", "age": 21, "tags": {"new"}},
+            ]
+        )
+        with mock.patch.object(
+            dynamodb_client.client, "scan", wraps=dynamodb_client.client.scan
+        ) as scan:
+            self.assertEqual(
+                dynamodb_client.fetch_items(
+                    filter_condition=FilterCondition.begins_with("name", "J")
+                    & FilterCondition.between("age", "30", "50")
+                    & ~FilterCondition.contains("tags", "vip"),
+                    attributes=["CustomerId"],
+                ),
+                {"statusCode": 200, "body": [{"CustomerId": "1482328791"}]},
+            )
+        self.assertEqual(
+            scan.call_args.kwargs["FilterExpression"],
+            "begins_with(#N, :n_0) AND #A BETWEEN :a_0 AND :a_1 AND NOT (contains(#T, :t_0))",
+        )
+        self.assertEqual(
+            scan.call_args.kwargs["ExpressionAttributeValues"],
+            {":n_0": {"S": "J"}, ":a_0": {"N": "30"}, ":a_1": {"N": "50"}, ":t_0": {"S": "vip"}},
+        )
+        self.assertEqual(
+            [
+                table_item["CustomerId"]
+                for table_item in dynamodb_client.fetch_items(
+                    filter_condition=FilterCondition.is_in("age", [21])
+                    | FilterCondition.contains("tags", "vip")
+                )["body"]
+            ],
+            ["1482322421", "1482322422"],
+        )
+        self.assertEqual(
+            dynamodb_client.fetch_items(filter_condition=FilterCondition.eq("age", "old")),
+            {
+                "statusCode": 400,
+                "body": "DynamoDb Key 'age' is either not 10 characters long or cannot convert to an int, please try again",
+            },
+        )
+
+    @mock_dynamodb2
+    def test_fetch_items_with_rejected_filter(self):
+        self.create_table()
+        dynamodb_client: DynamodbClient = DynamodbClient(
+            dynamodb_table="test_table",
+            table_schema={"key_name": "CustomerId", "key_type": str, "age": int},
+        )
+        self.assertEqual(
+            dynamodb_client.fetch_items(
+                filter_condition=FilterCondition.begins_with("age", "3")
+            ),
+            {
+                "statusCode": 400,
+                "body": "The filter is not valid, begins_with cannot be used on age as it is stored as N. "
+                "Please check and try again",
+            },
+        )
+        with mock.patch.object(
+            dynamodb_client.client,
+            "scan",
+            side_effect=ClientError(
+                {
+                    "Error": {
+                        "Code": "ValidationException",
+                        "Message": "Invalid FilterExpression",
+                    }
+                },
+                "Scan",
+            ),
+        ):
+            self.assertEqual(
+                dynamodb_client.fetch_items(filter_condition=FilterCondition.gt("age", 3)),
+                {
+                    "statusCode": 400,
+                    "body": "The scan is not valid for this table, Invalid FilterExpression. "
+                    "Please check the filter and try again",
+                },
+            )
+            with self.assertRaises(DynamoDbInvalidScanError):
+                list(
+                    dynamodb_client.stream_items(
+                        filter_condition=FilterCondition.gt("age", 3)
+                    )
+                )
+
+    def test_fetch_items_parallel(self):
+        dynamodb_client: DynamodbClient = DynamodbClient(
+            dynamodb_table="test_table", table_schema=self.generate_schema_template()
+        )
+
+        def segmented_scan(**scan_arguments):
+            return {
+                "Items": [
+                    {
+                        "CustomerId": {"S": f"148232879{scan_arguments['Segment']}"},
+                        "name": {"S": "James Joseph"},
+                    }
+                ]
+            }
+
+        with mock.patch.object(
+            dynamodb_client.client, "scan", side_effect=segmented_scan
+        ):
+            self.assertEqual(
+                dynamodb_client.fetch_items(total_segments=2),
+                {
+                    "statusCode": 200,
+                    "body": [
+                        {"CustomerId": "1482328790", "name": "James Joseph"},
+                        {"CustomerId": "1482328791", "name": "James Joseph"},
+                    ],
+                },
+            )
+
     @mock_dynamodb2
     def test_failing_to_fetch_items(self):
         dynamodb_client: DynamodbClient = DynamodbClient(
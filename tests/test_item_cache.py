@@ -0,0 +1,151 @@
+from dynamagic.modules.item_cache import ItemCache
+from concurrent.futures import ThreadPoolExecutor
+import unittest
+
+
+class FakeClock:
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+class TestItemCache(unittest.TestCase):
+    def test_get_and_put(self):
+        item_cache: ItemCache = ItemCache()
+        self.assertIsNone(item_cache.get(("1482328791",)))
+        item_cache.put(("1482328791",), {"CustomerId": "1482328791", "age": "32"})
+        self.assertEqual(
+            item_cache.get(("1482328791",)), {"CustomerId": "1482328791", "age": "32"}
+        )
+        self.assertEqual(
+            item_cache.stats(),
+            {
+                "size": 1,
+                "hits": 1,
+                "misses": 1,
+                "evictions": 0,
+                "expirations": 0,
+                "invalidations": 0,
+            },
+        )
+
+    def test_returns_copies(self):
+        item_cache: ItemCache = ItemCache()
+        cached_item = {"CustomerId": "1482328791", "age": "32"}
+        item_cache.put(("1482328791",), cached_item)
+        cached_item["age"] = "45"
+        item_cache.get(("1482328791",))["age"] = "50"
+        self.assertEqual(item_cache.get(("1482328791",))["age"], "32")
+
+    def test_returns_deep_copies(self):
+        item_cache: ItemCache = ItemCache()
+        cached_item = {
+            "CustomerId": "1482328791",
+            "address": {"street": "Candy land road"},
+            "history": [{"car": "Black Skoda"}],
+            "tags": {"new"},
+        }
+        item_cache.put(("1482328791",), cached_item)
+        cached_item["address"]["street"] = "Main street"
+        fetched_item = item_cache.get(("1482328791",))
+        fetched_item["history"][0]["car"] = "Blue BMW"
+        fetched_item["tags"].add("vip")
+        self.assertEqual(
+            item_cache.get(("1482328791",)),
+            {
+                "CustomerId": "1482328791",
+                "address": {"street": "Candy land road"},
+                "history": [{"car": "Black Skoda"}],
+                "tags": {"new"},
+            },
+        )
+
+    def test_lru_eviction(self):
+        item_cache: ItemCache = ItemCache(max_size=2)
+        item_cache.put(("1",), {"CustomerId": "1"})
+        item_cache.put(("2",), {"CustomerId": "2"})
+        item_cache.get(("1",))
+        item_cache.put(("3",), {"CustomerId": "3"})
+        self.assertIsNone(item_cache.get(("2",)))
+        self.assertIsNotNone(item_cache.get(("1",)))
+        self.assertIsNotNone(item_cache.get(("3",)))
+        self.assertEqual(item_cache.stats()["evictions"], 1)
+
+    def test_ttl_expiry(self):
+        clock = FakeClock()
+        item_cache: ItemCache = ItemCache(ttl=10, clock=clock)
+        item_cache.put(("1",), {"CustomerId": "1"})
+        item_cache.put(("2",), {"CustomerId": "2"}, ttl=30)
+        clock.now = 10
+        self.assertIsNone(item_cache.get(("1",)))
+        self.assertIsNotNone(item_cache.get(("2",)))
+        self.assertEqual(item_cache.stats()["expirations"], 1)
+
+    def test_invalidate(self):
+        item_cache: ItemCache = ItemCache()
+        item_cache.put(("1",), {"CustomerId": "1"})
+        item_cache.invalidate(("1",))
+        self.assertIsNone(item_cache.get(("1",)))
+        self.assertEqual(item_cache.stats()["invalidations"], 1)
+
+    def test_stale_fetch_is_not_stored(self):
+        item_cache: ItemCache = ItemCache()
+        generation = item_cache.generation
+        item_cache.invalidate(("1",))
+        self.assertFalse(
+            item_cache.put(("1",), {"CustomerId": "1"}, generation=generation)
+        )
+        self.assertIsNone(item_cache.get(("1",)))
+
+    def test_invalidating_another_key_keeps_fetch(self):
+        item_cache: ItemCache = ItemCache()
+        generation = item_cache.generation
+        item_cache.invalidate(("2",))
+        self.assertTrue(
+            item_cache.put(("1",), {"CustomerId": "1"}, generation=generation)
+        )
+        self.assertIsNotNone(item_cache.get(("1",)))
+
+    def test_stale_fetch_is_not_stored_after_clear(self):
+        item_cache: ItemCache = ItemCache()
+        generation = item_cache.generation
+        item_cache.clear()
+        self.assertFalse(
+            item_cache.put(("1",), {"CustomerId": "1"}, generation=generation)
+        )
+
+    def test_forgotten_invalidation_is_not_stored(self):
+        item_cache: ItemCache = ItemCache(max_size=2)
+        generation = item_cache.generation
+        for customer_id in ("1", "2", "3"):
+            item_cache.invalidate((customer_id,))
+        self.assertEqual(len(item_cache.invalidated_at), 2)
+        self.assertFalse(
+            item_cache.put(("1",), {"CustomerId": "1"}, generation=generation)
+        )
+        self.assertTrue(
+            item_cache.put(
+                ("1",), {"CustomerId": "1"}, generation=item_cache.generation
+            )
+        )
+
+    def test_thread_safety(self):
+        item_cache: ItemCache = ItemCache(max_size=50)
+
+        def use_cache(index: int) -> None:
+            item_cache.put((str(index % 100),), {"CustomerId": str(index)})
+            item_cache.get((str(index % 70),))
+            if index % 11 == 0:
+                item_cache.invalidate((str(index % 100),))
+
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            list(executor.map(use_cache, range(5000)))
+        stats = item_cache.stats()
+        self.assertLessEqual(stats["size"], 50)
+        self.assertEqual(stats["hits"] + stats["misses"], 5000)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,233 @@
+from decimal import Decimal
+from typing import Any, Dict, FrozenSet, List, Set
+from dynamagic.modules.marshalling import (
+    ItemCodec,
+    canonical_value,
+    compile_decoder,
+    compile_encoder,
+    decode_value,
+    dynamodb_type,
+    encode_value,
+)
+import unittest
+
+
+class TestMarshalling(unittest.TestCase):
+    def test_encode_scalars(self):
+        self.assertEqual(
+            [
+                encode_value(value)
+                for value in ("Skoda", 32, 1.5, Decimal("0.1"), True, b"\x00", None)
+            ],
+            [
+                {"S": "Skoda"},
+                {"N": "32"},
+                {"N": "1.5"},
+                {"N": "0.1"},
+                {"BOOL": True},
+                {"B": b"\x00"},
+                {"NULL": True},
+            ],
+        )
+
+    def test_encode_nested_document(self):
+        self.assertEqual(
+            encode_value(
+                {
+                    "cars": [{"make": "Skoda", "doors": 5}, None],
+                    "tags": {"new"},
+                    "owned": False,
+                }
+            ),
+            {
+                "M": {
+                    "cars": {
+                        "L": [
+                            {"M": {"make": {"S": "Skoda"}, "doors": {"N": "5"}}},
+                            {"NULL": True},
+                        ]
+                    },
+                    "tags": {"SS": ["new"]},
+                    "owned": {"BOOL": False},
+                }
+            },
+        )
+
+    def test_encode_sets(self):
+        self.assertEqual(sorted(encode_value({3, 1})["NS"]), ["1", "3"])
+        self.assertEqual(encode_value(frozenset({b"a"})), {"BS": [b"a"]})
+        with self.assertRaises(ValueError):
+            encode_value(set())
+        with self.assertRaises(TypeError):
+            encode_value({1, "one"})
+
+    def test_encode_unsupported_values(self):
+        with self.assertRaises(ValueError):
+            encode_value(float("nan"))
+        with self.assertRaises(TypeError):
+            encode_value(object())
+
+    def test_decode_round_trip(self):
+        document = {
+            "cars": [{"make": "Skoda", "doors": 5}, None],
+            "price": Decimal("10.25"),
+            "tags": {"new", "used"},
+            "sizes": {1, 2},
+            "owned": True,
+        }
+        self.assertEqual(decode_value(encode_value(document)), document)
+
+    def test_dynamodb_type(self):
+        self.assertEqual(
+            [
+                dynamodb_type(data_type)
+                for data_type in (
+                    str,
+                    int,
+                    Decimal,
+                    bool,
+                    bytes,
+                    dict,
+                    Dict[str, int],
+                    list,
+                    List[Dict[str, str]],
+                    List[str],
+                    Set[int],
+                    FrozenSet[bytes],
+                    Any,
+                )
+            ],
+            ["S", "N", "N", "BOOL", "B", "M", "M", "L", "L", "SS", "NS", "BS", None],
+        )
+
+    def test_compiled_encoders(self):
+        self.assertEqual(compile_encoder(int)(32), {"N": "32"})
+        self.assertEqual(compile_encoder(List[int])([3, 1]), {"NS": ["3", "1"]})
+        with self.assertRaises(ValueError):
+            compile_encoder(List[int])([3, 3, 1])
+        with self.assertRaises(ValueError):
+            compile_encoder(List[float])([1, 1.0])
+        self.assertEqual(compile_encoder(Any)({"a": 1}), {"M": {"a": {"N": "1"}}})
+        with self.assertRaises(ValueError):
+            compile_encoder(List[str])([])
+        with self.assertRaises(ValueError):
+            compile_encoder(float)(float("inf"))
+
+    def test_list_round_trip_keeps_every_element(self):
+        codec = ItemCodec(attribute_types={"scores": List[int], "names": List[str]})
+        item = {"scores": [3, 1, 2], "names": ["b", "a"]}
+        self.assertEqual(codec.decode_item(codec.encode_item(item)), item)
+        for duplicated_item in ({"scores": [3, 3, 1]}, {"names": ["a", "a"]}):
+            with self.assertRaises(ValueError):
+                codec.encode_item(duplicated_item)
+
+    def test_compiled_decoders(self):
+        self.assertEqual(compile_decoder(int)({"N": "32"}), 32)
+        self.assertEqual(compile_decoder(float)({"N": "1.5"}), 1.5)
+        self.assertEqual(compile_decoder(List[int])({"NS": ["3", "1"]}), [3, 1])
+        self.assertEqual(compile_decoder(Set[str])({"SS": ["a"]}), {"a"})
+        self.assertEqual(compile_decoder(int)({"N": "1.5"}), Decimal("1.5"))
+        self.assertEqual(compile_decoder(List[int])({"NS": ["1.5", "2"]}), [Decimal("1.5"), 2])
+        self.assertIsNone(compile_decoder(str)({"NULL": True}))
+        self.assertEqual(compile_decoder(Any)({"N": "2.5"}), Decimal("2.5"))
+
+    def test_canonical_value(self):
+        self.assertEqual(
+            canonical_value({"M": {"sizes": {"NS": ["1", "2.0"]}, "total": {"N": "5"}}}),
+            canonical_value({"M": {"sizes": {"NS": ["2", "1"]}, "total": {"N": "5.0"}}}),
+        )
+        self.assertNotEqual(
+            canonical_value({"L": [{"N": "1"}, {"N": "2"}]}),
+            canonical_value({"L": [{"N": "2"}, {"N": "1"}]}),
+        )
+
+
+class TestItemCodec(unittest.TestCase):
+    @staticmethod
+    def generate_codec():
+        return ItemCodec(
+            attribute_types={
+                "CustomerId": str,
+                "age": int,
+                "active": bool,
+                "tags": Set[str],
+                "address": dict,
+            }
+        )
+
+    def test_type_tags(self):
+        self.assertEqual(
+            self.generate_codec().type_tags,
+            {
+                "CustomerId": "S",
+                "age": "N",
+                "active": "BOOL",
+                "tags": "SS",
+                "address": "M",
+            },
+        )
+
+    def test_encode_item(self):
+        self.assertEqual(
+            self.generate_codec().encode_item(
+                {"CustomerId": "1482328791", "age": 32, "active": True, "tags": {"new"}}
+            ),
+            {
+                "CustomerId": {"S": "1482328791"},
+                "age": {"N": "32"},
+                "active": {"BOOL": True},
+                "tags": {"SS": ["new"]},
+            },
+        )
+        with self.assertRaises(KeyError):
+            self.generate_codec().encode_item({"car": "Black Skoda"})
+
+    def test_decode_item(self):
+        self.assertEqual(
+            self.generate_codec().decode_item(
+                {
+                    "CustomerId": {"S": "1482328791"},
+                    "age": {"N": "32"},
+                    "address": {"M": {"number": {"N": "5"}}},
+                    "car": {"S": "Black Skoda"},
+                    "active": {"NULL": True},
+                }
+            ),
+            {
+                "CustomerId": "1482328791",
+                "age": 32,
+                "address": {"number": 5},
+                "car": "Black Skoda",
+                "active": None,
+            },
+        )
+
+    def test_subset(self):
+        codec = self.generate_codec()
+        subset_codec = codec.subset(["age", "active"])
+        self.assertEqual(subset_codec.type_tags, {"age": "N", "active": "BOOL"})
+        self.assertIs(subset_codec.decoders["age"], codec.decoders["age"])
+        self.assertEqual(
+            subset_codec.decode_item({"age": {"N": "32"}, "active": {"BOOL": True}}),
+            {"age": 32, "active": True},
+        )
+
+    def test_decode_items(self):
+        codec = self.generate_codec()
+        self.assertEqual(
+            codec.decode_items(
+                [
+                    {"CustomerId": {"S": "1482328791"}, "age": {"N": "32"}},
+                    {"CustomerId": {"S": "1482322421"}, "tags": {"SS": ["new"]}},
+                ]
+            ),
+            [
+                {"CustomerId": "1482328791", "age": 32},
+                {"CustomerId": "1482322421", "tags": {"new"}},
+            ],
+        )
+        self.assertEqual(codec.decode_items([]), [])
+
+
+if __name__ == "__main__":
+    unittest.main()
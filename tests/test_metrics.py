@@ -0,0 +1,202 @@
+import boto3
+import io
+import json
+import logging
+from moto import mock_dynamodb2
+from unittest import mock
+from dynamagic.dynamodb_client import DynamodbClient
+from dynamagic.modules.client_registry import client_registry
+from dynamagic.modules.metrics import (
+    EmfSink,
+    InMemorySink,
+    LatencyHistogram,
+    LoggingSink,
+    MetricsRecorder,
+    NullMetricsRecorder,
+    null_metrics,
+)
+import unittest
+
+
+class FakeClock:
+    def __init__(self, ticks):
+        self.ticks = iter(ticks)
+
+    def __call__(self):
+        return next(self.ticks)
+
+
+class TestMetrics(unittest.TestCase):
+    def setUp(self):
+        client_registry.clear()
+
+    @staticmethod
+    def generate_schema_template():
+        return {
+            "key_name": "CustomerId",
+            "key_type": str,
+            "name": str,
+            "address": str,
+            "age": str,
+            "car": str,
+        }
+
+    @staticmethod
+    @mock_dynamodb2
+    def create_table():
+        client = boto3.client("dynamodb", region_name="eu-west-2")
+        client.create_table(
+            TableName="test_table",
+            ProvisionedThroughput={"ReadCapacityUnits": 140, "WriteCapacityUnits": 140},
+            AttributeDefinitions=[
+                {"AttributeName": "CustomerId", "AttributeType": "S"}
+            ],
+            KeySchema=[{"AttributeName": "CustomerId", "KeyType": "HASH"}],
+            BillingMode="PROVISIONED",
+        )
+        client.get_waiter("table_exists").wait(
+            TableName="test_table", WaiterConfig={"Delay": 2, "MaxAttempts": 5}
+        )
+
+    def test_latency_histogram(self):
+        latency_histogram = LatencyHistogram()
+        for milliseconds in range(1, 101):
+            latency_histogram.record(float(milliseconds))
+        summary = latency_histogram.summary()
+        self.assertEqual(summary["count"], 100)
+        self.assertAlmostEqual(summary["mean_ms"], 50.5)
+        self.assertEqual(summary["min_ms"], 1.0)
+        self.assertEqual(summary["max_ms"], 100.0)
+        self.assertTrue(50 <= summary["p50_ms"] <= 50 * 1.05)
+        self.assertTrue(99 <= summary["p99_ms"] <= 100)
+        self.assertEqual(LatencyHistogram().percentile(99), 0.0)
+
+    def test_timer_records_latency_and_errors(self):
+        metrics_recorder = MetricsRecorder(clock=FakeClock([0.0, 0.25, 1.0, 1.5]))
+        with metrics_recorder.timer("update_item", phase="validation"):
+            pass
+        with self.assertRaises(KeyError):
+            with metrics_recorder.timer("update_item"):
+                raise KeyError("name")
+        snapshot = metrics_recorder.snapshot()
+        self.assertEqual(snapshot["latency"]["update_item.validation"]["max_ms"], 250.0)
+        self.assertEqual(snapshot["latency"]["update_item"]["count"], 1)
+        self.assertEqual(snapshot["errors"], {"update_item": {"KeyError": 1}})
+
+    def test_flush_resets(self):
+        in_memory_sink = InMemorySink()
+        metrics_recorder = MetricsRecorder(sink=in_memory_sink)
+        metrics_recorder.record_capacity("dynamodb.get_item", 0.5)
+        metrics_recorder.record_retry("dynamodb.get_item", throttled=True)
+        metrics_recorder.record_retry("dynamodb.get_item", throttled=False)
+        snapshot = metrics_recorder.flush()
+        self.assertEqual(in_memory_sink.snapshots, [snapshot])
+        self.assertEqual(snapshot["capacity"], {"dynamodb.get_item": 0.5})
+        self.assertEqual(snapshot["retries"], {"dynamodb.get_item": 2})
+        self.assertEqual(snapshot["throttles"], {"dynamodb.get_item": 1})
+        self.assertEqual(metrics_recorder.snapshot()["capacity"], {})
+
+    def test_logging_sink(self):
+        metrics_recorder = MetricsRecorder(sink=LoggingSink())
+        metrics_recorder.record_capacity("dynamodb.put_item", 1.0)
+        with self.assertLogs("dynamagic.metrics", level=logging.INFO) as logs:
+            metrics_recorder.flush()
+        self.assertIn('"dynamodb.put_item": 1.0', logs.output[0])
+
+    def test_emf_sink(self):
+        stream = io.StringIO()
+        metrics_recorder = MetricsRecorder(
+            sink=EmfSink(
+                namespace="accounts",
+                dimensions={"Table": "test_table"},
+                stream=stream,
+                clock=lambda: 1600000000.0,
+            ),
+            clock=FakeClock([0.0, 0.01]),
+        )
+        with metrics_recorder.timer("fetch_item"):
+            pass
+        metrics_recorder.record_capacity("fetch_item", 0.5)
+        metrics_recorder.flush()
+        metric_line = json.loads(stream.getvalue())
+        self.assertEqual(metric_line["_aws"]["Timestamp"], 1600000000000)
+        self.assertEqual(
+            metric_line["_aws"]["CloudWatchMetrics"][0]["Dimensions"],
+            [["Table", "Operation"]],
+        )
+        self.assertEqual(metric_line["_aws"]["CloudWatchMetrics"][0]["Namespace"], "accounts")
+        self.assertEqual(metric_line["Table"], "test_table")
+        self.assertEqual(metric_line["Operation"], "fetch_item")
+        self.assertEqual(metric_line["Count"], 1)
+        self.assertEqual(metric_line["ConsumedCapacity"], 0.5)
+        self.assertAlmostEqual(metric_line["LatencyMax"], 10.0)
+
+    def test_null_metrics(self):
+        self.assertFalse(null_metrics.enabled)
+        self.assertIsInstance(null_metrics, NullMetricsRecorder)
+        with null_metrics.timer("update_item", phase="validation"):
+            pass
+        null_metrics.record_error("update_item", KeyError())
+        self.assertEqual(null_metrics.snapshot()["latency"], {})
+
+    @mock_dynamodb2
+    def test_disabled_metrics_do_not_request_capacity(self):
+        self.create_table()
+        dynamodb_client: DynamodbClient = DynamodbClient(
+            dynamodb_table="test_table", table_schema=self.generate_schema_template()
+        )
+        with mock.patch.object(
+            dynamodb_client.client,
+            "get_item",
+            wraps=dynamodb_client.client.get_item,
+        ) as get_item:
+            dynamodb_client.fetch_item(key={"CustomerId": "1482328791"})
+        get_item.assert_called_once_with(
+            TableName="test_table", Key={"CustomerId": {"S": "1482328791"}}
+        )
+
+    @mock_dynamodb2
+    def test_client_records_operations(self):
+        self.create_table()
+        metrics_recorder = MetricsRecorder()
+        dynamodb_client: DynamodbClient = DynamodbClient(
+            dynamodb_table="test_table",
+            table_schema=self.generate_schema_template(),
+            metrics=metrics_recorder,
+        )
+        dynamodb_client.create_item(
+            dynamodb_item={
+                "CustomerId": "1482328791",
+                "name": "James Joseph",
+                "address": "Jeff Bezos Candy land road",
+                "age": "32",
+                "car": "Black Skoda",
+            }
+        )
+        dynamodb_client.update_item(
+            dynamodb_attributes={"CustomerId": "1482328791", "car": "Blue Skoda"}
+        )
+        dynamodb_client.fetch_item(key={"CustomerId": "1482328791", "car": "Skoda"})
+        snapshot = metrics_recorder.snapshot()
+        for name in (
+            "create_item",
+            "update_item",
+            "update_item.validation",
+            "update_item.expressions",
+            "update_item.update",
+            "update_item.confirmation",
+            "dynamodb.put_item",
+            "dynamodb.update_item",
+            "fetch_item",
+        ):
+            self.assertEqual(snapshot["latency"][name]["count"], 1, name)
+        self.assertNotIn("update_item.pre_read", snapshot["latency"])
+        self.assertEqual(snapshot["capacity"]["dynamodb.put_item"], 1.0)
+        self.assertIn("dynamodb.update_item", snapshot["capacity"])
+        self.assertEqual(
+            snapshot["errors"], {"fetch_item": {"ValidationWrongKeyError": 1}}
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,160 @@
+import boto3
+from moto import mock_dynamodb2
+from dynamagic.dynamodb_client import DynamodbClient
+from dynamagic.modules.client_registry import client_registry
+from dynamagic.modules.rate_limiter import TokenBucket
+from dynamagic.operation_executor import OperationExecutor
+import unittest
+
+
+class TestOperationExecutor(unittest.TestCase):
+    def setUp(self):
+        client_registry.clear()
+
+    @staticmethod
+    def generate_schema_template():
+        return {
+            "key_name": "CustomerId",
+            "key_type": str,
+            "name": str,
+            "address": str,
+            "age": str,
+            "car": str,
+        }
+
+    @staticmethod
+    @mock_dynamodb2
+    def create_table():
+        client = boto3.client("dynamodb", region_name="eu-west-2")
+        client.create_table(
+            TableName="test_table",
+            ProvisionedThroughput={"ReadCapacityUnits": 140, "WriteCapacityUnits": 140},
+            AttributeDefinitions=[
+                {"AttributeName": "CustomerId", "AttributeType": "S"}
+            ],
+            KeySchema=[{"AttributeName": "CustomerId", "KeyType": "HASH"}],
+            BillingMode="PROVISIONED",
+        )
+        client.get_waiter("table_exists").wait(
+            TableName="test_table", WaiterConfig={"Delay": 2, "MaxAttempts": 5}
+        )
+
+    @staticmethod
+    def generate_item(customer_id: str):
+        return {
+            "CustomerId": customer_id,
+            "name": f"Customer {customer_id}",
+            "address": "1 Test Street",
+            "age": "30",
+            "car": "Tesla",
+        }
+
+    @mock_dynamodb2
+    def test_run_mixed_operations(self):
+        self.create_table()
+        dynamodb_client = DynamodbClient(
+            dynamodb_table="test_table", table_schema=self.generate_schema_template()
+        )
+        operations = list()
+        for customer_id in ("1", "2", "3"):
+            operations.extend(
+                [
+                    {"operation": "create_item", "payload": self.generate_item(customer_id)},
+                    {
+                        "operation": "update_item",
+                        "payload": {"CustomerId": customer_id, "car": "Volvo"},
+                    },
+                    {"operation": "fetch_item", "payload": {"CustomerId": customer_id}},
+                ]
+            )
+        operations.append({"operation": "delete_item", "payload": {"CustomerId": "3"}})
+        operations.append({"operation": "fetch_item", "payload": {"CustomerId": "3"}})
+        with OperationExecutor(dynamodb_client, max_workers=4) as operation_executor:
+            results = operation_executor.run(operations)
+        self.assertEqual(len(results), len(operations))
+        self.assertEqual(
+            results[0], {"statusCode": 200, "body": "Created new item with key: 1"}
+        )
+        for position in (2, 5, 8):
+            self.assertEqual(results[position]["statusCode"], 200)
+            self.assertEqual(results[position]["body"]["car"], "Volvo")
+        self.assertEqual(
+            results[9], {"statusCode": 200, "body": "Item with key: 3 has been deleted"}
+        )
+        self.assertEqual(results[10]["statusCode"], 400)
+
+    @mock_dynamodb2
+    def test_unknown_operation(self):
+        self.create_table()
+        dynamodb_client = DynamodbClient(
+            dynamodb_table="test_table", table_schema=self.generate_schema_template()
+        )
+        with OperationExecutor(dynamodb_client) as operation_executor:
+            results = operation_executor.run(
+                [{"operation": "scan", "payload": {"CustomerId": "1"}}]
+            )
+        self.assertEqual(
+            results,
+            [
+                {
+                    "statusCode": 400,
+                    "body": "The operation scan is not supported, please choose either "
+                    "create_item, update_item, fetch_item or delete_item and try again",
+                }
+            ],
+        )
+
+    @mock_dynamodb2
+    def test_rate_limiter_is_used(self):
+        self.create_table()
+        dynamodb_client = DynamodbClient(
+            dynamodb_table="test_table", table_schema=self.generate_schema_template()
+        )
+        rate_limiter = TokenBucket(rate=0.001, capacity=5)
+        with OperationExecutor(
+            dynamodb_client, rate_limiter=rate_limiter
+        ) as operation_executor:
+            operation_executor.run(
+                [
+                    {"operation": "create_item", "payload": self.generate_item(str(customer_id))}
+                    for customer_id in range(5)
+                ]
+            )
+        self.assertFalse(rate_limiter.try_acquire())
+
+    def test_lane_key(self):
+        dynamodb_client = DynamodbClient(
+            dynamodb_table="test_table", table_schema=self.generate_schema_template()
+        )
+        operation_executor = OperationExecutor(dynamodb_client)
+        self.assertEqual(
+            operation_executor.lane_key(0, {"payload": {"CustomerId": "1", "car": "Volvo"}}),
+            ("key", ("1",)),
+        )
+        self.assertEqual(
+            operation_executor.lane_key(3, {"payload": {"CustomerId": ["1"]}}),
+            ("key", ("['1']",)),
+        )
+        self.assertEqual(operation_executor.lane_key(4, {"payload": None}), ("position", 4))
+        self.assertEqual(
+            operation_executor.lane_key(5, {"payload": {"car": "Volvo"}}), ("position", 5)
+        )
+
+    def test_lane_key_uses_validated_key(self):
+        dynamodb_client = DynamodbClient(
+            dynamodb_table="test_table",
+            table_schema={"key_name": "CustomerId", "key_type": int, "car": str},
+        )
+        operation_executor = OperationExecutor(dynamodb_client)
+        self.assertEqual(
+            operation_executor.lane_key(0, {"payload": {"CustomerId": 1}}),
+            operation_executor.lane_key(1, {"payload": {"CustomerId": "1", "car": "Volvo"}}),
+        )
+        self.assertEqual(
+            operation_executor.lane_key(2, {"payload": {"CustomerId": "one"}}),
+            ("position", 2),
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
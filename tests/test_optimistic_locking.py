@@ -0,0 +1,331 @@
+import boto3
+from moto import mock_dynamodb2
+from unittest import mock
+from dynamagic.dynamodb_client import DynamodbClient
+from dynamagic.modules.client_registry import client_registry
+import unittest
+
+
+class TestOptimisticLocking(unittest.TestCase):
+    def setUp(self):
+        client_registry.clear()
+
+    @staticmethod
+    def generate_schema_template():
+        return {
+            "key_name": "CustomerId",
+            "key_type": str,
+            "name": str,
+            "car": str,
+            "visits": int,
+            "version": int,
+            "version_attribute": "version",
+        }
+
+    @staticmethod
+    @mock_dynamodb2
+    def create_table():
+        client = boto3.client("dynamodb", region_name="eu-west-2")
+        client.create_table(
+            TableName="test_table",
+            ProvisionedThroughput={"ReadCapacityUnits": 140, "WriteCapacityUnits": 140},
+            AttributeDefinitions=[
+                {"AttributeName": "CustomerId", "AttributeType": "S"}
+            ],
+            KeySchema=[{"AttributeName": "CustomerId", "KeyType": "HASH"}],
+            BillingMode="PROVISIONED",
+        )
+        client.get_waiter("table_exists").wait(
+            TableName="test_table", WaiterConfig={"Delay": 2, "MaxAttempts": 5}
+        )
+
+    def create_client(self) -> DynamodbClient:
+        self.create_table()
+        dynamodb_client: DynamodbClient = DynamodbClient(
+            dynamodb_table="test_table", table_schema=self.generate_schema_template()
+        )
+        dynamodb_client.create_item(
+            dynamodb_item={
+                "CustomerId": "1482328791",
+                "name": "James Joseph",
+                "car": "Black Skoda",
+                "visits": 1,
+            }
+        )
+        return dynamodb_client
+
+    def fetch_version(self, dynamodb_client: DynamodbClient) -> int:
+        return dynamodb_client.fetch_item(key={"CustomerId": "1482328791"})["body"][
+            "version"
+        ]
+
+    @mock_dynamodb2
+    def test_create_item_only_once(self):
+        dynamodb_client = self.create_client()
+        self.assertEqual(self.fetch_version(dynamodb_client), 1)
+        with mock.patch.object(
+            dynamodb_client.client, "put_item", wraps=dynamodb_client.client.put_item
+        ) as put_item:
+            response = dynamodb_client.create_item(
+                dynamodb_item={
+                    "CustomerId": "1482328791",
+                    "name": "Jim Joseph",
+                    "car": "Blue BMW",
+                    "visits": 1,
+                }
+            )
+        self.assertEqual(
+            response,
+            {
+                "statusCode": 400,
+                "body": "An item with the key 1482328791 already exists, pass the version you fetched to replace it and try again",
+            },
+        )
+        self.assertEqual(
+            put_item.call_args.kwargs["ConditionExpression"], "attribute_not_exists(#CU)"
+        )
+        self.assertEqual(
+            dynamodb_client.create_item(
+                dynamodb_item={
+                    "CustomerId": "1482328791",
+                    "name": "Jim Joseph",
+                    "car": "Blue BMW",
+                    "visits": 1,
+                    "version": 1,
+                }
+            )["statusCode"],
+            200,
+        )
+        self.assertEqual(
+            dynamodb_client.fetch_item(key={"CustomerId": "1482328791"})["body"],
+            {
+                "CustomerId": "1482328791",
+                "name": "Jim Joseph",
+                "car": "Blue BMW",
+                "visits": 1,
+                "version": 2,
+            },
+        )
+
+    @mock_dynamodb2
+    def test_update_item_with_version(self):
+        dynamodb_client = self.create_client()
+        with mock.patch.object(
+            dynamodb_client.client,
+            "update_item",
+            wraps=dynamodb_client.client.update_item,
+        ) as update_item:
+            self.assertEqual(
+                dynamodb_client.update_item(
+                    dynamodb_attributes={
+                        "CustomerId": "1482328791",
+                        "car": "Blue BMW",
+                        "version": 1,
+                    }
+                )["statusCode"],
+                200,
+            )
+        self.assertEqual(
+            update_item.call_args.kwargs["ConditionExpression"],
+            "attribute_exists(#CU) AND #VE = :ve_0",
+        )
+        self.assertEqual(self.fetch_version(dynamodb_client), 2)
+        self.assertEqual(
+            dynamodb_client.update_item(
+                dynamodb_attributes={
+                    "CustomerId": "1482328791",
+                    "car": "Red Ford",
+                    "version": 1,
+                }
+            )["statusCode"],
+            400,
+        )
+
+    @mock_dynamodb2
+    def test_create_item_does_not_replace_unversioned_item(self):
+        self.create_table()
+        schema_template = self.generate_schema_template()
+        del schema_template["version_attribute"], schema_template["version"]
+        DynamodbClient(dynamodb_table="test_table", table_schema=schema_template).create_item(
+            dynamodb_item={
+                "CustomerId": "1482328791",
+                "name": "James Joseph",
+                "car": "Black Skoda",
+                "visits": 1,
+            }
+        )
+        dynamodb_client: DynamodbClient = DynamodbClient(
+            dynamodb_table="test_table", table_schema=self.generate_schema_template()
+        )
+        new_item = {
+            "CustomerId": "1482328791",
+            "name": "Jim Joseph",
+            "car": "Blue BMW",
+            "visits": 1,
+        }
+        self.assertEqual(dynamodb_client.create_item(dynamodb_item=new_item)["statusCode"], 400)
+        self.assertEqual(
+            dynamodb_client.create_item(dynamodb_item={**new_item, "version": 0})[
+                "statusCode"
+            ],
+            200,
+        )
+        self.assertEqual(self.fetch_version(dynamodb_client), 1)
+
+    @mock_dynamodb2
+    def test_writes_without_version_are_rejected(self):
+        dynamodb_client = self.create_client()
+        with mock.patch.object(
+            dynamodb_client.client, "update_item"
+        ) as update_item, mock.patch.object(
+            dynamodb_client.client, "delete_item"
+        ) as delete_item:
+            self.assertEqual(
+                dynamodb_client.update_item(
+                    dynamodb_attributes={"CustomerId": "1482328791", "car": "Blue BMW"}
+                ),
+                {
+                    "statusCode": 400,
+                    "body": "The table has a version attribute so update_item needs the version of the item, "
+                    "fetch the item and pass its version or use modify_item and try again",
+                },
+            )
+            self.assertIn(
+                "delete_item needs the version",
+                dynamodb_client.delete_item(key={"CustomerId": "1482328791"})["body"],
+            )
+            self.assertIn(
+                "delete_item needs the version",
+                dynamodb_client.delete_items(keys=[{"CustomerId": "1482328791"}])["body"][
+                    0
+                ]["body"],
+            )
+        update_item.assert_not_called()
+        delete_item.assert_not_called()
+        self.assertEqual(self.fetch_version(dynamodb_client), 1)
+
+    @mock_dynamodb2
+    def test_delete_item_with_version(self):
+        dynamodb_client = self.create_client()
+        response = dynamodb_client.delete_item(
+            key={"CustomerId": "1482328791"}, expected_version=3
+        )
+        self.assertEqual(response["statusCode"], 400)
+        self.assertIn("no longer at version 3", response["body"])
+        self.assertEqual(
+            dynamodb_client.delete_item(
+                key={"CustomerId": "1482328791"}, expected_version=1
+            )["statusCode"],
+            200,
+        )
+        self.assertEqual(
+            dynamodb_client.fetch_item(key={"CustomerId": "1482328791"})["statusCode"],
+            400,
+        )
+
+    @mock_dynamodb2
+    def test_batch_writes_are_conditional(self):
+        dynamodb_client = self.create_client()
+        with mock.patch.object(
+            dynamodb_client.client,
+            "batch_write_item",
+            wraps=dynamodb_client.client.batch_write_item,
+        ) as batch_write_item:
+            response = dynamodb_client.create_items(
+                dynamodb_items=[
+                    {
+                        "CustomerId": "1482328791",
+                        "name": "Jim Joseph",
+                        "car": "Blue BMW",
+                        "visits": 1,
+                    },
+                    {
+                        "CustomerId": "1482322421",
+                        "name": "Jim Joseph",
+                        "car": "Blue BMW",
+                        "visits": 1,
+                    },
+                ]
+            )
+            self.assertEqual(response["statusCode"], 207)
+            self.assertIn("already exists", response["body"][0]["body"])
+            self.assertEqual(
+                dynamodb_client.fetch_item(key={"CustomerId": "1482328791"})["body"]["name"],
+                "James Joseph",
+            )
+            response = dynamodb_client.delete_items(
+                keys=[
+                    {"CustomerId": "1482328791", "version": 2},
+                    {"CustomerId": "1482322421", "version": 1},
+                ]
+            )
+            self.assertEqual(response["statusCode"], 207)
+            self.assertIn("no longer at version 2", response["body"][0]["body"])
+        batch_write_item.assert_not_called()
+        self.assertEqual(self.fetch_version(dynamodb_client), 1)
+        self.assertEqual(
+            dynamodb_client.fetch_item(key={"CustomerId": "1482322421"})["statusCode"],
+            400,
+        )
+
+    @mock_dynamodb2
+    def test_modify_item_retries_after_conflict(self):
+        dynamodb_client = self.create_client()
+        attempts = list()
+
+        def add_visit(tracked_item):
+            attempts.append(tracked_item["version"])
+            if len(attempts) == 1:
+                dynamodb_client.update_item(
+                    dynamodb_attributes={"CustomerId": "1482328791", "car": "Blue BMW"},
+                    expected_version=tracked_item["version"],
+                )
+            tracked_item["visits"] = tracked_item["visits"] + 1
+
+        with mock.patch("time.sleep") as sleep:
+            self.assertEqual(
+                dynamodb_client.modify_item(
+                    key={"CustomerId": "1482328791"}, modifier=add_visit
+                ),
+                {
+                    "statusCode": 200,
+                    "body": "Item with the key provided has been updated successfully",
+                },
+            )
+        self.assertEqual(attempts, [1, 2])
+        sleep.assert_called_once()
+        item = dynamodb_client.fetch_item(key={"CustomerId": "1482328791"})["body"]
+        self.assertEqual(item["visits"], 2)
+        self.assertEqual(item["car"], "Blue BMW")
+        self.assertEqual(item["version"], 3)
+
+    @mock_dynamodb2
+    def test_modify_item_gives_up(self):
+        dynamodb_client = self.create_client()
+        cars = iter(["Blue BMW", "Red Ford"])
+
+        def conflicting_change(tracked_item):
+            dynamodb_client.update_item(
+                dynamodb_attributes={"CustomerId": "1482328791", "car": next(cars)},
+                expected_version=tracked_item["version"],
+            )
+            tracked_item["name"] = "Jim Joseph"
+
+        with mock.patch("time.sleep"):
+            response = dynamodb_client.modify_item(
+                key={"CustomerId": "1482328791"},
+                modifier=conflicting_change,
+                max_attempts=2,
+            )
+        self.assertEqual(response["statusCode"], 400)
+        self.assertEqual(self.fetch_version(dynamodb_client), 3)
+        self.assertEqual(
+            dynamodb_client.modify_item(
+                key={"CustomerId": "1482322421"}, modifier=conflicting_change
+            )["statusCode"],
+            400,
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
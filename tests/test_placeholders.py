@@ -0,0 +1,103 @@
+from dynamagic.modules.placeholders import (
+    PlaceholderAllocator,
+    allocate_placeholders,
+    placeholder_cache,
+)
+import unittest
+
+
+class TestPlaceholders(unittest.TestCase):
+    def setUp(self):
+        placeholder_cache.clear()
+
+    def test_allocate_placeholders(self):
+        self.assertEqual(
+            allocate_placeholders(
+                attributes=["name", "address", "age", "car", "CustomerId"]
+            ),
+            {
+                "name": {"expression_attribute_name": "#N", "expression_attribute_var": ":n"},
+                "address": {"expression_attribute_name": "#A", "expression_attribute_var": ":a"},
+                "age": {"expression_attribute_name": "#AG", "expression_attribute_var": ":ag"},
+                "car": {"expression_attribute_name": "#C", "expression_attribute_var": ":c"},
+                "CustomerId": {
+                    "expression_attribute_name": "#CU",
+                    "expression_attribute_var": ":cu",
+                },
+            },
+        )
+
+    def test_wide_schema_is_unique(self):
+        attributes = [f"attribute{index}" for index in range(500)]
+        expression_mapping = allocate_placeholders(attributes=attributes)
+        for placeholder_type in ("expression_attribute_name", "expression_attribute_var"):
+            self.assertEqual(
+                len(
+                    {
+                        expression_placeholders[placeholder_type]
+                        for expression_placeholders in expression_mapping.values()
+                    }
+                ),
+                len(attributes),
+            )
+
+    def test_names_that_clash_when_changing_case(self):
+        expression_mapping = allocate_placeholders(attributes=["a", "A", "A-", "_", "é"])
+        self.assertEqual(
+            [
+                expression_placeholders["expression_attribute_var"]
+                for expression_placeholders in expression_mapping.values()
+            ],
+            [":a", ":a1", ":a2", ":at", ":t"],
+        )
+
+    def test_placeholders_leave_suffixes_free(self):
+        expression_mapping = allocate_placeholders(attributes=["o", "o_0", "o0"])
+        self.assertEqual(
+            [
+                expression_placeholders["expression_attribute_var"]
+                for expression_placeholders in expression_mapping.values()
+            ],
+            [":o", ":o0", ":0"],
+        )
+        self.assertFalse(
+            any(
+                "_" in expression_placeholders["expression_attribute_var"]
+                for expression_placeholders in expression_mapping.values()
+            )
+        )
+
+    def test_placeholders_are_cached_per_schema(self):
+        attributes = ("name", "address")
+        first_mapping = allocate_placeholders(attributes=attributes)
+        self.assertIn(attributes, placeholder_cache)
+        second_mapping = allocate_placeholders(attributes=attributes)
+        self.assertEqual(first_mapping, second_mapping)
+        second_mapping["name"]["expression_attribute_var"] = ":x"
+        self.assertEqual(
+            allocate_placeholders(attributes=attributes)["name"]["expression_attribute_var"],
+            ":n",
+        )
+
+    def test_allocate_around_existing_placeholders(self):
+        self.assertEqual(
+            allocate_placeholders(
+                attributes=["age"],
+                expression_mapping={
+                    "address": {
+                        "expression_attribute_name": "#A",
+                        "expression_attribute_var": ":a",
+                    }
+                },
+            ),
+            {"age": {"expression_attribute_name": "#AG", "expression_attribute_var": ":ag"}},
+        )
+
+    def test_allocator_fallback_counters(self):
+        placeholder_allocator = PlaceholderAllocator(used_tokens=["a", "a1"])
+        self.assertEqual(placeholder_allocator.allocate("a"), "a2")
+        self.assertEqual(placeholder_allocator.allocate("a"), "a3")
+
+
+if __name__ == "__main__":
+    unittest.main()
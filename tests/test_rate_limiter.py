@@ -0,0 +1,42 @@
+from dynamagic.modules.rate_limiter import TokenBucket
+import unittest
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+    def sleep(self, seconds):
+        self.now += seconds
+
+
+class TestTokenBucket(unittest.TestCase):
+    def test_try_acquire(self):
+        clock = FakeClock()
+        token_bucket = TokenBucket(rate=2, capacity=2, clock=clock, sleep=clock.sleep)
+        self.assertTrue(token_bucket.try_acquire())
+        self.assertTrue(token_bucket.try_acquire())
+        self.assertFalse(token_bucket.try_acquire())
+        clock.now += 0.5
+        self.assertTrue(token_bucket.try_acquire())
+
+    def test_acquire_waits_for_refill(self):
+        clock = FakeClock()
+        token_bucket = TokenBucket(rate=4, capacity=1, clock=clock, sleep=clock.sleep)
+        self.assertEqual(token_bucket.acquire(), 0.0)
+        self.assertAlmostEqual(token_bucket.acquire(), 0.25)
+        self.assertAlmostEqual(clock.now, 0.25)
+
+    def test_set_rate(self):
+        clock = FakeClock()
+        token_bucket = TokenBucket(rate=1, capacity=1, clock=clock, sleep=clock.sleep)
+        token_bucket.acquire()
+        token_bucket.set_rate(10)
+        self.assertAlmostEqual(token_bucket.acquire(), 0.1)
+
+
+if __name__ == "__main__":
+    unittest.main()
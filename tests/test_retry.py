@@ -0,0 +1,138 @@
+from botocore.exceptions import ClientError
+from unittest import mock
+from dynamagic.modules.exceptions import DynamoDbThrottlingError
+from dynamagic.modules.retry import (
+    AdaptiveRateLimiter,
+    RetryBudget,
+    RetryPolicy,
+    calculate_backoff,
+)
+import unittest
+
+
+def client_error(error_code):
+    return ClientError({"Error": {"Code": error_code, "Message": error_code}}, "PutItem")
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+    def sleep(self, seconds):
+        self.now += seconds
+
+
+class TestRetryPolicy(unittest.TestCase):
+    @staticmethod
+    def generate_retry_policy(**policy_options):
+        clock = FakeClock()
+        return RetryPolicy(
+            rate_limiter=AdaptiveRateLimiter(clock=clock, sleep=clock.sleep),
+            **policy_options
+        )
+
+    def test_calculate_backoff(self):
+        for attempt in range(10):
+            self.assertTrue(
+                0 <= calculate_backoff(attempt=attempt, base_delay=0.1, max_delay=1.0)
+                <= min(1.0, 0.1 * 2 ** attempt)
+            )
+
+    def test_retries_throttling(self):
+        retry_policy = self.generate_retry_policy()
+        operation = mock.Mock(
+            side_effect=[
+                client_error("ProvisionedThroughputExceededException"),
+                client_error("ThrottlingException"),
+                {"Item": {}},
+            ]
+        )
+        with mock.patch("time.sleep") as sleep:
+            self.assertEqual(retry_policy.call(operation, TableName="test_table"), {"Item": {}})
+        self.assertEqual(operation.call_count, 3)
+        self.assertEqual(sleep.call_count, 2)
+        operation.assert_called_with(TableName="test_table")
+        stats = retry_policy.stats()
+        self.assertEqual(stats["attempts"], 3)
+        self.assertEqual(stats["retries"], 2)
+        self.assertEqual(stats["throttles"], 2)
+        self.assertEqual(stats["budget_exhausted"], 0)
+
+    def test_retries_transient_errors(self):
+        retry_policy = self.generate_retry_policy()
+        operation = mock.Mock(side_effect=[client_error("InternalServerError"), True])
+        with mock.patch("time.sleep"):
+            self.assertTrue(retry_policy.call(operation))
+        self.assertEqual(retry_policy.stats()["throttles"], 0)
+        self.assertEqual(retry_policy.stats()["retries"], 1)
+
+    def test_does_not_retry_other_errors(self):
+        retry_policy = self.generate_retry_policy()
+        operation = mock.Mock(side_effect=client_error("ConditionalCheckFailedException"))
+        with self.assertRaises(ClientError):
+            retry_policy.call(operation)
+        self.assertEqual(operation.call_count, 1)
+        self.assertEqual(retry_policy.stats()["retries"], 0)
+
+    def test_throttling_after_max_attempts(self):
+        retry_policy = self.generate_retry_policy(max_attempts=3)
+        operation = mock.Mock(side_effect=client_error("ThrottlingException"))
+        with mock.patch("time.sleep"), self.assertRaises(DynamoDbThrottlingError):
+            retry_policy.call(operation)
+        self.assertEqual(operation.call_count, 3)
+
+    def test_retry_budget_exhausted(self):
+        retry_policy = self.generate_retry_policy(
+            retry_budget=RetryBudget(capacity=10, throttle_cost=10)
+        )
+        operation = mock.Mock(side_effect=client_error("ThrottlingException"))
+        with mock.patch("time.sleep"), self.assertRaises(DynamoDbThrottlingError):
+            retry_policy.call(operation)
+        self.assertEqual(operation.call_count, 2)
+        self.assertEqual(retry_policy.stats()["budget_exhausted"], 1)
+
+    def test_retry_budget_refills_on_success(self):
+        retry_budget = RetryBudget(capacity=10, retry_cost=5)
+        self.assertTrue(retry_budget.withdraw())
+        self.assertTrue(retry_budget.withdraw())
+        self.assertFalse(retry_budget.withdraw())
+        for _ in range(5):
+            retry_budget.deposit()
+        self.assertTrue(retry_budget.withdraw())
+
+
+class TestAdaptiveRateLimiter(unittest.TestCase):
+    def test_disabled_until_throttled(self):
+        rate_limiter = AdaptiveRateLimiter(clock=FakeClock())
+        for _ in range(100):
+            rate_limiter.acquire()
+        self.assertIsNone(rate_limiter.rate)
+
+    def test_adapts_to_throttling(self):
+        clock = FakeClock()
+        rate_limiter = AdaptiveRateLimiter(
+            decrease_factor=0.5, increase_step=1.0, clock=clock
+        )
+        for _ in range(40):
+            rate_limiter.acquire()
+        clock.now = 1.0
+        rate_limiter.acquire()
+        rate_limiter.on_throttle()
+        self.assertAlmostEqual(rate_limiter.rate, 16.0)
+        rate_limiter.on_throttle()
+        self.assertAlmostEqual(rate_limiter.rate, 8.0)
+        rate_limiter.on_success()
+        self.assertAlmostEqual(rate_limiter.rate, 9.0)
+
+    def test_rate_has_a_floor(self):
+        rate_limiter = AdaptiveRateLimiter(min_rate=2.0, clock=FakeClock())
+        for _ in range(20):
+            rate_limiter.on_throttle()
+        self.assertEqual(rate_limiter.rate, 2.0)
+
+
+if __name__ == "__main__":
+    unittest.main()
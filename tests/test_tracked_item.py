@@ -0,0 +1,220 @@
+import boto3
+from moto import mock_dynamodb2
+from unittest import mock
+from dynamagic.dynamodb_client import DynamodbClient
+from dynamagic.modules.client_registry import client_registry
+from dynamagic.modules.item_cache import ItemCache
+from dynamagic.modules.validation import Validation
+from dynamagic.modules.exceptions import (
+    ValidationIncorrectAttributeError,
+    ValidationWrongUpdateActionError,
+)
+from dynamagic.tracked_item import TrackedItem
+import unittest
+
+
+class TestTrackedItem(unittest.TestCase):
+    def setUp(self):
+        client_registry.clear()
+
+    @staticmethod
+    def generate_schema_template():
+        return {
+            "key_name": "CustomerId",
+            "key_type": str,
+            "name": str,
+            "address": str,
+            "age": str,
+            "car": str,
+            "version": int,
+            "version_attribute": "version",
+        }
+
+    @staticmethod
+    @mock_dynamodb2
+    def create_table():
+        client = boto3.client("dynamodb", region_name="eu-west-2")
+        client.create_table(
+            TableName="test_table",
+            ProvisionedThroughput={"ReadCapacityUnits": 140, "WriteCapacityUnits": 140},
+            AttributeDefinitions=[
+                {"AttributeName": "CustomerId", "AttributeType": "S"}
+            ],
+            KeySchema=[{"AttributeName": "CustomerId", "KeyType": "HASH"}],
+            BillingMode="PROVISIONED",
+        )
+        client.get_waiter("table_exists").wait(
+            TableName="test_table", WaiterConfig={"Delay": 2, "MaxAttempts": 5}
+        )
+
+    def create_client(self, **client_options) -> DynamodbClient:
+        self.create_table()
+        dynamodb_client: DynamodbClient = DynamodbClient(
+            dynamodb_table="test_table",
+            table_schema=self.generate_schema_template(),
+            **client_options,
+        )
+        dynamodb_client.client.put_item(
+            TableName="test_table",
+            Item={
+                "CustomerId": {"S": "1482328791"},
+                "name": {"S": "James Joseph"},
+                "address": {"S": "Jeff Bezos Candy land road"},
+                "age": {"S": "32"},
+                "car": {"S": "Black Skoda"},
+            },
+        )
+        return dynamodb_client
+
+    def test_version_attribute_in_schema(self):
+        validation = Validation(table_schema=self.generate_schema_template())
+        self.assertEqual(validation.version_attribute, "version")
+        self.assertNotIn("version_attribute", validation.schema_template)
+        with self.assertRaises(ValidationIncorrectAttributeError):
+            Validation(
+                table_schema={
+                    "key_name": "CustomerId",
+                    "key_type": str,
+                    "version_attribute": "version",
+                }
+            )
+
+    @mock_dynamodb2
+    def test_save_sends_only_changes(self):
+        dynamodb_client = self.create_client()
+        tracked_item = dynamodb_client.fetch_item(
+            key={"CustomerId": "1482328791"}, tracked=True
+        )["body"]
+        self.assertIsInstance(tracked_item, TrackedItem)
+        tracked_item["car"] = "Blue BMW"
+        tracked_item["age"] = "32"
+        del tracked_item["address"]
+        self.assertEqual(tracked_item.modified_attributes, {"car"})
+        self.assertEqual(tracked_item.removed_attributes, {"address"})
+        with mock.patch.object(
+            dynamodb_client.client, "get_item", wraps=dynamodb_client.client.get_item
+        ) as get_item, mock.patch.object(
+            dynamodb_client.client,
+            "update_item",
+            wraps=dynamodb_client.client.update_item,
+        ) as update_item:
+            self.assertEqual(
+                tracked_item.save(),
+                {
+                    "statusCode": 200,
+                    "body": "Item with the key provided has been updated successfully",
+                },
+            )
+        get_item.assert_not_called()
+        self.assertEqual(
+            update_item.call_args.kwargs["UpdateExpression"],
+            "SET #C = :c, #V = :v REMOVE #A",
+        )
+        self.assertEqual(
+            update_item.call_args.kwargs["ConditionExpression"],
+            "attribute_exists(#CU) AND attribute_not_exists(#V)",
+        )
+        self.assertFalse(tracked_item.is_modified)
+        self.assertEqual(tracked_item["version"], 1)
+        self.assertEqual(
+            dynamodb_client.fetch_item(key={"CustomerId": "1482328791"})["body"],
+            {
+                "CustomerId": "1482328791",
+                "name": "James Joseph",
+                "age": "32",
+                "car": "Blue BMW",
+                "version": 1,
+            },
+        )
+        tracked_item["name"] = "Jim Joseph"
+        self.assertEqual(tracked_item.save()["statusCode"], 200)
+        self.assertEqual(tracked_item["version"], 2)
+
+    @mock_dynamodb2
+    def test_save_with_version_conflict(self):
+        dynamodb_client = self.create_client()
+        first_item = dynamodb_client.fetch_item(
+            key={"CustomerId": "1482328791"}, tracked=True
+        )["body"]
+        second_item = dynamodb_client.fetch_item(
+            key={"CustomerId": "1482328791"}, tracked=True
+        )["body"]
+        first_item["car"] = "Blue BMW"
+        second_item["car"] = "Red Ford"
+        self.assertEqual(first_item.save()["statusCode"], 200)
+        self.assertEqual(
+            second_item.save(),
+            {
+                "statusCode": 400,
+                "body": "The item was changed by another writer or no longer exists, it is no longer at version 0. "
+                "Please fetch the item and try again",
+            },
+        )
+        self.assertTrue(second_item.is_modified)
+        self.assertEqual(
+            dynamodb_client.fetch_item(key={"CustomerId": "1482328791"})["body"]["car"],
+            "Blue BMW",
+        )
+
+    @mock_dynamodb2
+    def test_save_without_changes(self):
+        dynamodb_client = self.create_client()
+        tracked_item = dynamodb_client.fetch_item(
+            key={"CustomerId": "1482328791"}, tracked=True
+        )["body"]
+        with mock.patch.object(dynamodb_client.client, "update_item") as update_item:
+            self.assertEqual(
+                tracked_item.save(),
+                {
+                    "statusCode": 200,
+                    "body": "Item with the key provided has no changes to save",
+                },
+            )
+        update_item.assert_not_called()
+
+    @mock_dynamodb2
+    def test_tracked_item_from_cache(self):
+        dynamodb_client = self.create_client(item_cache=ItemCache())
+        dynamodb_client.fetch_item(key={"CustomerId": "1482328791"})
+        tracked_item = dynamodb_client.fetch_item(
+            key={"CustomerId": "1482328791"}, tracked=True
+        )["body"]
+        tracked_item["car"] = "Blue BMW"
+        self.assertEqual(
+            dynamodb_client.fetch_item(key={"CustomerId": "1482328791"})["body"]["car"],
+            "Black Skoda",
+        )
+        self.assertEqual(tracked_item.save()["statusCode"], 200)
+        self.assertEqual(
+            dynamodb_client.fetch_item(key={"CustomerId": "1482328791"})["body"]["car"],
+            "Blue BMW",
+        )
+
+    def test_key_attributes_cannot_change(self):
+        dynamodb_client: DynamodbClient = DynamodbClient(
+            dynamodb_table="test_table", table_schema=self.generate_schema_template()
+        )
+        tracked_item = TrackedItem(dynamodb_client, {"CustomerId": "1482328791"})
+        with self.assertRaises(ValidationWrongUpdateActionError):
+            tracked_item["CustomerId"] = "1482322421"
+        with self.assertRaises(ValidationWrongUpdateActionError):
+            del tracked_item["CustomerId"]
+
+    @mock_dynamodb2
+    def test_expected_version_without_version_attribute(self):
+        self.create_table()
+        dynamodb_client: DynamodbClient = DynamodbClient(
+            dynamodb_table="test_table",
+            table_schema={"key_name": "CustomerId", "key_type": str, "car": str},
+        )
+        self.assertEqual(
+            dynamodb_client.update_item(
+                dynamodb_attributes={"CustomerId": "1482328791", "car": "Blue BMW"},
+                expected_version=1,
+            )["statusCode"],
+            400,
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,229 @@
+import boto3
+from moto import mock_dynamodb2
+from unittest import mock
+from dynamagic.dynamodb_client import DynamodbClient
+from dynamagic.modules.client_registry import client_registry
+from dynamagic.modules.dynamodb_api import DynamodbApi
+from dynamagic.modules.exceptions import (
+    ValidationDuplicateTransactionItemError,
+    ValidationMissingKeyError,
+    ValidationMissingVersionError,
+    ValidationTooManyTransactionItemsError,
+)
+from dynamagic.transaction import TransactionBuilder
+import unittest
+
+
+class TestTransaction(unittest.TestCase):
+    def setUp(self):
+        client_registry.clear()
+
+    @staticmethod
+    def generate_schema_template():
+        return {
+            "key_name": "CustomerId",
+            "key_type": str,
+            "name": str,
+            "car": str,
+            "visits": int,
+            "version": int,
+            "version_attribute": "version",
+        }
+
+    @staticmethod
+    @mock_dynamodb2
+    def create_tables():
+        client = boto3.client("dynamodb", region_name="eu-west-2")
+        for table_name, key_name in (
+            ("test_table", "CustomerId"),
+            ("orders_table", "OrderId"),
+        ):
+            client.create_table(
+                TableName=table_name,
+                ProvisionedThroughput={
+                    "ReadCapacityUnits": 140,
+                    "WriteCapacityUnits": 140,
+                },
+                AttributeDefinitions=[
+                    {"AttributeName": key_name, "AttributeType": "S"}
+                ],
+                KeySchema=[{"AttributeName": key_name, "KeyType": "HASH"}],
+                BillingMode="PROVISIONED",
+            )
+            client.get_waiter("table_exists").wait(
+                TableName=table_name, WaiterConfig={"Delay": 2, "MaxAttempts": 5}
+            )
+
+    def create_client(self) -> DynamodbClient:
+        self.create_tables()
+        dynamodb_client: DynamodbClient = DynamodbClient(
+            dynamodb_table="test_table", table_schema=self.generate_schema_template()
+        )
+        for customer_id in ("1482328791", "1482322421"):
+            dynamodb_client.create_item(
+                dynamodb_item={
+                    "CustomerId": customer_id,
+                    "name": "James Joseph",
+                    "car": "Black Skoda",
+                    "visits": 1,
+                }
+            )
+        return dynamodb_client
+
+    @staticmethod
+    def new_item(customer_id):
+        return {
+            "CustomerId": customer_id,
+            "name": "Jim Joseph",
+            "car": "Blue BMW",
+            "visits": 0,
+        }
+
+    @mock_dynamodb2
+    def test_commit_writes_every_item(self):
+        dynamodb_client = self.create_client()
+        orders_client: DynamodbClient = DynamodbClient(
+            dynamodb_table="orders_table",
+            table_schema={"key_name": "OrderId", "key_type": str, "car": str},
+        )
+        transaction = (
+            dynamodb_client.transaction(client_request_token="order-1")
+            .create_item(dynamodb_item=self.new_item("1482329999"))
+            .update_item(
+                dynamodb_attributes={"CustomerId": "1482328791", "version": 1},
+                add_attributes={"visits": 1},
+            )
+            .delete_item(key={"CustomerId": "1482322421"}, expected_version=1)
+            .create_item(
+                dynamodb_item={"OrderId": "A1", "car": "Blue BMW"},
+                dynamodb_client=orders_client,
+            )
+        )
+        self.assertIsInstance(transaction, TransactionBuilder)
+        self.assertEqual(len(transaction), 4)
+        with mock.patch.object(
+            dynamodb_client.client,
+            "transact_write_items",
+            wraps=dynamodb_client.client.transact_write_items,
+        ) as transact_write_items:
+            self.assertEqual(
+                transaction.commit(),
+                {
+                    "statusCode": 200,
+                    "body": "Transaction with 4 items has been written successfully",
+                },
+            )
+        self.assertEqual(
+            transact_write_items.call_args.kwargs["ClientRequestToken"], "order-1"
+        )
+        self.assertEqual(
+            dynamodb_client.fetch_item(key={"CustomerId": "1482329999"})["body"][
+                "version"
+            ],
+            1,
+        )
+        updated_item = dynamodb_client.fetch_item(key={"CustomerId": "1482328791"})[
+            "body"
+        ]
+        self.assertEqual((updated_item["visits"], updated_item["version"]), (2, 2))
+        self.assertEqual(
+            dynamodb_client.fetch_item(key={"CustomerId": "1482322421"})["statusCode"],
+            400,
+        )
+        self.assertEqual(
+            orders_client.fetch_item(key={"OrderId": "A1"})["body"],
+            {"OrderId": "A1", "car": "Blue BMW"},
+        )
+
+    @mock_dynamodb2
+    def test_cancelled_transaction_reports_each_item(self):
+        dynamodb_client = self.create_client()
+        response = (
+            dynamodb_client.transaction()
+            .create_item(dynamodb_item=self.new_item("1482329999"))
+            .update_item(
+                dynamodb_attributes={"CustomerId": "1482328791", "car": "Red Ford"},
+                expected_version=3,
+            )
+            .condition_check(key={"CustomerId": "1482320000"})
+            .commit()
+        )
+        self.assertEqual(response["statusCode"], 400)
+        self.assertEqual(
+            [item_result["body"] for item_result in response["body"]],
+            [
+                "The item was not written because another item in the transaction failed",
+                "The item was changed by another writer or no longer exists, it is no longer at version 3. "
+                "Please fetch the item and try again",
+                "The item you tried to fetch does not exist, please check the key is correct and try again",
+            ],
+        )
+        self.assertEqual(
+            dynamodb_client.fetch_item(key={"CustomerId": "1482329999"})["statusCode"],
+            400,
+        )
+        self.assertEqual(
+            dynamodb_client.fetch_item(key={"CustomerId": "1482328791"})["body"]["car"],
+            "Black Skoda",
+        )
+
+    def test_items_are_validated_when_added(self):
+        dynamodb_client: DynamodbClient = DynamodbClient(
+            dynamodb_table="test_table", table_schema=self.generate_schema_template()
+        )
+        transaction = dynamodb_client.transaction()
+        with self.assertRaises(ValidationMissingKeyError):
+            transaction.delete_item(key={"name": "James Joseph"})
+        with self.assertRaises(ValidationMissingVersionError):
+            transaction.delete_item(key={"CustomerId": "1482328791"})
+        transaction.condition_check(key={"CustomerId": "1482328791"})
+        with self.assertRaises(ValidationDuplicateTransactionItemError):
+            transaction.delete_item(key={"CustomerId": "1482328791"}, expected_version=1)
+        with mock.patch.object(TransactionBuilder, "max_items", 2):
+            transaction.delete_item(key={"CustomerId": "1482322421"}, expected_version=1)
+            with self.assertRaises(ValidationTooManyTransactionItemsError):
+                transaction.delete_item(
+                    key={"CustomerId": "1482320000"}, expected_version=1
+                )
+        self.assertEqual(len(transaction), 2)
+
+    def test_empty_transaction(self):
+        dynamodb_client: DynamodbClient = DynamodbClient(
+            dynamodb_table="test_table", table_schema=self.generate_schema_template()
+        )
+        self.assertEqual(
+            dynamodb_client.transaction().commit(),
+            {"statusCode": 200, "body": "Transaction has no items to write"},
+        )
+
+    def test_cancellation_reasons(self):
+        self.assertEqual(
+            DynamodbApi.cancellation_reasons(
+                mock.Mock(
+                    response={
+                        "CancellationReasons": [
+                            {"Code": "None"},
+                            {"Code": "TransactionConflict", "Message": "conflict"},
+                        ]
+                    }
+                )
+            ),
+            ["None", "TransactionConflict"],
+        )
+        self.assertEqual(
+            DynamodbApi.cancellation_reasons(
+                mock.Mock(
+                    response={
+                        "Error": {
+                            "Message": "Transaction cancelled, please refer cancellation reasons for "
+                            "specific reasons [None, ConditionalCheckFailed]"
+                        }
+                    }
+                )
+            ),
+            ["None", "ConditionalCheckFailed"],
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
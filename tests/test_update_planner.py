@@ -0,0 +1,96 @@
+from typing import Set
+from dynamagic.modules.update_planner import UpdateExpressionPlanner
+from dynamagic.modules.validation import Validation
+from dynamagic.modules.exceptions import (
+    ValidationIncorrectAttributeError,
+    ValidationNoNewAttributesError,
+    ValidationWrongUpdateActionError,
+)
+import unittest
+
+
+class TestUpdateExpressionPlanner(unittest.TestCase):
+    @staticmethod
+    def generate_schema_template():
+        return {
+            "key_name": "CustomerId",
+            "key_type": str,
+            "name": str,
+            "address": str,
+            "age": str,
+            "car": str,
+            "visits": int,
+            "tags": Set[str],
+        }
+
+    def generate_planner(self) -> UpdateExpressionPlanner:
+        return Validation(table_schema=self.generate_schema_template()).update_planner
+
+    def test_plan_set_in_schema_order(self):
+        update_plan = self.generate_planner().plan(set_attributes=["age", "address"])
+        self.assertEqual(update_plan.update_expression, "SET #A = :a, #AG = :ag")
+        self.assertEqual(
+            update_plan.expression_attribute_names, {"#A": "address", "#AG": "age"}
+        )
+        self.assertEqual(update_plan.value_placeholders, {"address": ":a", "age": ":ag"})
+        self.assertEqual(update_plan.confirmed_attributes, {"address", "age"})
+
+    def test_plan_is_memoised(self):
+        update_planner = self.generate_planner()
+        self.assertIs(
+            update_planner.plan(set_attributes=["address", "age"]),
+            update_planner.plan(set_attributes={"age": "42", "address": "Foreign road"}),
+        )
+        self.assertEqual(len(update_planner.plans), 1)
+
+    def test_plan_every_clause(self):
+        update_plan = self.generate_planner().plan(
+            set_attributes=["name", "address"],
+            remove_attributes=["car"],
+            add_attributes=["visits", "tags"],
+            if_not_exists_attributes=["name"],
+        )
+        self.assertEqual(
+            update_plan.update_expression,
+            "SET #N = if_not_exists(#N, :n), #A = :a REMOVE #C ADD #V :v, #T :t",
+        )
+        self.assertEqual(
+            update_plan.expression_attribute_names,
+            {"#N": "name", "#A": "address", "#C": "car", "#V": "visits", "#T": "tags"},
+        )
+        self.assertEqual(update_plan.confirmed_attributes, {"address"})
+        self.assertEqual(
+            update_plan.bind({"address": {"S": "Foreign road"}, "visits": {"N": "1"}}),
+            {":a": {"S": "Foreign road"}, ":v": {"N": "1"}},
+        )
+
+    def test_plan_remove_only(self):
+        update_plan = self.generate_planner().plan(
+            set_attributes=[], remove_attributes=["car", "age"]
+        )
+        self.assertEqual(update_plan.update_expression, "REMOVE #AG, #C")
+        self.assertEqual(update_plan.value_placeholders, {})
+
+    def test_plan_with_wrong_actions(self):
+        update_planner = self.generate_planner()
+        for plan_arguments in (
+            {"set_attributes": ["car"], "remove_attributes": ["car"]},
+            {"set_attributes": [], "remove_attributes": ["CustomerId"]},
+            {"set_attributes": [], "add_attributes": ["address"]},
+            {"set_attributes": ["car"], "if_not_exists_attributes": ["age"]},
+        ):
+            with self.assertRaises(ValidationWrongUpdateActionError):
+                update_planner.plan(**plan_arguments)
+        self.assertEqual(update_planner.plans, {})
+
+    def test_plan_with_wrong_attribute(self):
+        with self.assertRaises(ValidationIncorrectAttributeError):
+            self.generate_planner().plan(set_attributes=["comic"])
+
+    def test_plan_without_attributes(self):
+        with self.assertRaises(ValidationNoNewAttributesError):
+            self.generate_planner().plan(set_attributes=[])
+
+
+if __name__ == "__main__":
+    unittest.main()
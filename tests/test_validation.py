@@ -1,3 +1,5 @@
+from decimal import Decimal
+from typing import Any, List, Set
 from dynamagic.modules.validation import Validation
 from schema import Schema, And, Use, Optional
 from dynamagic.modules.exceptions import (
@@ -7,7 +9,12 @@ from dynamagic.modules.exceptions import (
     ValidationWrongSchemaTypeError,
     ValidationWrongKeyError,
     ValidationMissingKeyError,
+    ValidationIncorrectKeyTypeError,
+    ValidationWrongEngineError,
+    ValidationWrongIndexError,
+    ValidationIncorrectAttributeError,
 )
+from dynamagic.modules.compiled_schema import CompiledSchema
 import unittest
 
 
@@ -39,6 +46,137 @@ class TestValidation(unittest.TestCase):
             ),
         )
 
+    def test_format_schema_with_sort_key_and_indexes(self):
+        validation = Validation(
+            table_schema={
+                "key_name": "CustomerId",
+                "key_type": str,
+                "sort_key_name": "OrderDate",
+                "sort_key_type": str,
+                "indexes": {
+                    "by_car": {"key_name": "car", "sort_key_name": "OrderDate"},
+                    "by_total": {"sort_key_name": "total"},
+                },
+                "car": str,
+                "total": int,
+            }
+        )
+        self.assertEqual(
+            validation.key_template, {"CustomerId": str, "OrderDate": str}
+        )
+        self.assertEqual(
+            validation.schema_template,
+            {"car": str, "total": int, "CustomerId": str, "OrderDate": str},
+        )
+        self.assertEqual(validation.key_attributes(), ("CustomerId", "OrderDate"))
+        self.assertEqual(
+            validation.key_attributes(index_name="by_car"), ("car", "OrderDate")
+        )
+        self.assertEqual(
+            validation.key_attributes(index_name="by_total"), ("CustomerId", "total")
+        )
+        with self.assertRaises(ValidationWrongIndexError):
+            validation.key_attributes(index_name="by_age")
+
+    def test_index_on_unknown_attribute(self):
+        with self.assertRaises(ValidationIncorrectAttributeError):
+            Validation(
+                table_schema={
+                    "key_name": "CustomerId",
+                    "key_type": str,
+                    "indexes": {"by_car": {"key_name": "car"}},
+                }
+            )
+
+    def test_validate_attribute_value(self):
+        validation = Validation(
+            table_schema={"key_name": "CustomerId", "key_type": str, "total": int}
+        )
+        self.assertEqual(validation.validate_attribute_value("total", "32"), 32)
+        with self.assertRaises(ValidationIncorrectKeyTypeError):
+            validation.validate_attribute_value("total", "thirty")
+        with self.assertRaises(ValidationIncorrectAttributeError):
+            validation.validate_attribute_value("age", "32")
+
+    @staticmethod
+    def generate_document_schema_template():
+        return {
+            "key_name": "CustomerId",
+            "key_type": str,
+            "age": int,
+            "price": Decimal,
+            "active": bool,
+            "tags": Set[str],
+            "sizes": List[int],
+            "address": dict,
+            "history": list,
+            "notes": Any,
+        }
+
+    def test_validate_document_round_trip(self):
+        validation = Validation(table_schema=self.generate_document_schema_template())
+        dynamodb_item = {
+            "CustomerId": "1482328791",
+            "age": 32,
+            "price": Decimal("10.25"),
+            "active": False,
+            "tags": {"new"},
+            "sizes": [1, 2],
+            "address": {"street": "Candy land road", "number": 5},
+            "history": [{"car": "Black Skoda"}, None],
+            "notes": None,
+        }
+        db_item = validation.validate_item_to_db_format(dynamodb_item=dynamodb_item)
+        self.assertEqual(
+            db_item,
+            {
+                "CustomerId": {"S": "1482328791"},
+                "age": {"N": "32"},
+                "price": {"N": "10.25"},
+                "active": {"BOOL": False},
+                "tags": {"SS": ["new"]},
+                "sizes": {"NS": ["1", "2"]},
+                "address": {
+                    "M": {"street": {"S": "Candy land road"}, "number": {"N": "5"}}
+                },
+                "history": {"L": [{"M": {"car": {"S": "Black Skoda"}}}, {"NULL": True}]},
+                "notes": {"NULL": True},
+            },
+        )
+        self.assertEqual(
+            validation.validate_item_to_readable_format(dynamodb_item=db_item),
+            dynamodb_item,
+        )
+        with self.assertRaises(ValidationIncorrectKeyTypeError):
+            validation.validate_item_to_db_format(
+                dynamodb_item={**dynamodb_item, "sizes": [1, 1, 2]}
+            )
+
+    def test_validate_items_to_readable_format(self):
+        validation = Validation(table_schema=self.generate_document_schema_template())
+        self.assertEqual(
+            validation.validate_items_to_readable_format(
+                dynamodb_items=[
+                    {"CustomerId": {"S": "1482328791"}, "age": {"N": "32"}},
+                    {"CustomerId": {"S": "1482322421"}, "sizes": {"NS": ["1", "2"]}},
+                ]
+            ),
+            [
+                {"CustomerId": "1482328791", "age": 32},
+                {"CustomerId": "1482322421", "sizes": [1, 2]},
+            ],
+        )
+
+    def test_validate_item_to_db_format_with_bad_value(self):
+        validation = Validation(table_schema=self.generate_document_schema_template())
+        with self.assertRaises(ValidationIncorrectKeyTypeError) as context:
+            validation.validate_item_to_db_format(
+                dynamodb_item={"CustomerId": "1482328791", "tags": set()}
+            )
+        self.assertEqual(context.exception.attributes, ["tags"])
+        with self.assertRaises(ValidationIncorrectAttributeError):
+            validation.validate_item_to_db_format(dynamodb_item={"car": "Black Skoda"})
+
     def test_bad_format_schema(self):
         with self.assertRaises(ValidationWrongKeyError):
             Validation(
@@ -52,7 +190,9 @@ class TestValidation(unittest.TestCase):
             )
 
     def test_generate_new_item_schema(self):
-        validation = Validation(table_schema=self.generate_schema_template())
+        validation = Validation(
+            table_schema=self.generate_schema_template(), engine="schema"
+        )
         self.assertEqual(
             validation.new_item_schema.json_schema("CustomerId"),
             Schema(
@@ -67,14 +207,18 @@ class TestValidation(unittest.TestCase):
         )
 
     def test_generate_key_schema(self):
-        validation = Validation(table_schema=self.generate_schema_template())
+        validation = Validation(
+            table_schema=self.generate_schema_template(), engine="schema"
+        )
         self.assertEqual(
             validation.dynamodb_key_schema.json_schema("CustomerId"),
             Schema({"CustomerId": And(Use(str))}).json_schema("CustomerId"),
         )
 
     def test_generate_update_schema(self):
-        validation = Validation(table_schema=self.generate_schema_template())
+        validation = Validation(
+            table_schema=self.generate_schema_template(), engine="schema"
+        )
         self.assertEqual(
             validation.update_item_schema.json_schema("CustomerId"),
             Schema(
@@ -88,6 +232,47 @@ class TestValidation(unittest.TestCase):
             ).json_schema("CustomerId"),
         )
 
+    def test_compiled_engine_is_default(self):
+        validation = Validation(table_schema=self.generate_schema_template())
+        self.assertIsInstance(validation.new_item_schema, CompiledSchema)
+        self.assertIsInstance(validation.update_item_schema, CompiledSchema)
+        self.assertIsInstance(validation.dynamodb_key_schema, CompiledSchema)
+
+    def test_wrong_engine(self):
+        with self.assertRaises(ValidationWrongEngineError):
+            Validation(table_schema=self.generate_schema_template(), engine="fast")
+
+    def test_engines_raise_the_same_errors(self):
+        compiled_validation = Validation(table_schema=self.generate_schema_template())
+        schema_validation = Validation(
+            table_schema=self.generate_schema_template(), engine="schema"
+        )
+        unvalidated_items = [
+            ("new_item", {"CustomerId": 1, "name": "a", "address": "b", "age": 3}),
+            ("update_item", {"CustomerId": "1482328791", "comics": "Batman"}),
+            ("update_item", {"Test_key": 4828201}),
+            ("read_item", {"CustomerId": "1482328791"}),
+        ]
+        for validation_type, unvalidated_item in unvalidated_items:
+            results = list()
+            for validation in (compiled_validation, schema_validation):
+                try:
+                    results.append(
+                        validation.validate_item_data_entegrity(
+                            dynamodb_schema=validation.validation_schema(
+                                validation_type=validation_type
+                            ),
+                            unvalidated_item=dict(unvalidated_item),
+                        )
+                    )
+                except (
+                    ValidationWrongKeyError,
+                    ValidationMissingKeyError,
+                    ValidationIncorrectKeyTypeError,
+                ) as error:
+                    results.append((type(error), str(error)))
+            self.assertEqual(results[0], results[1])
+
     def test_generate_format_mapper(self):
         validation = Validation(table_schema=self.generate_schema_template())
         self.assertEqual(
@@ -340,6 +525,24 @@ class TestValidation(unittest.TestCase):
             },
         )
 
+    def test_projection(self):
+        validation: Validation = Validation(
+            table_schema=self.generate_schema_template()
+        )
+        projection = validation.projection(attributes=["car", "age", "car"])
+        self.assertEqual(projection.projection_expression, "#C, #AG")
+        self.assertEqual(
+            projection.expression_attribute_names, {"#C": "car", "#AG": "age"}
+        )
+        self.assertEqual(set(projection.codec.decoders), {"car", "age"})
+        self.assertIs(validation.projection(attributes=("car", "age")), projection)
+        self.assertEqual(
+            projection.project({"CustomerId": "1482328791", "car": "Black Skoda"}),
+            {"car": "Black Skoda"},
+        )
+        with self.assertRaises(ValidationIncorrectAttributeError):
+            validation.projection(attributes=["colour"])
+
     def test_validate_new_attributes_exist(self):
         validation: Validation = Validation(
             table_schema=self.generate_schema_template()
@@ -377,6 +580,17 @@ class TestValidation(unittest.TestCase):
             )
         )
 
+    def test_validate_attributes_updated_ignores_set_order(self):
+        validation: Validation = Validation(
+            table_schema=self.generate_schema_template()
+        )
+        self.assertTrue(
+            validation.validate_attributes_updated(
+                response={"Attributes": {"age": {"NS": ["2", "1"]}, "car": {"N": "5.0"}}},
+                validated_new_attributes={"age": {"NS": ["1", "2"]}, "car": {"N": "5"}},
+            )
+        )
+
     def test_validate_attributes_not_updated(self):
         validation: Validation = Validation(
             table_schema=self.generate_schema_template()